@@ -0,0 +1,401 @@
+// Guard: Prevent duplicate listener registration across Streamlit reruns
+if (window._equivisionListenersRegistered) {
+    // Already registered — skip all listener setup
+} else {
+window._equivisionListenersRegistered = true;
+
+// === SCROLL PROGRESS INDICATOR ===
+(function() {
+    const scrollProgress = document.getElementById('scrollProgress');
+    if (!scrollProgress) return;
+
+    function updateScrollProgress() {
+        const scrollTop = window.scrollY || document.documentElement.scrollTop;
+        const scrollHeight = document.documentElement.scrollHeight - window.innerHeight;
+        const progress = scrollHeight > 0 ? (scrollTop / scrollHeight) * 100 : 0;
+        scrollProgress.style.width = progress + '%';
+    }
+
+    window.addEventListener('scroll', updateScrollProgress, { passive: true });
+    updateScrollProgress();
+})();
+
+// === CURSOR GLOW EFFECT ===
+(function() {
+    const cursorGlow = document.getElementById('cursorGlow');
+    if (!cursorGlow) return;
+
+    let mouseX = 0, mouseY = 0;
+    let currentX = 0, currentY = 0;
+
+    document.addEventListener('mousemove', (e) => {
+        mouseX = e.clientX;
+        mouseY = e.clientY;
+    });
+
+    function animateCursor() {
+        currentX += (mouseX - currentX) * 0.1;
+        currentY += (mouseY - currentY) * 0.1;
+        cursorGlow.style.left = currentX + 'px';
+        cursorGlow.style.top = currentY + 'px';
+        requestAnimationFrame(animateCursor);
+    }
+    animateCursor();
+})();
+
+// === 3D TILT EFFECT ON CARDS ===
+(function() {
+    const cards = document.querySelectorAll('[data-testid="stMetric"], .menu-card, .person-card');
+
+    cards.forEach(card => {
+        card.addEventListener('mousemove', (e) => {
+            const rect = card.getBoundingClientRect();
+            const x = e.clientX - rect.left;
+            const y = e.clientY - rect.top;
+
+            const centerX = rect.width / 2;
+            const centerY = rect.height / 2;
+
+            const rotateX = (y - centerY) / 10;
+            const rotateY = (centerX - x) / 10;
+
+            card.style.transform = `perspective(1000px) rotateX(${rotateX}deg) rotateY(${rotateY}deg) scale(1.02)`;
+        });
+
+        card.addEventListener('mouseleave', () => {
+            card.style.transform = 'perspective(1000px) rotateX(0) rotateY(0) scale(1)';
+        });
+    });
+})();
+
+// === MAGNETIC BUTTON EFFECT ===
+(function() {
+    const buttons = document.querySelectorAll('[data-testid="stButton"] button');
+
+    buttons.forEach(btn => {
+        btn.addEventListener('mousemove', (e) => {
+            const rect = btn.getBoundingClientRect();
+            const x = e.clientX - rect.left - rect.width / 2;
+            const y = e.clientY - rect.top - rect.height / 2;
+
+            btn.style.transform = `translate(${x * 0.1}px, ${y * 0.1}px)`;
+        });
+
+        btn.addEventListener('mouseleave', () => {
+            btn.style.transform = 'translate(0, 0)';
+        });
+    });
+})();
+
+// === PARALLAX SCROLL EFFECT ===
+(function() {
+    window.addEventListener('scroll', () => {
+        const scrollY = window.scrollY;
+        document.documentElement.style.setProperty('--scroll-y', scrollY + 'px');
+    }, { passive: true });
+})();
+
+// === ANIMATED COUNTER NUMBERS ===
+(function() {
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                const metric = entry.target.querySelector('[data-testid="stMetricValue"]');
+                if (metric) {
+                    metric.classList.add('counter-animate');
+                }
+            }
+        });
+    }, { threshold: 0.5 });
+
+    document.querySelectorAll('[data-testid="stMetric"]').forEach(el => observer.observe(el));
+})();
+
+// === SUCCESS CONFETTI EFFECT ===
+window.triggerConfetti = function() {
+    const colors = ['#7C5CFC', '#34D399', '#F59E0B', '#F43F5E', '#38BDF8'];
+    for (let i = 0; i < 50; i++) {
+        const confetti = document.createElement('div');
+        confetti.className = 'confetti-particle';
+        confetti.style.left = Math.random() * 100 + 'vw';
+        confetti.style.bottom = '-20px';
+        confetti.style.background = colors[Math.floor(Math.random() * colors.length)];
+        confetti.style.animationDuration = (2 + Math.random() * 2) + 's';
+        confetti.style.animationDelay = Math.random() * 0.5 + 's';
+        document.body.appendChild(confetti);
+        setTimeout(() => confetti.remove(), 4000);
+    }
+};
+
+// === 3D CARD TILT EFFECT ===
+(function() {
+    if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
+
+    const tiltCards = document.querySelectorAll('[data-testid="stMetric"], [data-testid="stExpander"]');
+
+    tiltCards.forEach(card => {
+        card.addEventListener('mousemove', (e) => {
+            const rect = card.getBoundingClientRect();
+            const x = (e.clientX - rect.left) / rect.width;
+            const y = (e.clientY - rect.top) / rect.height;
+
+            const tiltX = (y - 0.5) * -8;
+            const tiltY = (x - 0.5) * 8;
+
+            card.style.transform = `perspective(800px) rotateX(${tiltX}deg) rotateY(${tiltY}deg) translate3d(0, -3px, 0)`;
+            card.style.transition = 'transform 0.1s ease';
+        });
+
+        card.addEventListener('mouseleave', () => {
+            card.style.transform = 'perspective(800px) rotateX(0deg) rotateY(0deg) translate3d(0, 0, 0)';
+            card.style.transition = 'transform 0.4s cubic-bezier(0.16, 1, 0.3, 1)';
+        });
+    });
+})();
+
+// === STAGGERED SCROLL REVEAL ===
+(function() {
+    if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
+
+    const revealObserver = new IntersectionObserver((entries) => {
+        entries.forEach((entry, idx) => {
+            if (entry.isIntersecting) {
+                const el = entry.target;
+                const delay = idx * 60;
+                el.style.transition = `opacity 0.5s cubic-bezier(0.16, 1, 0.3, 1) ${delay}ms, transform 0.5s cubic-bezier(0.16, 1, 0.3, 1) ${delay}ms`;
+                el.style.opacity = '1';
+                el.style.transform = 'translate3d(0, 0, 0) scale(1)';
+                revealObserver.unobserve(el);
+            }
+        });
+    }, { threshold: 0.1, rootMargin: '0px 0px -40px 0px' });
+
+    // Observe cards, expanders, dataframes, forms
+    const revealTargets = document.querySelectorAll(
+        '.menu-card, .person-card, .event-list-card, div.stDataFrame, div[data-testid="stForm"]'
+    );
+
+    revealTargets.forEach(el => {
+        el.style.opacity = '0';
+        el.style.transform = 'translate3d(0, 20px, 0) scale(0.98)';
+        revealObserver.observe(el);
+    });
+})();
+
+// === RIPPLE CLICK EFFECT ===
+(function() {
+    document.addEventListener('click', (e) => {
+        const btn = e.target.closest('[data-testid="stButton"] button, .stDownloadButton button');
+        if (!btn) return;
+
+        const ripple = document.createElement('span');
+        const rect = btn.getBoundingClientRect();
+        const size = Math.max(rect.width, rect.height);
+
+        ripple.style.cssText = `
+            position: absolute;
+            width: ${size}px;
+            height: ${size}px;
+            left: ${e.clientX - rect.left - size / 2}px;
+            top: ${e.clientY - rect.top - size / 2}px;
+            background: radial-gradient(circle, rgba(255,255,255,0.3) 0%, transparent 60%);
+            border-radius: 50%;
+            transform: scale(0);
+            animation: rippleExpand 0.6s ease-out forwards;
+            pointer-events: none;
+            z-index: 1;
+        `;
+
+        btn.style.position = 'relative';
+        btn.style.overflow = 'hidden';
+        btn.appendChild(ripple);
+        setTimeout(() => ripple.remove(), 700);
+    });
+
+    // Inject ripple keyframe
+    if (!document.querySelector('#ripple-style')) {
+        const style = document.createElement('style');
+        style.id = 'ripple-style';
+        style.textContent = `
+            @keyframes rippleExpand {
+                to { transform: scale(2.5); opacity: 0; }
+            }
+        `;
+        document.head.appendChild(style);
+    }
+})();
+
+// === LIGHTNING CUBE PERFORMANCE ADAPTER ===
+(function() {
+    if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
+
+    const cubeLayer = document.getElementById('lightningCubeLayer');
+    if (!cubeLayer) return;
+
+    // Performance detection — disable cubes on low FPS
+    let frameCount = 0;
+    let lastTime = performance.now();
+    let lowFpsCount = 0;
+
+    function checkPerformance() {
+        frameCount++;
+        const now = performance.now();
+        if (now - lastTime >= 1000) {
+            const fps = frameCount;
+            frameCount = 0;
+            lastTime = now;
+
+            if (fps < 30) {
+                lowFpsCount++;
+                if (lowFpsCount >= 3) {
+                    // Degrade gracefully — hide cubes
+                    cubeLayer.style.display = 'none';
+                    return; // Stop monitoring
+                }
+            } else {
+                lowFpsCount = Math.max(0, lowFpsCount - 1);
+            }
+        }
+        requestAnimationFrame(checkPerformance);
+    }
+    requestAnimationFrame(checkPerformance);
+
+    // Subtle parallax movement on cubes based on mouse
+    let cubeMouseX = 0, cubeMouseY = 0;
+    document.addEventListener('mousemove', (e) => {
+        cubeMouseX = (e.clientX / window.innerWidth - 0.5) * 2;
+        cubeMouseY = (e.clientY / window.innerHeight - 0.5) * 2;
+    }, { passive: true });
+
+    const cubes = cubeLayer.querySelectorAll('.lightning-cube-wrapper');
+    function animateCubeParallax() {
+        cubes.forEach((cube, i) => {
+            const factor = (i + 1) * 3;
+            const tx = cubeMouseX * factor;
+            const ty = cubeMouseY * factor;
+            cube.style.marginLeft = tx + 'px';
+            cube.style.marginTop = ty + 'px';
+        });
+        requestAnimationFrame(animateCubeParallax);
+    }
+    animateCubeParallax();
+})();
+
+// === SMOOTH SECTION TRANSITIONS ON SCROLL ===
+(function() {
+    if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
+
+    const sectionObserver = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translate3d(0, 0, 0)';
+                entry.target.style.filter = 'blur(0)';
+                sectionObserver.unobserve(entry.target);
+            }
+        });
+    }, { threshold: 0.05, rootMargin: '0px 0px -60px 0px' });
+
+    // Observe major content sections
+    const sections = document.querySelectorAll(
+        '.welcome-banner, [data-testid="stForm"], .seat-grid-container, .stDataFrame'
+    );
+    sections.forEach(el => {
+        el.style.opacity = '0';
+        el.style.transform = 'translate3d(0, 25px, 0)';
+        el.style.filter = 'blur(3px)';
+        el.style.transition = 'opacity 0.6s cubic-bezier(0.16, 1, 0.3, 1), transform 0.6s cubic-bezier(0.16, 1, 0.3, 1), filter 0.6s ease';
+        sectionObserver.observe(el);
+    });
+})();
+
+// === ENHANCED MAGNETIC HOVER FOR MENU CARDS ===
+(function() {
+    if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
+
+    document.querySelectorAll('.menu-card').forEach(card => {
+        card.addEventListener('mousemove', (e) => {
+            const rect = card.getBoundingClientRect();
+            const x = ((e.clientX - rect.left) / rect.width) * 100;
+            const y = ((e.clientY - rect.top) / rect.height) * 100;
+            card.style.setProperty('--mouse-x', x + '%');
+            card.style.setProperty('--mouse-y', y + '%');
+        });
+    });
+})();
+
+// === SOFT GLOW ON METRIC HOVER ===
+(function() {
+    document.querySelectorAll('[data-testid="stMetric"]').forEach(metric => {
+        metric.addEventListener('mouseenter', function() {
+            this.style.transition = 'all 0.4s cubic-bezier(0.34, 1.56, 0.64, 1)';
+            this.style.transform = 'translateY(-5px) scale(1.03)';
+            this.style.boxShadow = '0 12px 35px rgba(124, 92, 252, 0.15), 0 0 20px rgba(124, 92, 252, 0.08)';
+        });
+        metric.addEventListener('mouseleave', function() {
+            this.style.transform = '';
+            this.style.boxShadow = '';
+        });
+    });
+})();
+
+// === INTERACTIVE FOCUS RING WITH GLOW ===
+(function() {
+    document.addEventListener('focusin', (e) => {
+        const input = e.target;
+        if (input.tagName === 'INPUT' || input.tagName === 'TEXTAREA') {
+            input.style.transition = 'all 0.3s cubic-bezier(0.16, 1, 0.3, 1)';
+        }
+    });
+})();
+
+// === SMOOTH PAGE TRANSITION FADE ===
+(function() {
+    // Fade in main content on load
+    const mainContent = document.querySelector('[data-testid="stAppViewContainer"]');
+    if (mainContent) {
+        mainContent.style.opacity = '0';
+        mainContent.style.transition = 'opacity 0.5s cubic-bezier(0.16, 1, 0.3, 1)';
+        requestAnimationFrame(() => {
+            requestAnimationFrame(() => {
+                mainContent.style.opacity = '1';
+            });
+        });
+    }
+})();
+
+// === TOOLTIP ENHANCEMENT ===
+(function() {
+    const tooltipStyle = document.createElement('style');
+    tooltipStyle.id = 'elite-tooltips';
+    if (!document.querySelector('#elite-tooltips')) {
+        tooltipStyle.textContent = `
+            .seat-cell[title]:hover::after {
+                content: attr(title);
+                position: absolute;
+                bottom: calc(100% + 8px);
+                left: 50%;
+                transform: translateX(-50%) translateY(5px);
+                padding: 6px 12px;
+                background: rgba(15, 15, 30, 0.95);
+                color: #fff;
+                font-size: 0.75rem;
+                border-radius: 8px;
+                white-space: nowrap;
+                z-index: 1000;
+                pointer-events: none;
+                border: 1px solid rgba(124, 92, 252, 0.2);
+                box-shadow: 0 8px 25px rgba(0, 0, 0, 0.4);
+                animation: tooltipFade 0.2s ease-out;
+            }
+            @keyframes tooltipFade {
+                from { opacity: 0; transform: translateX(-50%) translateY(10px); }
+                to { opacity: 1; transform: translateX(-50%) translateY(5px); }
+            }
+            .seat-cell { position: relative; }
+        `;
+        document.head.appendChild(tooltipStyle);
+    }
+})();
+
+} // end guard
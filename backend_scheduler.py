@@ -0,0 +1,126 @@
+"""Adaptive ordering of face-detector backends.
+
+FaceEngine used to try the requested backend and then a fixed fallback chain
+on every frame. BackendScheduler records, per backend and per context (event
+id, camera, ...), how often a backend found faces and how long it took, and
+plans each frame's attempts from that history:
+
+* the caller's preferred backend is always tried first, so an explicit
+  choice (e.g. ``ssd`` for group photos) is never overridden by a cheaper
+  backend that other callers in the same context happen to use;
+* the fallbacks behind it are tried in order of expected cost (latency /
+  success rate), so one that keeps failing under the current lighting drops
+  back;
+* fallbacks that have failed nearly every time are skipped, except on every
+  ``probe_every``-th frame so they can earn their place back.
+"""
+import threading
+from typing import Dict, List, Optional
+
+DEFAULT_FALLBACKS = ('opencv', 'ssd', 'retinaface')
+
+# Rough per-frame cost (seconds) before any observation, fastest first
+PRIOR_LATENCY = {'opencv': 0.05, 'ssd': 0.08, 'mtcnn': 0.4, 'retinaface': 0.6}
+
+
+class BackendStats:
+    __slots__ = ('attempts', 'successes', 'total_seconds', 'ema_seconds')
+
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.total_seconds = 0.0
+        self.ema_seconds = None
+
+    def record(self, success, seconds, alpha):
+        self.attempts += 1
+        self.successes += int(bool(success))
+        self.total_seconds += seconds
+        self.ema_seconds = seconds if self.ema_seconds is None else alpha * seconds + (1 - alpha) * self.ema_seconds
+
+    @property
+    def success_rate(self):
+        # Laplace-smoothed so one early miss does not sink a backend
+        return (self.successes + 1) / (self.attempts + 2)
+
+    def as_dict(self):
+        return {
+            'attempts': self.attempts,
+            'successes': self.successes,
+            'success_rate': round(self.successes / self.attempts, 4) if self.attempts else None,
+            'avg_seconds': round(self.total_seconds / self.attempts, 4) if self.attempts else None,
+            'ema_seconds': round(self.ema_seconds, 4) if self.ema_seconds is not None else None,
+        }
+
+
+class BackendScheduler:
+    def __init__(self, fallbacks=DEFAULT_FALLBACKS, max_attempts=3, min_trials=5,
+                 skip_below=0.05, ema_alpha=0.2, probe_every=20):
+        self.fallbacks = tuple(fallbacks)
+        self.max_attempts = max_attempts
+        self.min_trials = min_trials
+        self.skip_below = skip_below
+        self.ema_alpha = ema_alpha
+        self.probe_every = probe_every
+        self._plans: Dict[Optional[str], int] = {}
+        # context -> backend -> stats; context None holds the global totals
+        self._stats: Dict[Optional[str], Dict[str, BackendStats]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, context, backend) -> Optional[BackendStats]:
+        return self._stats.get(context, {}).get(backend)
+
+    def _observed(self, context, backend) -> Optional[BackendStats]:
+        """Context stats once they are meaningful, else the global ones."""
+        stats = self._get(context, backend)
+        if stats is not None and stats.attempts >= self.min_trials:
+            return stats
+        stats = self._get(None, backend)
+        if stats is not None and stats.attempts >= self.min_trials:
+            return stats
+        return None
+
+    def _expected_cost(self, context, backend):
+        stats = self._observed(context, backend)
+        latency = PRIOR_LATENCY.get(backend, 0.3)
+        if stats is None:
+            return latency / 0.5
+        if stats.ema_seconds is not None:
+            latency = stats.ema_seconds
+        return latency / stats.success_rate
+
+    def plan(self, preferred, context=None) -> List[str]:
+        """Backends to try for one frame, best first (at most ``max_attempts``)."""
+        fallbacks = [b for b in self.fallbacks if b != preferred]
+        with self._lock:
+            self._plans[context] = self._plans.get(context, 0) + 1
+            probing = self.probe_every > 0 and self._plans[context] % self.probe_every == 0
+            usable = []
+            for backend in fallbacks:
+                stats = self._observed(context, backend)
+                if not probing and stats is not None and stats.successes / stats.attempts < self.skip_below:
+                    continue
+                usable.append(backend)
+            usable.sort(key=lambda b: self._expected_cost(context, b))
+        return ([preferred] + usable)[:self.max_attempts]
+
+    def record(self, backend, success, seconds, context=None):
+        """Log one attempt under ``context`` and in the global totals."""
+        with self._lock:
+            for ctx in {context, None}:
+                per_ctx = self._stats.setdefault(ctx, {})
+                per_ctx.setdefault(backend, BackendStats()).record(success, seconds, self.ema_alpha)
+
+    def stats(self, context=None) -> Dict[str, dict]:
+        """Per-backend attempts, success rate and latency for ``context`` (None = all)."""
+        with self._lock:
+            return {backend: s.as_dict() for backend, s in self._stats.get(context, {}).items()}
+
+    def contexts(self) -> List[str]:
+        with self._lock:
+            return [ctx for ctx in self._stats if ctx is not None]
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self._plans = {}
@@ -0,0 +1,106 @@
+"""Pipelined batch registration.
+
+Batch upload used to decode, run inference and register one file at a time.
+Here the two halves are split:
+
+1. Inference (decode, detection, embedding, gender) runs concurrently: on
+   FaceEngine's worker processes when they are running, otherwise on a
+   thread pool (threads overlap decoding; the shared models run one call
+   at a time). At most ``window`` images are in flight.
+2. Registration (duplicate check, ``P{n}`` numbering, seat allocation,
+   db.add_attendee) consumes results strictly in upload order, one image at
+   a time, so labels and seats come out exactly as in the sequential loop.
+
+With ``skip_gender`` every face comes back as "Unknown", which has no slot in
+the gender pattern, so those attendees get the first free seat instead.
+"""
+from datetime import datetime
+
+import db
+from utils import SeatingManager
+
+
+class BatchRegistrar:
+    """The sequential half: registers the faces found in one image at a time."""
+
+    def __init__(self, engine, evt, event_id, seat_mgr=None, any_seat=False):
+        self.engine = engine
+        self.evt = evt
+        self.event_id = event_id
+        # Seat without the gender pattern (no gender was classified)
+        self.any_seat = any_seat
+        self.total_seats = evt['hall_rows'] * evt['hall_cols']
+        self.seat_mgr = seat_mgr or SeatingManager(evt['hall_rows'], evt['hall_cols'],
+                                                   cluster_size=evt.get('cluster_size', 1))
+
+    def register(self, source, faces):
+        """Register the faces of one image.
+
+        Returns {'source', 'registered': [records], 'duplicates': [names], 'hall_full': bool}.
+        """
+        outcome = {'source': source, 'registered': [], 'duplicates': [], 'hall_full': False}
+        is_multi = len(faces) > 1
+
+        for f_idx, face in enumerate(faces):
+            # Only faces already registered in THIS event count as repeats
+            match = self.engine.find_duplicate(face['encoding'], event_id=self.event_id)
+            if match is not None:
+                outcome['duplicates'].append(match[0]['name'])
+                continue
+
+            if len(self.evt['data']) >= self.total_seats:
+                outcome['hall_full'] = True
+                break
+
+            gender = face['gender']
+            # len + 1 keeps numbering sequential over what is actually stored,
+            # so skipped duplicates do not leave gaps
+            next_sl = len(self.evt['data']) + 1
+            if is_multi:
+                p_label = f"P{next_sl}-{f_idx+1}{gender[0].upper()}"
+            else:
+                p_label = f"P{next_sl}"
+
+            record = {
+                "sl_no": next_sl,
+                "gender": gender,
+                "seat": (self.seat_mgr.allocate_any_seat(self.evt['data']) if self.any_seat
+                         else self.seat_mgr.allocate_seat(self.evt['data'], gender)),
+                "name": p_label,
+                "id": "Batch_Upload",
+                "branch": "N/A",
+                "age": 0,
+                "encoding": face['encoding'],
+                "timestamp": str(datetime.now())
+            }
+            self.evt['data'].append(record)
+            db.add_attendee(self.event_id, record)
+            self.engine.add_known_face(face['encoding'], {'name': p_label, 'event_id': self.event_id})
+            outcome['registered'].append(record)
+
+        return outcome
+
+
+def run_batch(engine, evt, event_id, items, detector_backend='ssd', skip_gender=False,
+              workers=None, window=None, seat_mgr=None):
+    """Infer concurrently, register in order. Yields one outcome dict per image.
+
+    Each outcome is BatchRegistrar.register()'s dict plus 'error' (exception
+    or None). Iteration stops after the image on which the hall filled up.
+    """
+    registrar = BatchRegistrar(engine, evt, event_id, seat_mgr=seat_mgr, any_seat=skip_gender)
+    results = engine.iter_process(items, detector_backend=detector_backend, skip_gender=skip_gender,
+                                  context=event_id, workers=workers, window=window)
+    try:
+        for source, faces, error in results:
+            if error is not None:
+                outcome = {'source': source, 'registered': [], 'duplicates': [], 'hall_full': False}
+            else:
+                outcome = registrar.register(source, faces)
+            outcome['error'] = error
+            outcome['faces'] = len(faces)
+            yield outcome
+            if outcome['hall_full']:
+                break
+    finally:
+        results.close()
@@ -0,0 +1,290 @@
+"""Reproducible FaceEngine benchmark: process_image latency across the hot-path parameters.
+
+Runs FaceEngine.process_image over the cross product of
+
+- detector backends (``--backends``; each case times exactly that backend,
+  without the fallback chain, so results do not depend on learned statistics)
+- image sizes (``--sizes``, longest side of a 4:3 image)
+- faces per image (``--faces``)
+- known-index sizes (``--index-sizes``; random Facenet512-sized embeddings,
+  so every face searches the whole index and none is a duplicate)
+- gender classification on and off
+
+Synthetic images tile face crops from ``--fixtures`` (a directory or
+archive of real photos) on a seeded noise background; without fixtures,
+faces are drawn with OpenCV, which real detectors may not find, so only
+the decode/detect path is measured (``faces_found`` shows this). Every
+fixture image is also benchmarked as-is.
+
+Each case runs once untimed, then ``--repeat`` times. Results record
+wall-clock median/p95 and the mean of each engine stage (from
+FaceEngine.metrics), plus the environment, as JSON (and optionally CSV).
+``--compare`` checks the run against an earlier JSON and exits 1 when a
+case's median regressed by more than ``--tolerance``.
+
+    python bench_engine.py --fixtures photos/ --json bench.json
+    python bench_engine.py --fixtures photos/ --sizes 720 --faces 1 --index-sizes 1 10000 --repeat 3
+    python bench_engine.py --fixtures photos/ --compare bench.json --tolerance 0.2
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from backend_scheduler import BackendScheduler
+
+DIM = 512  # Facenet512
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def environment(args, engine):
+    """What the numbers depend on, so runs from different machines are not compared blindly."""
+    from face_engine import DEEPFACE_IMPORT_SECONDS
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    deepface = sys.modules.get("deepface")
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "deepface": getattr(deepface, "__version__", None),
+        "model": engine.model_name,
+        "inference_backend": engine.inference_backend,
+        "index_type": engine.index_type,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "deepface_import_s": DEEPFACE_IMPORT_SECONDS,
+        "warmup_s": engine.warmup_report,
+    }
+
+
+# ---------------- Images ----------------
+
+def fixture_images(source, limit):
+    """[(name, full-resolution PIL image)] from a directory or archive."""
+    from face_engine import open_image
+    from ingest import iter_image_sources
+
+    images = []
+    for name, data in iter_image_sources(source):
+        images.append((os.path.basename(name), open_image(data).convert("RGB")))
+        if len(images) >= limit:
+            break
+    return images
+
+
+def face_tiles(engine, fixtures, backend, limit=16):
+    """Face crops (with some margin) cut from the fixtures, as PIL images."""
+    tiles = []
+    for _, image in fixtures:
+        frame = engine.detect_stages(image, backend)
+        for top, right, bottom, left in (face["bbox"] for face in frame.faces):
+            pad = (bottom - top) // 3
+            tiles.append(image.crop((max(0, left - pad), max(0, top - pad),
+                                     min(image.width, right + pad), min(image.height, bottom + pad))))
+            if len(tiles) >= limit:
+                return tiles
+    return tiles
+
+
+def drawn_face(size, rng):
+    """A cartoon face; stands in when no fixtures are given (detectors may ignore it)."""
+    img = np.full((size, size, 3), 235, dtype=np.uint8)
+    skin = tuple(int(c) for c in rng.integers(120, 220, size=3))
+    c, r = size // 2, size // 2
+    cv2.ellipse(img, (c, c), (int(r * 0.7), int(r * 0.9)), 0, 0, 360, skin, -1)
+    for dx in (-0.3, 0.3):
+        cv2.circle(img, (int(c + dx * r), int(c - 0.2 * r)), max(2, size // 16), (40, 40, 40), -1)
+    cv2.line(img, (c, int(c - 0.05 * r)), (c, int(c + 0.2 * r)), (90, 70, 60), max(1, size // 40))
+    cv2.ellipse(img, (c, int(c + 0.45 * r)), (int(0.3 * r), int(0.12 * r)), 0, 0, 180, (60, 30, 30),
+                max(1, size // 30))
+    return Image.fromarray(img)
+
+
+def compose(width, faces, tiles, rng):
+    """A 4:3 image ``width`` wide with ``faces`` tiles on a grid over seeded noise."""
+    height = width * 3 // 4
+    background = rng.integers(90, 160, size=(height, width, 3), dtype=np.uint8)
+    canvas = Image.fromarray(cv2.GaussianBlur(background, (0, 0), 3))
+    cols = math.ceil(math.sqrt(faces))
+    rows = math.ceil(faces / cols)
+    cell_w, cell_h = width // cols, height // rows
+    for i in range(faces):
+        tile = tiles[i % len(tiles)] if tiles else drawn_face(min(cell_w, cell_h), rng)
+        scale = 0.8 * min(cell_w / tile.width, cell_h / tile.height)
+        tile = tile.resize((max(1, int(tile.width * scale)), max(1, int(tile.height * scale))), Image.BILINEAR)
+        x = (i % cols) * cell_w + (cell_w - tile.width) // 2
+        y = (i // cols) * cell_h + (cell_h - tile.height) // 2
+        canvas.paste(tile, (x, y))
+    return canvas
+
+
+# ---------------- Cases ----------------
+
+def grow_index(engine, size, rng):
+    """Add random embeddings until the engine's index holds ``size``. Returns seconds spent."""
+    start = time.perf_counter()
+    missing = size - len(engine.known_meta)
+    if missing > 0:
+        vectors = rng.standard_normal((missing, DIM)).astype(np.float32)
+        for vector in vectors:
+            engine.add_known_face(vector, {"event_id": "bench", "name": f"known-{len(engine.known_meta)}"})
+    return time.perf_counter() - start
+
+
+def stage_means_ms(engine):
+    """Mean milliseconds per stage recorded in engine.metrics since the last reset."""
+    series = engine.metrics.snapshot().get("faceengine_stage_seconds", {})
+    return {dict(labels)["stage"]: round(h.sum / h.count * 1000, 3) for labels, h in series.items() if h.count}
+
+
+def run_case(engine, image, backend, skip_gender, repeat, context):
+    engine.process_image(image, backend, skip_gender, context)  # untimed: first-call and cache effects
+    engine.metrics.reset()
+    runs, faces = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = engine.process_image(image, backend, skip_gender, context)
+        runs.append((time.perf_counter() - start) * 1000)
+        faces.append(len(result))
+    runs.sort()
+    return {
+        "faces_found": statistics.median(faces),
+        "median_ms": round(statistics.median(runs), 3),
+        "p95_ms": round(runs[min(len(runs) - 1, math.ceil(0.95 * len(runs)) - 1)], 3),
+        "min_ms": round(runs[0], 3),
+        "stages_ms": stage_means_ms(engine),
+    }
+
+
+def run_suite(args):
+    from face_engine import FaceEngine, load_deepface
+
+    if load_deepface() is None:
+        raise SystemExit("DeepFace is not installed; nothing to benchmark")
+    index_rng = np.random.default_rng(args.seed)
+    # Duplicate checks here search every event, so keep the global shard
+    engine = FaceEngine(index_type=args.index, global_index=True, inference_backend=args.inference)
+    # One attempt per image: a case measures its own backend, not whatever the fallbacks learned
+    engine.scheduler = BackendScheduler(fallbacks=(), max_attempts=1)
+    engine.warmup(detector_backends=tuple(args.backends))
+
+    fixtures = fixture_images(args.fixtures, args.max_fixtures) if args.fixtures else []
+    tiles = face_tiles(engine, fixtures, args.backends[0]) if fixtures else []
+    if args.fixtures and not tiles:
+        print(f"No faces found in {args.fixtures}; using drawn faces", file=sys.stderr)
+    # Each image has its own seed, so adding a size or face count leaves the others unchanged
+    images = [(f"synthetic-{size}px-{faces}f",
+               compose(size, faces, tiles, np.random.default_rng([args.seed, size, faces])), faces)
+              for size in args.sizes for faces in args.faces]
+    images += [(f"fixture-{name}", image, None) for name, image in fixtures]
+
+    results = []
+    index_load_s = {}
+    for index_size in sorted(args.index_sizes):
+        index_load_s[index_size] = round(grow_index(engine, index_size, index_rng), 3)
+        for label, image, faces in images:
+            for backend in args.backends:
+                for skip_gender in args.skip_gender:
+                    case = f"{label}/{backend}/idx{index_size}/{'nogender' if skip_gender else 'gender'}"
+                    row = {"case": case, "image": label, "width": image.width, "height": image.height,
+                           "faces_requested": faces, "backend": backend, "index_size": index_size,
+                           "skip_gender": skip_gender}
+                    row.update(run_case(engine, image, backend, skip_gender, args.repeat, context=case))
+                    results.append(row)
+                    print(f"{case:<58} {row['median_ms']:>9.1f} ms  p95 {row['p95_ms']:>9.1f}  "
+                          f"faces {row['faces_found']:g}", flush=True)
+
+    env = environment(args, engine)
+    env["index_load_s"] = index_load_s
+    return {"environment": env, "results": results}
+
+
+def compare(report, baseline, tolerance):
+    """Cases whose median got slower than ``baseline`` by more than ``tolerance`` (a fraction)."""
+    before = {row["case"]: row for row in baseline["results"]}
+    regressions = []
+    for row in report["results"]:
+        old = before.get(row["case"])
+        if old is None or not old["median_ms"]:
+            continue
+        change = row["median_ms"] / old["median_ms"] - 1
+        if change > tolerance:
+            regressions.append({"case": row["case"], "baseline_ms": old["median_ms"],
+                                "median_ms": row["median_ms"], "change": round(change, 4)})
+    return regressions
+
+
+def write_csv(path, results):
+    stages = sorted({stage for row in results for stage in row["stages_ms"]})
+    fields = ([k for k in results[0] if k != "stages_ms"] + [f"{s}_ms" for s in stages]) if results else []
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for row in results:
+            flat = {k: v for k, v in row.items() if k != "stages_ms"}
+            flat.update({f"{s}_ms": row["stages_ms"].get(s) for s in stages})
+            writer.writerow(flat)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", default=None, help="directory, .zip or .tar(.gz) of real photos")
+    parser.add_argument("--max-fixtures", type=int, default=5, help="fixture images to use (default: 5)")
+    parser.add_argument("--backends", nargs="+", default=["opencv", "ssd"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[480, 1280, 3000])
+    parser.add_argument("--faces", type=int, nargs="+", default=[1, 4, 12])
+    parser.add_argument("--index-sizes", type=int, nargs="+", default=[1, 1000, 10000, 100000])
+    parser.add_argument("--gender", choices=("both", "on", "off"), default="both",
+                        help="run with gender classification, without it, or both (default)")
+    parser.add_argument("--index", default="exact", choices=("exact", "ivf"), help="duplicate index type")
+    parser.add_argument("--inference", default="keras", choices=("keras", "onnx", "onnx-int8"))
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case (default: 5)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=None, help="write the report to this JSON file")
+    parser.add_argument("--csv", default=None, help="also write one row per case to this CSV file")
+    parser.add_argument("--compare", default=None, metavar="BASELINE", help="earlier --json report to check against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed median slowdown for --compare, as a fraction (default: 0.25)")
+    args = parser.parse_args(argv)
+    args.skip_gender = {"both": (False, True), "on": (False,), "off": (True,)}[args.gender]
+
+    report = run_suite(args)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.csv:
+        write_csv(args.csv, report["results"])
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['case']}: {r['baseline_ms']:.1f} -> {r['median_ms']:.1f} ms "
+                  f"({r['change']:+.0%})", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No case slower than baseline by more than {args.tolerance:.0%}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
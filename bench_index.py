@@ -0,0 +1,67 @@
+"""Benchmark duplicate-lookup latency vs. index size.
+
+Compares the old per-query path (re-stack the list and recompute every norm)
+with the pre-normalised ExactIndex and the approximate IVFIndex.
+
+    python bench_index.py
+    python bench_index.py --sizes 1000 10000 --queries 200
+"""
+import argparse
+import time
+
+import numpy as np
+
+from embedding_index import make_index
+
+DIM = 512  # Facenet512
+
+
+def legacy_lookup(known_encodings, query):
+    """The lookup FaceEngine.process_image used before the index existed."""
+    known_matrix = np.array(known_encodings)
+    known_norms = np.linalg.norm(known_matrix, axis=1)
+    sims = np.dot(known_matrix, query) / (known_norms * np.linalg.norm(query))
+    best = int(np.argmax(sims))
+    return best, float(sims[best])
+
+
+def time_per_query(fn, queries):
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - start) / len(queries) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'size':>8} {'legacy ms':>10} {'exact ms':>10} {'ivf ms':>10} {'ivf recall@1':>13}")
+
+    for size in args.sizes:
+        data = rng.standard_normal((size, DIM)).astype(np.float32)
+        # Queries are noisy copies of stored faces, like a re-registration attempt
+        picks = rng.integers(size, size=args.queries)
+        queries = data[picks] + 0.3 * rng.standard_normal((args.queries, DIM)).astype(np.float32)
+
+        legacy = [np.array(v, dtype=np.float64) for v in data]
+        exact = make_index("exact")
+        ivf = make_index("ivf", train_size=min(1024, size))
+        for key, vec in enumerate(data):
+            exact.add(key, vec)
+            ivf.add(key, vec)
+
+        legacy_ms = time_per_query(lambda q: legacy_lookup(legacy, q), queries)
+        exact_ms = time_per_query(lambda q: exact.search(q), queries)
+        ivf_ms = time_per_query(lambda q: ivf.search(q), queries)
+
+        hits = sum(1 for q, want in zip(queries, picks) if ivf.search(q)[0][0] == want)
+        print(f"{size:>8} {legacy_ms:>10.3f} {exact_ms:>10.3f} {ivf_ms:>10.3f} {hits / args.queries:>13.2%}")
+
+
+if __name__ == "__main__":
+    main()
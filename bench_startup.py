@@ -0,0 +1,79 @@
+"""Startup-time benchmark: what a fresh process pays before the login page renders.
+
+Every measurement runs in a new Python process (imports are cached per
+process), ``--repeat`` times, and reports the median:
+
+- ``import_face_engine``: importing face_engine (DeepFace is now loaded lazily)
+- ``import_face_engine_eager``: the same plus the DeepFace/TensorFlow import
+  it used to trigger, i.e. the cost before lazy loading
+- ``first_render``/``first_render_eager``: one full run of glasstry.py (the
+  login page) through streamlit's AppTest, without and with DeepFace
+  imported first; skipped if streamlit.testing is unavailable
+
+    python bench_startup.py
+    python bench_startup.py --repeat 5 --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+_EAGER = "from face_engine import load_deepface; load_deepface()\n"
+_RENDER = (
+    "from streamlit.testing.v1 import AppTest\n"
+    "at = AppTest.from_file('glasstry.py', default_timeout=600).run()\n"
+    "assert not at.exception, at.exception\n"
+)
+CASES = {
+    "import_face_engine": "import face_engine\n",
+    "import_face_engine_eager": "import face_engine\n" + _EAGER,
+    "first_render": _RENDER,
+    "first_render_eager": _EAGER + _RENDER,
+}
+
+
+def time_case(code):
+    """Seconds for ``code`` in a fresh interpreter (timed inside it, excluding interpreter startup)."""
+    script = ("import time\n_start = time.perf_counter()\n" + code +
+              "print('ELAPSED', time.perf_counter() - _start)\n")
+    proc = subprocess.run([sys.executable, "-c", script], cwd=HERE, capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith("ELAPSED "):
+            return float(line.split()[1])
+    raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "no timing printed")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (default: 3)")
+    parser.add_argument("--json", default=None, help="also write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, code in CASES.items():
+        try:
+            runs = [time_case(code) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{name:>26}: skipped ({e})")
+            results[name] = None
+            continue
+        results[name] = {"median_s": statistics.median(runs), "runs_s": runs}
+        print(f"{name:>26}: {statistics.median(runs):7.2f}s  (runs: {', '.join(f'{r:.2f}' for r in runs)})")
+
+    for base in ("import_face_engine", "first_render"):
+        lazy, eager = results.get(base), results.get(base + "_eager")
+        if lazy and eager:
+            print(f"{base:>26}: {eager['median_s'] - lazy['median_s']:+.2f}s saved by lazy DeepFace import")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Byte-budgeted LRU cache keyed by image content hash.
+
+Streamlit reruns the whole script on every click, and the live desk used to
+decode the same upload twice per rerun and forget detections as soon as a
+new photo arrived. FaceEngine keeps one ByteLRUCache for decoded images and
+face results; it is shared by every session, so only immutable values go
+in it. Keys are tuples starting with a kind, e.g. ``('image', digest)`` or
+``('faces', digest, backend)``.
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+
+DEFAULT_CACHE_BYTES = 128 * 1024 * 1024
+
+
+def content_key(data: bytes) -> str:
+    """Hash of the raw upload bytes (same md5 the live desk already used)."""
+    return hashlib.md5(data).hexdigest()
+
+
+def estimate_size(value) -> int:
+    """Rough in-memory size of a cached value, in bytes."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, Image.Image):
+        return value.width * value.height * len(value.getbands())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value.values())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, float):
+        # Encodings are lists of Python floats: 24 bytes each plus the list slot
+        return 32
+    return sys.getsizeof(value)
+
+
+class ByteLRUCache:
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()  # key -> (value, nbytes)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes=None):
+        """Insert ``value``; evicts least recently used entries to stay under budget."""
+        nbytes = estimate_size(value) if nbytes is None else nbytes
+        if nbytes > self.max_bytes:
+            return  # would evict everything else; don't cache it at all
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._items[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._items.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+
+    def get_or_compute(self, key, compute, nbytes=None):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.put(key, value, nbytes)
+        return value
+
+    def invalidate(self, predicate):
+        """Drop every entry whose key matches ``predicate(key)``."""
+        with self._lock:
+            for key in [k for k in self._items if predicate(k)]:
+                _, nbytes = self._items.pop(key)
+                self.current_bytes -= nbytes
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._items), 'bytes': self.current_bytes, 'max_bytes': self.max_bytes,
+                    'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,360 @@
+"""Embedding indexes for duplicate-face lookup.
+
+Every index stores unit-normalised float32 rows, so cosine similarity is a
+plain dot product. All backends share the same small interface:
+
+    add(face_id, vector)  -> bool   insert (or replace) one embedding
+    remove(face_id)       -> bool   delete one embedding
+    search(vector, k=1)   -> [(face_id, similarity), ...] best first
+    len(index)
+
+EmbeddingStore   - the contiguous float32 row buffer plus parallel id array.
+ExactIndex       - brute-force search over one EmbeddingStore.
+IVFIndex         - inverted-file approximate search: a spherical k-means
+                   coarse quantiser splits the rows into lists and a query
+                   only scans the ``n_probe`` closest lists.
+PartitionedIndex - one index per partition (event id) plus an optional global
+                   index, so per-event and cross-event lookups are both direct.
+"""
+import numpy as np
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+def normalize(vector) -> Optional[np.ndarray]:
+    """Return ``vector`` as a unit-length float32 array, or None if it has zero norm."""
+    vec = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vec))
+    if norm == 0.0 or not np.isfinite(norm):
+        return None
+    return vec / norm
+
+
+class EmbeddingStore:
+    """Growable, contiguous float32 matrix of unit-normalised embeddings.
+
+    Rows live in one preallocated buffer that doubles when full, so appends
+    are amortised O(1) and ``vectors`` is always a view, never a copy.
+    ``ids`` is the parallel int64 array of face ids; removal swaps the last
+    row into the hole to keep both arrays dense.
+    """
+
+    def __init__(self, dim: Optional[int] = None, initial_capacity: int = 64):
+        self.dim = dim
+        self._capacity = max(1, initial_capacity)
+        self._size = 0
+        self._vectors = None  # allocated on first add, once dim is known
+        self._ids = np.empty(self._capacity, dtype=np.int64)
+        self._rows: Dict[int, int] = {}  # id -> row
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, face_id):
+        return face_id in self._rows
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """View (no copy) of the live rows."""
+        if self._vectors is None:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        return self._vectors[:self._size]
+
+    @property
+    def ids(self) -> np.ndarray:
+        """View (no copy) of the id of each live row."""
+        return self._ids[:self._size]
+
+    @property
+    def nbytes(self) -> int:
+        vec_bytes = 0 if self._vectors is None else self._vectors.nbytes
+        return vec_bytes + self._ids.nbytes
+
+    def row_of(self, face_id) -> Optional[int]:
+        return self._rows.get(face_id)
+
+    def _ensure_capacity(self, needed):
+        if self._vectors is None:
+            self._capacity = max(self._capacity, needed)
+            self._vectors = np.empty((self._capacity, self.dim), dtype=np.float32)
+            if self._ids.shape[0] < self._capacity:
+                self._ids = np.empty(self._capacity, dtype=np.int64)
+        elif needed > self._capacity:
+            # Double the buffer so appends stay amortised O(1)
+            while self._capacity < needed:
+                self._capacity *= 2
+            vectors = np.empty((self._capacity, self.dim), dtype=np.float32)
+            vectors[:self._size] = self._vectors[:self._size]
+            ids = np.empty(self._capacity, dtype=np.int64)
+            ids[:self._size] = self._ids[:self._size]
+            self._vectors, self._ids = vectors, ids
+
+    def add(self, face_id: int, vector) -> bool:
+        """Insert (or overwrite) one embedding. Zero vectors are rejected."""
+        vec = normalize(vector)
+        if vec is None:
+            return False
+        if self.dim is None:
+            self.dim = vec.shape[0]
+        elif vec.shape[0] != self.dim:
+            raise ValueError(f"Expected embedding of size {self.dim}, got {vec.shape[0]}")
+
+        row = self._rows.get(face_id)
+        if row is None:
+            row = self._size
+            self._ensure_capacity(row + 1)
+            self._ids[row] = face_id
+            self._rows[face_id] = row
+            self._size += 1
+        self._vectors[row] = vec
+        return True
+
+    def remove(self, face_id: int) -> bool:
+        row = self._rows.pop(face_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if row != last:
+            moved_id = int(self._ids[last])
+            self._vectors[row] = self._vectors[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._size -= 1
+        return True
+
+    def clear(self):
+        self._size = 0
+        self._vectors = None
+        self._rows = {}
+
+    def similarities(self, vector) -> np.ndarray:
+        """Cosine similarity of ``vector`` to every row: one matrix-vector product."""
+        vec = normalize(vector)
+        if vec is None or self._size == 0 or vec.shape[0] != self.dim:
+            return np.empty(0, dtype=np.float32)
+        return self.vectors @ vec
+
+
+class ExactIndex(EmbeddingStore):
+    """Brute-force cosine index: an EmbeddingStore searched with one matvec."""
+
+    def search(self, vector, k: int = 1) -> List[Tuple[int, float]]:
+        sims = self.similarities(vector)
+        if sims.size == 0:
+            return []
+        return _top_k(sims, self.ids, k)
+
+
+class IVFIndex:
+    """Approximate cosine index with an inverted-file layout.
+
+    Until ``train_size`` rows have been added everything lives in a single
+    exact list, so small events behave exactly like ``ExactIndex``. Once the
+    threshold is crossed the rows are clustered into ``n_lists`` lists and
+    new rows are routed to their closest centroid.
+    """
+
+    def __init__(self, n_lists: int = 32, n_probe: int = 4, train_size: int = 1024,
+                 kmeans_iters: int = 10, seed: int = 0):
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_size = max(train_size, n_lists)
+        self.kmeans_iters = kmeans_iters
+        self.seed = seed
+        self.centroids = None
+        self._lists: List[ExactIndex] = [ExactIndex()]
+        self._owner: Dict[int, int] = {}  # face id -> list number
+
+    def __len__(self):
+        return len(self._owner)
+
+    def __contains__(self, face_id):
+        return face_id in self._owner
+
+    @property
+    def is_trained(self):
+        return self.centroids is not None
+
+    def add(self, face_id: int, vector) -> bool:
+        vec = normalize(vector)
+        if vec is None:
+            return False
+        if face_id in self._owner:
+            self.remove(face_id)
+
+        list_no = 0 if self.centroids is None else int(np.argmax(self.centroids @ vec))
+        self._lists[list_no].add(face_id, vec)
+        self._owner[face_id] = list_no
+
+        if self.centroids is None and len(self._owner) >= self.train_size:
+            self.train()
+        return True
+
+    def remove(self, face_id: int) -> bool:
+        list_no = self._owner.pop(face_id, None)
+        if list_no is None:
+            return False
+        return self._lists[list_no].remove(face_id)
+
+    def clear(self):
+        self.centroids = None
+        self._lists = [ExactIndex()]
+        self._owner = {}
+
+    def train(self):
+        """(Re)build the coarse quantiser from every row currently indexed."""
+        ids = np.concatenate([lst.ids for lst in self._lists])
+        if ids.size == 0:
+            return
+        data = np.vstack([lst.vectors for lst in self._lists if len(lst)])
+        n_lists = min(self.n_lists, ids.size)
+        self.centroids = _spherical_kmeans(data, n_lists, self.kmeans_iters, self.seed)
+
+        assignment = np.argmax(data @ self.centroids.T, axis=1)
+        self._lists = [ExactIndex(dim=data.shape[1]) for _ in range(n_lists)]
+        self._owner = {}
+        for face_id, vec, list_no in zip(ids.tolist(), data, assignment):
+            self._lists[int(list_no)].add(face_id, vec)
+            self._owner[face_id] = int(list_no)
+
+    def search(self, vector, k: int = 1) -> List[Tuple[int, float]]:
+        if not self._owner:
+            return []
+        vec = normalize(vector)
+        if vec is None:
+            return []
+        if self.centroids is None:
+            return self._lists[0].search(vec, k)
+
+        n_probe = min(self.n_probe, len(self._lists))
+        probe = np.argsort(-(self.centroids @ vec))[:n_probe]
+        hits = []
+        for list_no in probe:
+            hits.extend(self._lists[int(list_no)].search(vec, k))
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return hits[:k]
+
+
+def _top_k(sims: np.ndarray, ids: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    if k <= 1:
+        best = int(np.argmax(sims))
+        return [(int(ids[best]), float(sims[best]))]
+    k = min(k, len(ids))
+    top = np.argpartition(-sims, k - 1)[:k]
+    top = top[np.argsort(-sims[top])]
+    return [(int(ids[i]), float(sims[i])) for i in top]
+
+
+def _spherical_kmeans(data: np.ndarray, n_clusters: int, iters: int, seed: int) -> np.ndarray:
+    """Cosine k-means on unit rows; returns unit-normalised centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(len(data), n_clusters, replace=False)].copy()
+    for _ in range(iters):
+        assignment = np.argmax(data @ centroids.T, axis=1)
+        for c in range(n_clusters):
+            members = data[assignment == c]
+            if len(members) == 0:
+                # Re-seed empty clusters from a random row
+                centroids[c] = data[rng.integers(len(data))]
+                continue
+            centroid = members.sum(axis=0)
+            norm = np.linalg.norm(centroid)
+            if norm > 0:
+                centroids[c] = centroid / norm
+    return centroids.astype(np.float32)
+
+
+# Sentinel for "search every partition" (None is a valid partition key)
+ALL_PARTITIONS = object()
+
+INDEX_TYPES = {
+    "exact": ExactIndex,
+    "ivf": IVFIndex,
+}
+
+
+def make_index(kind: str = "exact", **kwargs):
+    """Build an index by name ("exact" or "ivf")."""
+    if kind not in INDEX_TYPES:
+        raise ValueError(f"Unknown index type '{kind}'. Options: {sorted(INDEX_TYPES)}")
+    return INDEX_TYPES[kind](**kwargs)
+
+
+class PartitionedIndex:
+    """One sub-index ("shard") per partition key, plus an optional global shard.
+
+    FaceEngine partitions by event id, so "is this face already registered in
+    this event?" only scans that event's rows, while the global shard answers
+    "has this face been seen in any event?" without merging every shard.
+    Each face id belongs to exactly one partition.
+    """
+
+    def __init__(self, kind: str = "exact", global_shard: bool = True, **index_kwargs):
+        self.kind = kind
+        self._index_kwargs = index_kwargs
+        self.shards: Dict[Hashable, object] = {}
+        self.global_shard = make_index(kind, **index_kwargs) if global_shard else None
+        self._partition_of: Dict[int, Hashable] = {}  # face id -> partition key
+
+    def __len__(self):
+        return len(self._partition_of)
+
+    def __contains__(self, face_id):
+        return face_id in self._partition_of
+
+    def partition_of(self, face_id) -> Optional[Hashable]:
+        return self._partition_of.get(face_id)
+
+    def partition_size(self, partition) -> int:
+        shard = self.shards.get(partition)
+        return len(shard) if shard is not None else 0
+
+    def add(self, face_id: int, vector, partition=None) -> bool:
+        if face_id in self._partition_of:
+            self.remove(face_id)
+        shard = self.shards.get(partition)
+        if shard is None:
+            shard = self.shards[partition] = make_index(self.kind, **self._index_kwargs)
+        if not shard.add(face_id, vector):
+            return False
+        if self.global_shard is not None:
+            self.global_shard.add(face_id, vector)
+        self._partition_of[face_id] = partition
+        return True
+
+    def remove(self, face_id: int) -> bool:
+        if face_id not in self._partition_of:
+            return False
+        partition = self._partition_of.pop(face_id)
+        self.shards[partition].remove(face_id)
+        if self.global_shard is not None:
+            self.global_shard.remove(face_id)
+        return True
+
+    def drop_partition(self, partition) -> List[int]:
+        """Remove a whole partition; returns the face ids that were in it."""
+        shard = self.shards.pop(partition, None)
+        if shard is None:
+            return []
+        dropped = [fid for fid, part in self._partition_of.items() if part == partition]
+        for face_id in dropped:
+            del self._partition_of[face_id]
+            if self.global_shard is not None:
+                self.global_shard.remove(face_id)
+        return dropped
+
+    def search(self, vector, k: int = 1, partition=ALL_PARTITIONS, partitions=None) -> List[Tuple[int, float]]:
+        """Search one ``partition``, a set of ``partitions``, or (default) every partition."""
+        if partition is not ALL_PARTITIONS:
+            shard = self.shards.get(partition)
+            return shard.search(vector, k) if shard is not None else []
+        if partitions is None:
+            if self.global_shard is not None:
+                return self.global_shard.search(vector, k)
+            shards = self.shards.values()
+        else:
+            shards = [self.shards[p] for p in partitions if p in self.shards]
+        hits = []
+        for shard in shards:
+            hits.extend(shard.search(vector, k))
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return hits[:k]
@@ -0,0 +1,213 @@
+"""Latency histograms and counters for FaceEngine, exported in Prometheus text format.
+
+Every image FaceEngine processes (inline, on worker processes or through a
+tracked stream) is folded into one EngineMetrics:
+
+- ``faceengine_stage_seconds{stage}``: FrameState timings. ``open`` is
+  turning the input (upload bytes, array) into a PIL image, ``decode`` the
+  resize + colour conversion, then
+  ``quality``, ``detect`` (all detector attempts), ``embed``, ``classify``
+  (gender) and ``duplicates`` (index search)
+- ``faceengine_detect_seconds{backend,result}`` and
+  ``faceengine_detector_attempts_total{backend,result}`` per detector call
+- ``faceengine_fallback_images_total{backend}``: images that needed more
+  than one detector, by the backend that finally found faces ("none")
+- ``faceengine_images_total{result}``, ``faceengine_faces_per_image``,
+  ``faceengine_faces_filtered_total``, ``faceengine_errors_total{stage}``
+- ``faceengine_result_cache_total{result}``: process_image_bytes cache hits
+
+FaceEngine.metrics_text() adds gauges for the content cache, the index and
+the worker queue. Export with FaceEngine.export_metrics(port=..., path=...)
+(a /metrics endpoint and/or a node_exporter textfile rewritten every few
+seconds), or FaceEngine.write_metrics(path) once at the end of a batch run.
+"""
+import bisect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from quality_gate import OK
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FACES_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50)
+
+# name -> (type, help, buckets for histograms)
+METRICS = {
+    "faceengine_stage_seconds": ("histogram", "Time per FaceEngine stage for one image.", SECONDS_BUCKETS),
+    "faceengine_detect_seconds": ("histogram", "Time per detector backend call.", SECONDS_BUCKETS),
+    "faceengine_faces_per_image": ("histogram", "Faces kept per processed image.", FACES_BUCKETS),
+    "faceengine_detector_attempts_total": ("counter", "Detector backend calls, by whether faces were found.", None),
+    "faceengine_fallback_images_total": ("counter", "Images that needed a fallback detector, by the backend that "
+                                                    "found faces.", None),
+    "faceengine_images_total": ("counter", "Processed images by outcome.", None),
+    "faceengine_faces_filtered_total": ("counter", "Detections dropped by the face filter.", None),
+    "faceengine_errors_total": ("counter", "Model errors by stage.", None),
+    "faceengine_result_cache_total": ("counter", "process_image_bytes lookups by cache result.", None),
+}
+
+
+class Histogram:
+    """Fixed-bucket histogram (Prometheus ``le`` semantics)."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """[(upper bound, observations <= bound)], ending with +Inf."""
+        total, out = 0, []
+        for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+            total += n
+            out.append((bound, total))
+        return out
+
+
+class EngineMetrics:
+    def __init__(self):
+        self._histograms = {}  # (name, labels) -> Histogram
+        self._counters = {}    # (name, labels) -> value
+        self._lock = threading.Lock()
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(METRICS[name][2])
+            histogram.observe(value)
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe_frame(self, timings, attempts, faces, filtered=0, quality=None):
+        """Fold one processed image in: FrameState timings/attempts, faces kept, faces filtered."""
+        for stage, seconds in timings.items():
+            self.observe("faceengine_stage_seconds", seconds, stage=stage)
+        for backend, found, seconds in attempts:
+            result = "faces" if found else "none"
+            self.observe("faceengine_detect_seconds", seconds, backend=backend, result=result)
+            self.inc("faceengine_detector_attempts_total", backend=backend, result=result)
+        if len(attempts) > 1:
+            winner = next((backend for backend, found, _ in attempts if found), "none")
+            self.inc("faceengine_fallback_images_total", backend=winner)
+        if filtered:
+            self.inc("faceengine_faces_filtered_total", filtered)
+
+        if quality is not None and quality.get('status') != OK:
+            self.inc("faceengine_images_total", result="rejected")
+            return
+        self.observe("faceengine_faces_per_image", faces)
+        self.inc("faceengine_images_total", result="faces" if faces else "no_faces")
+
+    def snapshot(self):
+        """{name: {labels: value or Histogram copy}} for reports and tests."""
+        out = {}
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                out.setdefault(name, {})[labels] = value
+            for (name, labels), histogram in self._histograms.items():
+                copy = Histogram(histogram.buckets)
+                copy.counts, copy.sum, copy.count = list(histogram.counts), histogram.sum, histogram.count
+                out.setdefault(name, {})[labels] = copy
+        return out
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def render(self, gauges=None):
+        """Prometheus text exposition of every metric, plus ``gauges`` {name: (type, help, value)}."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, (kind, help_text, _) in METRICS.items():
+            series = snapshot.get(name)
+            if not series:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(series.items()):
+                if kind == "histogram":
+                    for bound, total in value.cumulative():
+                        le = "+Inf" if bound == float("inf") else _number(bound)
+                        lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {total}")
+                    lines.append(f"{name}_sum{_labels(labels)} {_number(value.sum)}")
+                    lines.append(f"{name}_count{_labels(labels)} {value.count}")
+                else:
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        for name, (kind, help_text, value) in (gauges or {}).items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+def write_textfile(path, text):
+    """Atomically replace ``path`` (node_exporter's textfile collector must never see a partial file)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def serve(render, port, addr="127.0.0.1"):
+    """Serve ``render()`` at http://addr:port/metrics on a daemon thread. Returns the server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass  # scrapes every few seconds would flood the server log
+
+    server = ThreadingHTTPServer((addr, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="faceengine-metrics", daemon=True).start()
+    return server
+
+
+def start_textfile_writer(render, path, interval=15.0):
+    """Rewrite ``path`` with ``render()`` every ``interval`` seconds on a daemon thread. Returns a stop Event."""
+    stop = threading.Event()
+
+    def _loop():
+        while not stop.wait(interval):
+            try:
+                write_textfile(path, render())
+            except OSError as e:
+                print(f"Metrics write failed ({path}): {e}")
+
+    threading.Thread(target=_loop, name="faceengine-metrics-file", daemon=True).start()
+    return stop
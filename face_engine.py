@@ -1,163 +1,1054 @@
+import io
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 import numpy as np
 import cv2
 from PIL import Image
 from typing import List, Dict, Optional, Tuple
 
-# Try importing DeepFace
-try:
-    from deepface import DeepFace
-except ImportError:
-    DeepFace = None
+from backend_scheduler import BackendScheduler
+from content_cache import ByteLRUCache, content_key
+from embedding_index import ALL_PARTITIONS, PartitionedIndex
+from engine_metrics import EngineMetrics, serve, start_textfile_writer, write_textfile
+from onnx_backend import INFERENCE_BACKENDS
+from quality_gate import OK, FaceFilter
+
+# deepface.DeepFace, imported by load_deepface() on first use: importing it
+# pulls in TensorFlow, which takes seconds and is not needed to render a page
+DeepFace = None
+DEEPFACE_IMPORT_SECONDS = None  # how long that import took, once attempted
+_deepface_lock = threading.Lock()
+
+# Cosine similarity above which two Facenet512 embeddings are the same person
+DUPLICATE_THRESHOLD = 0.65
+
+# DeepFace gender model: 224x224 input, softmax over [Woman, Man]
+GENDER_INPUT_SIZE = (224, 224)
+GENDER_LABELS = ("Female", "Male")
+# Crops per forward pass; a 30-person group photo fits in one
+GENDER_BATCH_SIZE = 32
+
+# find_duplicate(event_id=ALL_EVENTS) searches across every event
+ALL_EVENTS = ALL_PARTITIONS
+
+# Longest side images are shrunk to before detection
+PROCESS_MAX_SIDE = 720
 
 class FaceEngine:
-    def __init__(self):
-        self.known_encodings = []
-        self.known_ids = []
+    def __init__(self, index_type="exact", global_index=False, face_filter=None, inference_backend="keras",
+                 model_dir=None, **index_kwargs):
+        # face id -> {'event_id', 'name'}; embeddings live in self.index
+        self.known_meta = {}
+        self._next_face_id = 0
         # Use Facenet512 - faster and more accurate than VGG-Face
         self.model_name = "Facenet512"
         # Cache for model warmup
         self._model_loaded = False
+        self._warmup_thread = None
+        self.warmup_report = None  # stage -> seconds, set once warmup() finishes
+        # "keras" (DeepFace's models), or "onnx" / "onnx-int8" exports in model_dir (see onnx_backend)
+        if inference_backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"Unknown inference backend {inference_backend!r}; expected one of {INFERENCE_BACKENDS}")
+        self.inference_backend = inference_backend
+        self.model_dir = model_dir or os.environ.get("EQUIVISION_MODEL_DIR", "models")
+        # Raw models for batched embedding / gender (False = unavailable)
+        self._embedding_model = None
+        self._gender_model = None
+        self._model_lock = threading.Lock()  # warmup thread and first request may race to build models
+        # Starting the warmup thread, worker pool and metrics exporters; never
+        # held across a model build, so new sessions don't wait on a warmup
+        self._state_lock = threading.Lock()
+        # Model calls take turns: the detectors (cv2.dnn setInput()/forward()) and
+        # Keras models are shared by every thread and are not thread-safe
+        self._inference_lock = threading.RLock()
+        # Which detections are worth embedding (size, detector confidence, primary faces)
+        self.face_filter = face_filter or FaceFilter()
+        # Learns which detector backends work (and how fast) per event/camera
+        self.scheduler = BackendScheduler()
+        # Optional inference worker processes (see start_workers)
+        self.pool = None
+        # Decoded images and face results keyed by upload content hash
+        self.cache = ByteLRUCache()
+        # Per-stage latency histograms and counters (see engine_metrics)
+        self.metrics = EngineMetrics()
+        self._metrics_exports = {}
+        # Duplicate lookup index ("exact" or "ivf"), sharded by event id. The
+        # optional global shard holds a second copy of every embedding and only
+        # speeds up find_duplicate() across all events; FaceEngineView always
+        # searches its own events, so the app leaves it off
+        self.index_type = index_type
+        self.global_index = global_index
+        self._index_kwargs = index_kwargs
+        self._index_lock = threading.RLock()  # the engine may be shared by many sessions
+        self._loaded_events = set()
+        self._reset_index()
+
+    def _reset_index(self):
+        self.index = PartitionedIndex(self.index_type, global_shard=self.global_index, **self._index_kwargs)
 
     def load_known_faces(self, events_data):
-        self.known_encodings = []
-        self.known_ids = []
-        for evt_id, event in events_data.items():
-            for person in event.get('data', []):
+        with self._index_lock:
+            self.known_meta = {}
+            self._loaded_events = set()
+            self._reset_index()
+            for evt_id, event in events_data.items():
+                self.load_event_faces(evt_id, event.get('data', []))
+
+    def load_event_faces(self, event_id, records):
+        """Replace one event's shard with the encodings in ``records``."""
+        with self._index_lock:
+            for face_id in self.index.drop_partition(event_id):
+                self.known_meta.pop(face_id, None)
+            for person in records:
                 if 'encoding' in person:
-                    self.known_encodings.append(np.array(person['encoding']))
-                    self.known_ids.append({'event_id': evt_id, 'name': person.get('name', 'Unknown')})
+                    self.add_known_face(person['encoding'], {'event_id': event_id, 'name': person.get('name', 'Unknown')})
+            self._loaded_events.add(event_id)
+
+    def has_event(self, event_id):
+        """True once an event's faces have been loaded into the index."""
+        return event_id in self._loaded_events
 
-    def _preprocess_image(self, img_np, max_size=800):
-        """Resize large images for faster processing while maintaining quality."""
-        h, w = img_np.shape[:2]
+    def add_known_face(self, encoding, meta):
+        """Register one embedding for duplicate detection. Returns its face id, or None if unusable."""
+        if encoding is None or len(encoding) == 0:
+            return None
+        with self._index_lock:
+            face_id = self._next_face_id
+            if not self.index.add(face_id, encoding, partition=meta.get('event_id')):
+                return None
+            self._next_face_id += 1
+            self.known_meta[face_id] = meta
+            return face_id
+
+    def remove_known_face(self, face_id):
+        """Drop one embedding from duplicate detection."""
+        with self._index_lock:
+            if self.known_meta.pop(face_id, None) is None:
+                return False
+            return self.index.remove(face_id)
+
+    def find_duplicate(self, encoding, event_id=ALL_EVENTS, threshold=DUPLICATE_THRESHOLD, events=None):
+        """Return (meta, similarity) of the closest known face above threshold, else None.
+
+        Pass ``event_id`` to only consider faces registered in that event, or
+        ``events`` to limit a cross-event search to those event ids.
+        """
+        if encoding is None:
+            return None
+        with self._index_lock:
+            hits = self.index.search(encoding, k=1, partition=event_id, partitions=events)
+            if hits and hits[0][1] > threshold:
+                face_id, similarity = hits[0]
+                return self.known_meta[face_id], similarity
+        return None
+
+    def _preprocess_image(self, image_pil, max_size=PROCESS_MAX_SIDE):
+        """Downscale to ``max_size`` and convert straight into this thread's BGR work buffer.
+
+        Returns (bgr, scale) where ``scale`` maps original pixels to working
+        pixels. The full-resolution image is never copied into numpy: PIL
+        shrinks it first and the single small RGB array is colour-converted
+        into the reused buffer.
+        """
+        if image_pil.mode != 'RGB':
+            image_pil = image_pil.convert('RGB')
+        w, h = image_pil.size
+        scale = 1.0
         if max(h, w) > max_size:
             scale = max_size / max(h, w)
-            new_w, new_h = int(w * scale), int(h * scale)
-            img_np = cv2.resize(img_np, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        return img_np
+            # BOX averages the covered source pixels, like cv2.INTER_AREA
+            image_pil = image_pil.resize((int(w * scale), int(h * scale)), Image.BOX)
+        rgb = np.asarray(image_pil)
+        bgr = _work_buffer(rgb.shape)
+        cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=bgr)
+        return bgr, scale
 
-    def process_image(self, image_pil, detector_backend='opencv', skip_gender=False):
-        if DeepFace is None:
-            return []
+    def process_image(self, image_pil, detector_backend='opencv', skip_gender=False, context=None, events=None,
+                      quality_gate=None):
+        return self.process_images([image_pil], detector_backend=detector_backend, skip_gender=skip_gender,
+                                   context=context, events=events, quality_gate=quality_gate)[0]
 
-        # Convert PIL to BGR (DeepFace usually expects BGR/OpenCV format)
-        img_np = np.array(image_pil)
-        
-        # Preprocess: resize large images for speed
-        img_np = self._preprocess_image(img_np, max_size=720)
-        img_bgr = cv2.cvtColor(img_np, cv2.COLOR_RGB2BGR)
-        
-        # Optimized backend order: opencv (fastest) -> ssd (balanced) -> retinaface (accurate)
-        # Limit fallbacks to 3 for speed
-        backends_to_try = [detector_backend]
-        fallbacks = ['opencv', 'ssd', 'retinaface']
-        for fb in fallbacks:
-            if fb not in backends_to_try and len(backends_to_try) < 3:
-                backends_to_try.append(fb)
-
-        embeddings_obj = None
-        last_error = None
-
-        for backend in backends_to_try:
+    def process_images(self, images, detector_backend='opencv', skip_gender=False, context=None, events=None,
+                       quality_gate=None):
+        """Process several images; gender for every face across all of them runs as one batched pass.
+
+        ``context`` (event id, camera name...) scopes the detector fallback statistics;
+        ``events`` limits the duplicate check to those event ids (default: all).
+        With a ``quality_gate`` (quality_gate.QualityGate) bad frames are turned
+        away before inference and each result is a (faces, quality report) tuple.
+        With worker processes started, the images are spread across the pool instead.
+        """
+        if self.pool is not None:
+            futures = [self.submit(image_pil, detector_backend, skip_gender, context, events, quality_gate=quality_gate)
+                       for image_pil in images]
+            return [future.result() for future in futures]
+
+        frames = [self.run_stages(image_pil, detector_backend, context, events, quality_gate=quality_gate)
+                  for image_pil in images]
+        if not skip_gender:
+            self.classify_frames(frames)
+        for frame in frames:
+            self._observe_frame(frame)
+        if quality_gate is not None:
+            return [(frame.faces, frame.quality) for frame in frames]
+        return [frame.faces for frame in frames]
+
+    def classify_frames(self, frames):
+        """Fill in gender for every face of ``frames`` with one batched pass."""
+        all_faces = [face for frame in frames for face in frame.faces]
+        all_crops = [crop for frame in frames for crop in frame.crops]
+        if not all_faces:
+            return
+
+        # Gender Detection - optional for speed optimization
+        start = time.perf_counter()
+        for face_data, (gender, confidence) in zip(all_faces, self.classify_genders(all_crops)):
+            face_data["gender"] = gender
+            face_data["confidence"] = confidence
+        elapsed = time.perf_counter() - start
+        for frame in frames:
+            # Shared batched pass: attribute time to each frame by face count
+            frame.timings['classify'] = elapsed * len(frame.faces) / len(all_faces)
+
+    def decode_image(self, data, key=None, max_side=None):
+        """Decode upload bytes into a PIL image, once per distinct content.
+
+        With ``max_side`` (a preview) JPEGs are draft-decoded at reduced
+        scale; face boxes stay in full-resolution pixels, see image_scale().
+        """
+        key = key or content_key(data)
+        if max_side:
+            return self.cache.get_or_compute(('preview', key, max_side), lambda: open_image(data, max_side))
+        return self.cache.get_or_compute(('image', key), lambda: open_image(data))
+
+    def process_image_bytes(self, data, detector_backend='opencv', skip_gender=False, context=None,
+                            events=None, key=None, quality_gate=None):
+        """process_image() for encoded bytes, cached by content hash.
+
+        A re-upload or rerun of the same photo neither decodes nor runs
+        inference again; only the (cheap) duplicate check is redone, so it
+        reflects faces registered since the first pass.
+        """
+        key = key or content_key(data)
+        gate_key = quality_gate.key() if quality_gate is not None else None
+        faces_key = ('faces', key, detector_backend, skip_gender, gate_key)
+        cached = self.cache.get(faces_key)
+        self.metrics.inc("faceengine_result_cache_total", result="miss" if cached is None else "hit")
+        if cached is None:
+            if self.pool is not None:
+                # Workers draft-decode (and time 'open') themselves, off the script thread
+                result = self.submit(data, detector_backend, skip_gender, context, events,
+                                     quality_gate=quality_gate).result()
+            else:
+                # Draft-decode straight to inference size; the decode itself is not cached
+                result = self.process_image(self._open(data), detector_backend, skip_gender, context, events,
+                                            quality_gate=quality_gate)
+            faces, quality = result if quality_gate is not None else (result, None)
+            # Cache without duplicate flags; they depend on the index at lookup time
+            self.cache.put(faces_key, ([_without_duplicate_info(face) for face in faces], quality))
+            return result
+
+        cached_faces, quality = cached
+        faces = [dict(face) for face in cached_faces]
+        self.mark_duplicates(faces, events)
+        if quality_gate is None:
+            return faces
+        # None when the gate never ran (e.g. DeepFace is not installed)
+        return faces, dict(quality) if quality is not None else None
+
+    def iter_process(self, items, detector_backend='opencv', skip_gender=False, context=None,
+                     workers=None, window=None):
+        """Stream ``(source, image)`` items through inference with bounded memory.
+
+        Yields ``(source, faces, error)`` in input order; see iter_inference.
+        """
+        return iter_inference(self, items, detector_backend=detector_backend, skip_gender=skip_gender,
+                              context=context, workers=workers, window=window)
+
+    def open_stream(self, detector_backend='opencv', skip_gender=False, context=None, events=None,
+                    quality_gate=None, **tracker_kwargs):
+        """Start a tracked video stream; see face_tracker.FaceStream.process_frame."""
+        from face_tracker import FaceStream, FaceTracker
+
+        return FaceStream(self, detector_backend=detector_backend, skip_gender=skip_gender, context=context,
+                          events=events, tracker=FaceTracker(**tracker_kwargs), quality_gate=quality_gate)
+
+    def mark_duplicates(self, faces, events=None):
+        """Flag faces whose encoding matches a known face (cosine similarity, Facenet512)."""
+        for face_data in faces:
+            match = self.find_duplicate(face_data["encoding"], events=events)
+            if match is not None:
+                face_data["is_duplicate"] = True
+                face_data["duplicate_info"] = match[0]
+                face_data["match_confidence"] = float(match[1])
+
+    # ---------------- Worker processes ----------------
+
+    def start_workers(self, workers=None, max_pending=None, warmup_backends=('opencv',)):
+        """Start a pool of inference processes (models loaded once per worker).
+
+        Afterwards process_image()/process_images() and submit() run detection,
+        embedding and gender on the workers; duplicate checks stay in this
+        process, against the shared index.
+        """
+        from inference_pool import InferencePool
+
+        with self._state_lock:
+            if self.pool is None:
+                self.pool = InferencePool(workers=workers, max_pending=max_pending, model_name=self.model_name,
+                                          warmup_backends=warmup_backends, face_filter=self.face_filter,
+                                          inference_backend=self.inference_backend, model_dir=self.model_dir)
+        return self.pool
+
+    def _replace_broken_pool(self, broken):
+        """Swap in a fresh pool after a worker crash; the failed request still raises."""
+        with self._state_lock:
+            if self.pool is broken:
+                print("Inference worker died; restarting the worker pool")
+                self.pool = broken.restarted()
+
+    def stop_workers(self, wait=True):
+        pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def submit(self, image, detector_backend='opencv', skip_gender=False, context=None, events=None, timeout=None,
+               quality_gate=None):
+        """Queue one image for inference; returns a Future resolving to process_image()'s result.
+
+        ``image`` may be a PIL image, an RGB array or encoded image bytes. When
+        the worker queue is full this blocks (up to ``timeout`` seconds, then
+        raises queue.Full). Without a pool the image is processed inline.
+        """
+        result = Future()
+        if self.pool is None:
             try:
-                # Detection & Embedding with optimized settings
-                embeddings_obj = DeepFace.represent(
-                    img_path=img_bgr, 
-                    model_name=self.model_name, 
-                    detector_backend=backend,
-                    enforce_detection=True,
-                    align=True  # Alignment improves accuracy
-                )
-                if embeddings_obj:
-                    self._model_loaded = True
-                    break
-            except ValueError as e:
-                last_error = e
-                continue
+                result.set_result(self.process_image(self._open(image), detector_backend,
+                                                     skip_gender, context, events, quality_gate=quality_gate))
+            except Exception as e:
+                result.set_exception(e)
+            return result
+
+        pool = self.pool
+        try:
+            worker_future = pool.submit(image, detector_backend, skip_gender, context, quality_gate=quality_gate,
+                                        timeout=timeout)
+        except BrokenProcessPool:
+            self._replace_broken_pool(pool)
+            raise
+
+        def _finish(done):
+            # Also claims the wrapper, so a late cancel() can no longer race set_result()
+            if done.cancelled() or not result.set_running_or_notify_cancel():
+                result.cancel()
+                return
+            try:
+                faces, attempts, quality, timings, filtered = done.result()
+                # Workers plan with their own stats; fold their attempts into ours
+                for backend, success, seconds in attempts:
+                    self.scheduler.record(backend, success, seconds, context)
+                # The worker's duplicate check ran against its own empty index; the real one is here
+                start = time.perf_counter()
+                self.mark_duplicates(faces, events)
+                timings['duplicates'] = time.perf_counter() - start
+                self.metrics.observe_frame(timings, attempts, len(faces), filtered, quality)
+                result.set_result((faces, quality) if quality_gate is not None else faces)
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    self._replace_broken_pool(pool)
+                result.set_exception(e)
+
+        # Cancelling the returned future drops the job from the pool queue (and frees its slot)
+        result.add_done_callback(lambda f: f.cancelled() and worker_future.cancel())
+        worker_future.add_done_callback(_finish)
+        return result
+
+    def backend_stats(self, context=None):
+        """Detector success rate / latency per backend for ``context`` (None = all contexts)."""
+        return self.scheduler.stats(context)
+
+    # ---------------- Metrics ----------------
+
+    def _open(self, image):
+        """_to_pil() at PROCESS_MAX_SIDE, recorded as the 'open' stage."""
+        start = time.perf_counter()
+        image = _to_pil(image, PROCESS_MAX_SIDE)
+        self.metrics.observe("faceengine_stage_seconds", time.perf_counter() - start, stage="open")
+        return image
+
+    def _observe_frame(self, frame):
+        self.metrics.observe_frame(frame.timings, frame.attempts, len(frame.faces), frame.filtered, frame.quality)
+
+    def metrics_text(self):
+        """Prometheus text format: self.metrics plus cache, index and worker-queue gauges."""
+        cache = self.cache.stats()
+        gauges = {
+            "faceengine_cache_hits_total": ("counter", "Content cache hits (images, results).",
+                                            cache['hits']),
+            "faceengine_cache_misses_total": ("counter", "Content cache misses.", cache['misses']),
+            "faceengine_cache_bytes": ("gauge", "Bytes held by the content cache.", cache['bytes']),
+            "faceengine_cache_entries": ("gauge", "Entries in the content cache.", cache['entries']),
+            "faceengine_known_faces": ("gauge", "Embeddings in the duplicate index.", len(self.known_meta)),
+        }
+        if self.pool is not None:
+            gauges["faceengine_pool_pending"] = ("gauge", "Images queued or running on worker processes.",
+                                                 self.pool.pending)
+        return self.metrics.render(gauges)
+
+    def write_metrics(self, path):
+        """Write metrics_text() to ``path`` once (e.g. at the end of a batch run)."""
+        write_textfile(path, self.metrics_text())
+
+    def export_metrics(self, port=None, path=None, interval=15.0, addr="127.0.0.1"):
+        """Serve metrics_text() at http://addr:port/metrics and/or rewrite ``path`` every ``interval`` s.
+
+        Safe to call from every session: each exporter is started once per engine.
+        """
+        with self._state_lock:
+            if port and 'http' not in self._metrics_exports:
+                try:
+                    self._metrics_exports['http'] = serve(self.metrics_text, int(port), addr)
+                except OSError as e:
+                    print(f"Metrics endpoint on {addr}:{port} failed: {e}")
+                    self._metrics_exports['http'] = None
+            if path and 'file' not in self._metrics_exports:
+                self._metrics_exports['file'] = start_textfile_writer(self.metrics_text, path, interval)
+
+    # ---------------- Warm-up ----------------
+
+    def warmup(self, detector_backends=('opencv',), skip_gender=False):
+        """Load every model the first check-in needs and run each once on a dummy input.
+
+        Without this DeepFace builds the detector, Facenet512 and the gender
+        model lazily inside the first request (and TensorFlow traces the graph
+        on its first call), so the first frame after a server start takes
+        seconds. Returns {step: seconds}, also kept in ``warmup_report``.
+        This is also where DeepFace/TensorFlow get imported when warmup runs
+        first (e.g. on the start_warmup() thread).
+        """
+        report = {}
+        total_start = time.perf_counter()
+        if load_deepface() is None:
+            self.warmup_report = report
+            return report
+        report['import:deepface'] = time.perf_counter() - total_start
+        dummy = np.zeros((GENDER_INPUT_SIZE[0], GENDER_INPUT_SIZE[1], 3), dtype=np.uint8)
+
+        for backend in detector_backends:
+            start = time.perf_counter()
+            try:
+                with self._inference_lock:
+                    DeepFace.extract_faces(img_path=dummy, detector_backend=backend, enforce_detection=False)
             except Exception as e:
-                print(f"DeepFace Error ({backend}): {e}")
-                last_error = e
+                print(f"Warmup: detector '{backend}' failed: {e}")
+            report[f'detector:{backend}'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        embedding_model = self._get_embedding_model()
+        try:
+            if embedding_model is not None:
+                _, input_size = embedding_model
+                self.embed_faces([np.zeros((input_size[0], input_size[1], 3), dtype=np.float32)])
+            else:
+                with self._inference_lock:
+                    DeepFace.represent(img_path=dummy, model_name=self.model_name,
+                                       detector_backend='skip', enforce_detection=False)
+            self._model_loaded = True
+        except Exception as e:
+            print(f"Warmup: {self.model_name} failed: {e}")
+        report[f'embed:{self.model_name}'] = time.perf_counter() - start
+
+        if not skip_gender:
+            start = time.perf_counter()
+            self.classify_genders([dummy])
+            report['classify:gender'] = time.perf_counter() - start
+
+        report['total'] = time.perf_counter() - total_start
+        self.warmup_report = report
+        print("FaceEngine warmup: " + ", ".join(f"{k}={v:.2f}s" for k, v in report.items()))
+        return report
+
+    def start_warmup(self, **kwargs):
+        """Run warmup() on a daemon thread so the caller (e.g. the login page) is not blocked."""
+        with self._state_lock:
+            if self._warmup_thread is None:
+                self._warmup_thread = threading.Thread(target=self.warmup, kwargs=kwargs,
+                                                       name="face-engine-warmup", daemon=True)
+                self._warmup_thread.start()
+        return self._warmup_thread
+
+    def wait_for_warmup(self, timeout=None):
+        """Block until a warmup started with start_warmup() is done. Returns True if finished."""
+        if self._warmup_thread is None:
+            return self.warmup_report is not None
+        self._warmup_thread.join(timeout)
+        return not self._warmup_thread.is_alive()
+
+    # ---------------- Stages: decode -> detect/align -> embed -> classify ----------------
+
+    def run_stages(self, image_pil, detector_backend='opencv', context=None, events=None, quality_gate=None):
+        """Decode, detect/align, embed and duplicate-check one image.
+
+        Returns the FrameState with every intermediate result and per-stage
+        timings; gender (the classify stage) is filled in by process_images.
+        """
+        frame = self.detect_stages(image_pil, detector_backend, context, quality_gate)
+        self.embed(frame)
+
+        # Duplicate Detection using Cosine Similarity (more robust for Facenet512)
+        start = time.perf_counter()
+        self.mark_duplicates(frame.faces, events)
+        frame.timings['duplicates'] = time.perf_counter() - start
+        return frame
+
+    def detect_stages(self, image_pil, detector_backend='opencv', context=None, quality_gate=None,
+                      max_attempts=None):
+        """Decode and detect/align one image, walking the detector fallback plan.
+
+        Faces are not embedded yet (``frame.aligned`` holds their input), except
+        on DeepFace versions without a raw model, where detection and embedding
+        are one represent() call and ``frame.aligned`` stays empty.
+        A ``quality_gate`` checks the frame before detection and the face sizes
+        after it; a rejected frame comes back without faces and with the
+        reasons in ``frame.quality``. ``max_attempts`` caps the fallback plan
+        for this frame (1 = only the plan's best backend).
+        """
+        frame = FrameState()
+        if load_deepface() is None:
+            return frame
+
+        self.decode(frame, image_pil)
+        if quality_gate is not None:
+            start = time.perf_counter()
+            frame.quality = quality_gate.check_image(frame.img_bgr)
+            frame.timings['quality'] = time.perf_counter() - start
+            if frame.quality['status'] != OK:
+                return frame
+
+        if self._get_embedding_model() is None:
+            # This DeepFace version does not expose the raw model: fall back to
+            # the monolithic represent() call per backend
+            self._represent_stages(frame, detector_backend, context, max_attempts)
+        else:
+            for backend in self.scheduler.plan(detector_backend, context)[:max_attempts]:
+                if self.detect(frame, backend, context):
+                    break
+
+        if quality_gate is not None:
+            sizes = [(round((right - left) * frame.scale), round((bottom - top) * frame.scale))
+                     for top, right, bottom, left in (face['bbox'] for face in frame.faces)]
+            if quality_gate.check_faces(frame.quality, sizes)['status'] != OK:
+                frame.faces, frame.crops, frame.aligned = [], [], []
+        return frame
+
+    def decode(self, frame, image_pil):
+        """Stage 1: PIL image -> resized BGR array (what DeepFace expects) and its scale."""
+        start = time.perf_counter()
+        # Draft-decoded JPEGs (open_image) carry their full-resolution size
+        frame.size = image_pil.info.get('original_size', image_pil.size)
+        frame.img_bgr, scale = self._preprocess_image(image_pil)
+        frame.scale = scale * max(image_pil.size) / max(frame.size)
+        frame.timings['decode'] = time.perf_counter() - start
+
+    def detect(self, frame, backend, context=None):
+        """Stage 2: detect and align faces with one backend.
+
+        Results are cached on the frame per backend, and only faces passing
+        the face filter and size check are kept for embedding. Returns True if
+        any face was found, even if all of them were filtered out.
+        """
+        if backend not in frame.detections:
+            with self._inference_lock:
+                start = time.perf_counter()
+                try:
+                    face_objs = DeepFace.extract_faces(
+                        img_path=frame.img_bgr,
+                        detector_backend=backend,
+                        enforce_detection=True,
+                        align=True  # Alignment improves accuracy
+                    )
+                except ValueError:
+                    face_objs = []
+                except Exception as e:
+                    print(f"DeepFace Error ({backend}): {e}")
+                    self.metrics.inc("faceengine_errors_total", stage="detect")
+                    face_objs = []
+                elapsed = time.perf_counter() - start
+            self.scheduler.record(backend, bool(face_objs), elapsed, context)
+            frame.attempts.append((backend, bool(face_objs), elapsed))
+            frame.timings['detect'] = frame.timings.get('detect', 0.0) + elapsed
+            frame.detections[backend] = face_objs
+
+        face_objs = frame.detections[backend]
+        if not face_objs:
+            return False
+
+        frame.backend = backend
+        frame.faces, frame.crops, frame.aligned = [], [], []
+        for face_obj in self._select_faces(frame, face_objs):
+            face_data = self._accept_face(frame, face_obj.get('facial_area', {}))
+            if face_data is None:
                 continue
+            frame.aligned.append(face_obj['face'])
+        return True
+
+    def embed(self, frame):
+        """Stage 3: one batched embedding pass over the accepted, aligned faces."""
+        if not frame.aligned:
+            return
+        start = time.perf_counter()
+        try:
+            embeddings = self.embed_faces(frame.aligned)
+        except Exception as e:
+            print(f"Embedding Error: {e}")
+            self.metrics.inc("faceengine_errors_total", stage="embed")
+            frame.faces, frame.crops, frame.aligned = [], [], []
+            return
+        for face_data, embedding in zip(frame.faces, embeddings):
+            face_data["encoding"] = embedding.tolist()
+        self._model_loaded = True
+        frame.timings['embed'] = time.perf_counter() - start
+
+    def embed_faces(self, aligned_faces):
+        """Embed aligned faces (RGB floats in 0-1, as DeepFace.extract_faces returns them).
+
+        Returns an (n, dim) float32 array; the recognition model runs once per batch.
+        """
+        model, input_size = self._get_embedding_model()
+        # DeepFace.represent flips the extracted face back to BGR before the model
+        batch = np.stack([_letterbox(face[:, :, ::-1], input_size) for face in aligned_faces])
+        with self._inference_lock:
+            return np.asarray(model.predict(batch, verbose=0), dtype=np.float32)
+
+    def _select_faces(self, frame, face_objs):
+        """Apply self.face_filter; background faces never reach embedding or gender."""
+        kept = self.face_filter.select(face_objs)
+        frame.filtered = len(face_objs) - len(kept)
+        return kept
+
+    def _accept_face(self, frame, area):
+        """Apply the face-area filter; on success append a face dict and its crop to the frame."""
+        x, y, w, h = area.get('x',0), area.get('y',0), area.get('w',0), area.get('h',0)
         
-        if embeddings_obj is None:
-            return []
+        # Check for invalid face area
+        H, W, _ = frame.img_bgr.shape
+        if w > W*0.9 and h > H*0.9:
+            return None
 
-        results = []
-        for face_obj in embeddings_obj:
-            if 'embedding' not in face_obj: continue
-            
-            embedding = face_obj['embedding']
-            area = face_obj.get('facial_area', {})
-            x, y, w, h = area.get('x',0), area.get('y',0), area.get('w',0), area.get('h',0)
-            
-            # Check for invalid face area
-            H, W, _ = img_np.shape
-            if w > W*0.9 and h > H*0.9:
+        # Create standard bbox format (top, right, bottom, left), in original-image pixels
+        top, right, bottom, left = (int(round(v / frame.scale)) for v in (y, x+w, y+h, x))
+        
+        face_data = {
+            "bbox": (top, right, bottom, left),
+            "encoding": None,
+            "gender": "Unknown",
+            "confidence": 0.0,
+            "is_duplicate": False,
+            "duplicate_info": None
+        }
+        frame.faces.append(face_data)
+        # RGB copy: the work buffer is reused by this thread's next frame
+        frame.crops.append(frame.img_bgr[y:y+h, x:x+w, ::-1].copy())
+        return face_data
+
+    def _represent_stages(self, frame, detector_backend, context, max_attempts=None):
+        """Legacy path: detection + alignment + embedding in one DeepFace.represent per backend."""
+        for backend in self.scheduler.plan(detector_backend, context)[:max_attempts]:
+            with self._inference_lock:
+                start = time.perf_counter()
+                try:
+                    embeddings_obj = DeepFace.represent(
+                        img_path=frame.img_bgr, 
+                        model_name=self.model_name, 
+                        detector_backend=backend,
+                        enforce_detection=True,
+                        align=True
+                    )
+                except ValueError:
+                    embeddings_obj = []
+                except Exception as e:
+                    print(f"DeepFace Error ({backend}): {e}")
+                    self.metrics.inc("faceengine_errors_total", stage="detect")
+                    embeddings_obj = []
+                elapsed = time.perf_counter() - start
+            self.scheduler.record(backend, bool(embeddings_obj), elapsed, context)
+            frame.attempts.append((backend, bool(embeddings_obj), elapsed))
+            frame.timings['detect'] = frame.timings.get('detect', 0.0) + elapsed
+            if not embeddings_obj:
                 continue
 
-            # Create standard bbox format (top, right, bottom, left)
-            top, right, bottom, left = y, x+w, y+h, x
-            
-            face_data = {
-                "bbox": (top, right, bottom, left),
-                "encoding": embedding,
-                "gender": "Unknown",
-                "confidence": 0.0,
-                "is_duplicate": False,
-                "duplicate_info": None
-            }
-            
-            # Gender Detection - optional for speed optimization
-            if not skip_gender:
-                face_crop = img_np[y:y+h, x:x+w]
-                
-                if face_crop.size > 0:
-                    try:
-                        analysis = DeepFace.analyze(
-                            img_path=face_crop,
-                            actions=['gender'],
-                            detector_backend='skip',
-                            enforce_detection=False,
-                            silent=True
-                        )
-                        
-                        if isinstance(analysis, list): analysis = analysis[0]
-                        g_res = analysis['dominant_gender']
-                        if g_res == "Man": g_res = "Male"
-                        if g_res == "Woman": g_res = "Female"
-                        
-                        face_data["gender"] = g_res
-                        face_data["confidence"] = analysis['gender'][analysis['dominant_gender']]
-                    except Exception:
-                        face_data["gender"] = "Unknown"
-
-            # Duplicate Detection using Cosine Similarity (more robust for Facenet512)
-            if self.known_encodings:
-                current_vec = np.array(embedding)
-                current_norm = np.linalg.norm(current_vec)
-                
-                if current_norm > 0:
-                    # Vectorized similarity computation for performance
-                    known_matrix = np.array(self.known_encodings)
-                    known_norms = np.linalg.norm(known_matrix, axis=1)
-                    valid_mask = known_norms > 0
-                    
-                    if valid_mask.any():
-                        similarities = np.zeros(len(known_matrix))
-                        similarities[valid_mask] = np.dot(known_matrix[valid_mask], current_vec) / (known_norms[valid_mask] * current_norm)
-                        
-                        best_match_idx = np.argmax(similarities)
-                        best_similarity = similarities[best_match_idx]
-                        
-                        # Threshold: 0.65 for Facenet512 (optimized for accuracy)
-                        if best_similarity > 0.65:
-                            face_data["is_duplicate"] = True
-                            face_data["duplicate_info"] = self.known_ids[best_match_idx]
-                            face_data["match_confidence"] = float(best_similarity)
+            self._model_loaded = True
+            frame.backend = backend
+            for face_obj in self._select_faces(frame, embeddings_obj):
+                if 'embedding' not in face_obj: continue
+                face_data = self._accept_face(frame, face_obj.get('facial_area', {}))
+                if face_data is not None:
+                    face_data["encoding"] = face_obj['embedding']
+            return
+
+    def _get_embedding_model(self):
+        """(model, input size) for self.model_name, or None if DeepFace hides the raw model."""
+        if self._embedding_model is None:
+            with self._model_lock:
+                if self._embedding_model is None:
+                    model = self._load_exported_model(self.model_name)
+                    self._embedding_model = _load_embedding_model(self.model_name, model) or False
+        return self._embedding_model or None
+
+    def _load_exported_model(self, name):
+        """ONNX export of ``name`` when this engine runs an onnx backend, else None (use Keras)."""
+        if self.inference_backend == "keras":
+            return None
+        from onnx_backend import load_model
+
+        return load_model(self.model_dir, name, int8=self.inference_backend == "onnx-int8")
+
+    def classify_genders(self, crops, batch_size=GENDER_BATCH_SIZE):
+        """Stage 4: classify many face crops in batched forward passes.
+
+        Returns one (gender, confidence %) tuple per crop, ("Unknown", 0.0) for empty crops.
+        """
+        out = [("Unknown", 0.0)] * len(crops)
+        valid = [i for i, crop in enumerate(crops) if crop is not None and crop.size > 0]
+        if not valid or load_deepface() is None:
+            return out
+
+        model = self._get_gender_model()
+        if model is None:
+            # This DeepFace version does not expose the raw model; classify one by one
+            for i in valid:
+                out[i] = self._analyze_gender(crops[i])
+            return out
+
+        for start in range(0, len(valid), batch_size):
+            chunk = valid[start:start + batch_size]
+            batch = np.stack([_letterbox(crops[i], GENDER_INPUT_SIZE) for i in chunk])
+            try:
+                with self._inference_lock:
+                    probs = np.asarray(model.predict(batch, verbose=0))
+            except Exception as e:
+                print(f"Gender batch error: {e}")
+                self.metrics.inc("faceengine_errors_total", stage="classify")
+                for i in chunk:
+                    out[i] = self._analyze_gender(crops[i])
+                continue
+            for i, p in zip(chunk, probs):
+                dominant = int(np.argmax(p))
+                out[i] = (GENDER_LABELS[dominant], float(p[dominant]) * 100)
+        return out
+
+    def _get_gender_model(self):
+        if self._gender_model is None:
+            with self._model_lock:
+                if self._gender_model is None:
+                    model = self._load_exported_model("Gender") or _build_deepface_model("Gender", "facial_attribute")
+                    self._gender_model = model if model is not None else False
+        return self._gender_model or None
+
+    def _analyze_gender(self, face_crop):
+        """Single-crop gender via DeepFace.analyze (fallback for the batched path)."""
+        try:
+            with self._inference_lock:
+                analysis = DeepFace.analyze(
+                    img_path=face_crop,
+                    actions=['gender'],
+                    detector_backend='skip',
+                    enforce_detection=False,
+                    silent=True
+                )
             
-            results.append(face_data)
+            if isinstance(analysis, list): analysis = analysis[0]
+            g_res = analysis['dominant_gender']
+            if g_res == "Man": g_res = "Male"
+            if g_res == "Woman": g_res = "Female"
             
-        return results
+            return g_res, analysis['gender'][analysis['dominant_gender']]
+        except Exception:
+            return "Unknown", 0.0
+
+
+class FrameState:
+    """Intermediate results for one image as it moves through the engine stages."""
+
+    def __init__(self):
+        self.img_bgr = None       # resized BGR for DeepFace; a view of the thread's work buffer
+        self.size = None          # original (width, height)
+        self.scale = 1.0          # working pixels per original pixel
+        self.detections = {}      # backend -> DeepFace.extract_faces output (cached per backend)
+        self.backend = None       # backend whose detections were accepted
+        self.faces = []           # face dicts returned to callers
+        self.crops = []           # RGB crop per face (gender input)
+        self.aligned = []         # aligned face per face (embedding input)
+        self.timings = {}         # stage -> seconds
+        self.attempts = []        # (backend, found faces, seconds) per detector attempt
+        self.quality = None       # QualityGate report, when a gate was used
+        self.filtered = 0         # detections dropped by the engine's FaceFilter
+
+
+class FaceEngineView:
+    """Per-session handle on a shared FaceEngine.
+
+    Models, indexes and detector statistics live once in the engine; the view
+    only remembers which events belong to its session, so a login loads just
+    the shards that are missing and cross-event duplicate checks stay within
+    the session's own events. Anything else is delegated to the engine.
+    """
+
+    def __init__(self, engine, event_ids=()):
+        self.engine = engine
+        self.event_ids = set(event_ids)
+
+    def __getattr__(self, name):
+        return getattr(self.engine, name)
+
+    def load_known_faces(self, events_data):
+        self.event_ids = set(events_data)
+        for evt_id, event in events_data.items():
+            if not self.engine.has_event(evt_id):
+                self.engine.load_event_faces(evt_id, event.get('data', []))
+
+    def load_event_faces(self, event_id, records):
+        self.event_ids.add(event_id)
+        self.engine.load_event_faces(event_id, records)
+
+    def add_known_face(self, encoding, meta):
+        self.event_ids.add(meta.get('event_id'))
+        return self.engine.add_known_face(encoding, meta)
+
+    def find_duplicate(self, encoding, event_id=ALL_EVENTS, threshold=DUPLICATE_THRESHOLD):
+        return self.engine.find_duplicate(encoding, event_id=event_id, threshold=threshold, events=self.event_ids)
+
+    def process_image(self, image_pil, detector_backend='opencv', skip_gender=False, context=None,
+                      quality_gate=None):
+        return self.engine.process_image(image_pil, detector_backend=detector_backend, skip_gender=skip_gender,
+                                         context=context, events=self.event_ids, quality_gate=quality_gate)
+
+    def process_images(self, images, detector_backend='opencv', skip_gender=False, context=None,
+                       quality_gate=None):
+        return self.engine.process_images(images, detector_backend=detector_backend, skip_gender=skip_gender,
+                                          context=context, events=self.event_ids, quality_gate=quality_gate)
+
+    def submit(self, image, detector_backend='opencv', skip_gender=False, context=None, timeout=None,
+               quality_gate=None):
+        return self.engine.submit(image, detector_backend, skip_gender, context, events=self.event_ids, timeout=timeout,
+                                  quality_gate=quality_gate)
+
+    def process_image_bytes(self, data, detector_backend='opencv', skip_gender=False, context=None, key=None,
+                            quality_gate=None):
+        return self.engine.process_image_bytes(data, detector_backend=detector_backend, skip_gender=skip_gender,
+                                               context=context, events=self.event_ids, key=key,
+                                               quality_gate=quality_gate)
+
+    def open_stream(self, detector_backend='opencv', skip_gender=False, context=None, quality_gate=None,
+                    **tracker_kwargs):
+        return self.engine.open_stream(detector_backend=detector_backend, skip_gender=skip_gender, context=context,
+                                       events=self.event_ids, quality_gate=quality_gate, **tracker_kwargs)
+
+    def iter_process(self, items, detector_backend='opencv', skip_gender=False, context=None,
+                     workers=None, window=None):
+        return iter_inference(self, items, detector_backend=detector_backend, skip_gender=skip_gender,
+                              context=context, workers=workers, window=window)
+
+
+_shared_engine = None
+_shared_engine_lock = threading.Lock()
+
+
+def load_deepface():
+    """Import DeepFace on first call (thread-safe); returns the module, or None if unavailable."""
+    global DeepFace, DEEPFACE_IMPORT_SECONDS
+    if DeepFace is None and DEEPFACE_IMPORT_SECONDS is None:
+        with _deepface_lock:
+            if DeepFace is None and DEEPFACE_IMPORT_SECONDS is None:
+                start = time.perf_counter()
+                try:
+                    from deepface import DeepFace as module
+                    DeepFace = module
+                except ImportError:
+                    print("DeepFace is not installed; face detection is disabled")
+                DEEPFACE_IMPORT_SECONDS = time.perf_counter() - start
+    return DeepFace
+
+
+def get_shared_engine(**kwargs):
+    """The process-wide FaceEngine, created on first call (kwargs are used only then)."""
+    global _shared_engine
+    if _shared_engine is None:
+        with _shared_engine_lock:
+            if _shared_engine is None:
+                _shared_engine = FaceEngine(**kwargs)
+    return _shared_engine
+
+
+def iter_inference(engine, items, detector_backend='opencv', skip_gender=False, context=None,
+                   workers=None, window=None):
+    """Run inference over ``(source, image)`` items concurrently.
+
+    ``image`` is anything FaceEngine.submit accepts (PIL image, RGB array or
+    encoded bytes). Yields ``(source, faces, error)`` in input order.
+    ``items`` is consumed lazily, so only about ``window`` images are held
+    in memory at once. Uses the engine's worker processes when running,
+    otherwise a thread pool of ``workers`` threads; those share the engine's
+    models, so they overlap decoding, resizing and duplicate checks while
+    the model calls themselves take turns (see FaceEngine._inference_lock).
+    Start worker processes for parallel inference.
+    """
+    pool = getattr(engine, 'pool', None)
+    if pool is not None:
+        workers = pool.workers
+        executor = None
+    else:
+        workers = workers or max(1, min(4, os.cpu_count() or 1))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-inference")
+    window = window or workers * 2
+
+    def _infer(data):
+        return engine.process_image(engine._open(data), detector_backend=detector_backend,
+                                    skip_gender=skip_gender, context=context)
+
+    in_flight = deque()
+    try:
+        for source, data in items:
+            if executor is None:
+                future = engine.submit(data, detector_backend, skip_gender, context)
+            else:
+                future = executor.submit(_infer, data)
+            in_flight.append((source, future))
+            if len(in_flight) >= window:
+                yield _collect_result(*in_flight.popleft())
+        while in_flight:
+            yield _collect_result(*in_flight.popleft())
+    finally:
+        # Reached when the consumer stops early (e.g. the hall is full)
+        for _, future in in_flight:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _collect_result(source, future):
+    try:
+        return source, future.result(), None
+    except Exception as e:
+        return source, [], e
+
+
+def _without_duplicate_info(face):
+    face = dict(face, is_duplicate=False, duplicate_info=None)
+    face.pop("match_confidence", None)
+    return face
+
+
+def open_image(data, max_side=None):
+    """Decode image bytes; with ``max_side`` JPEGs are decoded at reduced scale.
+
+    PIL's draft mode lets libjpeg skip straight to 1/2, 1/4 or 1/8 scale
+    (never below ``max_side`` on the longest side), so a 12MP phone photo
+    bound for PROCESS_MAX_SIDE decodes in a fraction of the time and memory.
+    """
+    image = Image.open(io.BytesIO(data))
+    if max_side and image.format == 'JPEG':
+        w, h = image.size
+        if max(w, h) > max_side:
+            scale = max_side / max(w, h)
+            image.draft('RGB', (int(np.ceil(w * scale)), int(np.ceil(h * scale))))
+            # Face boxes are still reported in full-resolution pixels
+            image.info['original_size'] = (w, h)
+    image.load()
+    return image
+
+
+def image_scale(image):
+    """Pixels of ``image`` per original pixel (below 1 for draft-decoded JPEGs from open_image)."""
+    return image.width / image.info.get('original_size', image.size)[0]
+
+
+def _to_pil(image, max_side=None):
+    """Accept a PIL image, an RGB array or encoded image bytes (see open_image for ``max_side``)."""
+    if isinstance(image, (bytes, bytearray)):
+        return open_image(image, max_side)
+    if isinstance(image, np.ndarray):
+        return Image.fromarray(image)
+    return image
+
+
+def _build_deepface_model(model_name, task):
+    """Return the raw Keras model behind a DeepFace model name, or None if it cannot be reached."""
+    if load_deepface() is None or not hasattr(DeepFace, "build_model"):
+        return None
+    try:
+        try:
+            client = DeepFace.build_model(model_name=model_name, task=task)
+        except TypeError:
+            client = DeepFace.build_model(model_name)  # deepface < 0.0.93
+    except Exception as e:
+        print(f"{model_name} model unavailable for batching: {e}")
+        return None
+    model = getattr(client, "model", client)
+    return model if hasattr(model, "predict") else None
+
+
+def _load_embedding_model(model_name, model=None):
+    """(model, (h, w) input size) for a recognition model, or None.
+
+    ``model`` is an already loaded replacement (e.g. an ONNX export);
+    otherwise DeepFace's Keras model is built.
+    """
+    if not hasattr(DeepFace, "extract_faces"):
+        return None
+    if model is None:
+        model = _build_deepface_model(model_name, "facial_recognition")
+    if model is None:
+        return None
+    try:
+        input_size = tuple(int(d) for d in model.input_shape[1:3])
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return model, input_size
+
+
+_thread_buffers = threading.local()
+
+
+def _work_buffer(shape):
+    """A uint8 array of ``shape`` backed by a per-thread buffer that only grows.
+
+    Valid until the same thread asks for another one.
+    """
+    size = int(np.prod(shape))
+    buf = getattr(_thread_buffers, 'buf', None)
+    if buf is None or buf.size < size:
+        buf = _thread_buffers.buf = np.empty(max(size, PROCESS_MAX_SIDE * PROCESS_MAX_SIDE * 3), dtype=np.uint8)
+    return buf[:size].reshape(shape)
+
+
+def _letterbox(img, target_size):
+    """Aspect-preserving resize + zero padding to ``target_size`` (h, w), scaled to 0-1 floats.
+
+    Mirrors DeepFace's own resize_image, so batched inputs match what
+    DeepFace.represent / DeepFace.analyze feed their models.
+    """
+    scale = 1 / 255.0 if np.issubdtype(img.dtype, np.integer) else 1.0
+    img = np.ascontiguousarray(img, dtype=np.float32)
+    h, w = img.shape[:2]
+    factor = min(target_size[0] / h, target_size[1] / w)
+    resized = cv2.resize(img, (max(1, int(w * factor)), max(1, int(h * factor))))
+    diff_h = target_size[0] - resized.shape[0]
+    diff_w = target_size[1] - resized.shape[1]
+    padded = np.pad(
+        resized,
+        ((diff_h // 2, diff_h - diff_h // 2), (diff_w // 2, diff_w - diff_w // 2), (0, 0)),
+        "constant",
+    )
+    if padded.shape[:2] != tuple(target_size):
+        padded = cv2.resize(padded, (target_size[1], target_size[0]))
+    return padded * scale if scale != 1.0 else padded
+
 
 def draw_results(image_pil, results):
     img_cv = np.array(image_pil)
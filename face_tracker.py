@@ -0,0 +1,264 @@
+"""Face tracking for continuous camera input.
+
+Snapshots run detection, embedding and gender for every face every time.
+In stream mode FaceEngine still detects on each frame (cheap), but matches
+the boxes to the tracks of the previous frames (IoU first, then centroid
+distance) and only embeds and classifies faces that start a new track.
+
+    stream = engine.open_stream(context="gate-1")
+    for frame in frames:
+        for face in stream.process_frame(frame):
+            if face['is_new_track']:
+                ...  # face['track_id'], face['encoding'], face['gender']
+
+    python face_tracker.py 0                  # webcam 0, one JSON line per new track
+    python face_tracker.py gate.mp4 --backend ssd
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from quality_gate import OK
+
+
+def iou(a, b):
+    """Intersection over union of two (top, right, bottom, left) boxes."""
+    top, bottom = max(a[0], b[0]), min(a[2], b[2])
+    left, right = max(a[3], b[3]), min(a[1], b[1])
+    inter = max(0, bottom - top) * max(0, right - left)
+    if inter == 0:
+        return 0.0
+    area_a = (a[2] - a[0]) * (a[1] - a[3])
+    area_b = (b[2] - b[0]) * (b[1] - b[3])
+    return inter / float(area_a + area_b - inter)
+
+
+def _centroid(box):
+    top, right, bottom, left = box
+    return (left + right) / 2.0, (top + bottom) / 2.0
+
+
+class Track:
+    def __init__(self, track_id, bbox, frame_no):
+        self.track_id = track_id
+        self.bbox = bbox
+        self.face = None          # face dict computed when the track started
+        self.hits = 1
+        self.missed = 0
+        self.first_frame = frame_no
+        self.last_frame = frame_no
+
+
+class FaceTracker:
+    """Greedy IoU + centroid tracker over face boxes.
+
+    A detection continues a track if its IoU with the track's last box is at
+    least ``iou_threshold``; failing that, if its centre moved less than
+    ``max_distance`` times the track's box size (fast walkers). Tracks unseen
+    for more than ``max_missed`` frames are dropped.
+    """
+
+    def __init__(self, iou_threshold=0.3, max_distance=0.6, max_missed=15):
+        self.iou_threshold = iou_threshold
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.tracks = {}  # track id -> Track
+        self.frame_no = 0
+        self._next_id = 1
+
+    def update(self, bboxes):
+        """Match one frame's boxes to tracks. Returns [(Track, is_new)] in box order."""
+        self.frame_no += 1
+        tracks = list(self.tracks.values())
+        assigned = [None] * len(bboxes)
+        free = set(range(len(tracks)))
+
+        # IoU first, best pairs first
+        pairs = sorted(((iou(box, t.bbox), d, ti) for d, box in enumerate(bboxes) for ti, t in enumerate(tracks)),
+                       reverse=True)
+        for score, d, ti in pairs:
+            if score < self.iou_threshold:
+                break
+            if assigned[d] is None and ti in free:
+                assigned[d] = ti
+                free.discard(ti)
+
+        # Then centroid distance, relative to the track's box size
+        pairs = []
+        for d, box in enumerate(bboxes):
+            if assigned[d] is not None:
+                continue
+            cx, cy = _centroid(box)
+            for ti in free:
+                t = tracks[ti]
+                tx, ty = _centroid(t.bbox)
+                size = max(t.bbox[2] - t.bbox[0], t.bbox[1] - t.bbox[3], 1)
+                dist = np.hypot(cx - tx, cy - ty) / size
+                if dist <= self.max_distance:
+                    pairs.append((dist, d, ti))
+        for dist, d, ti in sorted(pairs):
+            if assigned[d] is None and ti in free:
+                assigned[d] = ti
+                free.discard(ti)
+
+        out = []
+        for d, box in enumerate(bboxes):
+            if assigned[d] is None:
+                track = Track(self._next_id, box, self.frame_no)
+                self._next_id += 1
+                self.tracks[track.track_id] = track
+                out.append((track, True))
+            else:
+                track = tracks[assigned[d]]
+                track.bbox = box
+                track.hits += 1
+                track.missed = 0
+                track.last_frame = self.frame_no
+                out.append((track, False))
+
+        for ti in free:
+            track = tracks[ti]
+            track.missed += 1
+            if track.missed > self.max_missed:
+                del self.tracks[track.track_id]
+        return out
+
+    def reset(self):
+        self.tracks.clear()
+        self.frame_no = 0
+
+
+class FaceStream:
+    """Per-frame face results with track ids, from FaceEngine.open_stream()."""
+
+    def __init__(self, engine, detector_backend='opencv', skip_gender=False, context=None, events=None,
+                 tracker=None, quality_gate=None):
+        self.engine = engine
+        self.detector_backend = detector_backend
+        self.skip_gender = skip_gender
+        self.context = context
+        self.events = events
+        self.tracker = tracker or FaceTracker()
+        self.quality_gate = quality_gate
+        self.embedded = 0  # faces that went through embedding (one per new track)
+        self.deferred = 0  # frames turned away by the quality gate
+        self.last_quality = None
+
+    def process_frame(self, image):
+        """Faces in one frame (PIL image, RGB array or encoded bytes).
+
+        Each face dict is process_image()'s plus 'track_id' and
+        'is_new_track'; faces of an existing track reuse the encoding and
+        gender computed when the track started. A track whose embedding
+        failed is embedded again on its next frame, until one succeeds. The
+        duplicate check is redone every frame so it reflects faces
+        registered meanwhile. Frames the quality gate rejects are skipped
+        without ageing the tracks (the next frame usually is fine); see
+        ``last_quality``. While no track is live (an empty scene) only the
+        best detector runs, not the whole fallback plan.
+        """
+        from face_engine import _to_pil, _without_duplicate_info
+
+        engine = self.engine
+        start = time.perf_counter()
+        image = _to_pil(image)
+        opened = time.perf_counter() - start
+        frame = engine.detect_stages(image, self.detector_backend, self.context, self.quality_gate,
+                                     max_attempts=None if self.tracker.tracks else 1)
+        frame.timings['open'] = opened
+        self.last_quality = frame.quality
+        if frame.quality is not None and frame.quality['status'] != OK:
+            self.deferred += 1
+            engine._observe_frame(frame)
+            return []
+        matches = self.tracker.update([face['bbox'] for face in frame.faces])
+
+        # Tracks without a face result yet: new ones, and any whose embedding failed
+        if frame.aligned:
+            new = [i for i, (track, _) in enumerate(matches) if track.face is None]
+        else:
+            # Legacy DeepFace: embeddings came with the detections
+            new = []
+            for i, (track, _) in enumerate(matches):
+                if track.face is None and frame.faces[i]["encoding"] is not None:
+                    track.face = _without_duplicate_info(frame.faces[i])
+
+        if new:
+            start = time.perf_counter()
+            try:
+                embeddings = engine.embed_faces([frame.aligned[i] for i in new])
+            except Exception as e:
+                print(f"Embedding Error: {e}")
+                engine.metrics.inc("faceengine_errors_total", stage="embed")
+                embeddings = None
+            frame.timings['embed'] = time.perf_counter() - start
+            if embeddings is not None:
+                start = time.perf_counter()
+                genders = ([("Unknown", 0.0)] * len(new) if self.skip_gender
+                           else engine.classify_genders([frame.crops[i] for i in new]))
+                if not self.skip_gender:
+                    frame.timings['classify'] = time.perf_counter() - start
+                for i, embedding, (gender, confidence) in zip(new, embeddings, genders):
+                    face = frame.faces[i]
+                    face["encoding"] = embedding.tolist()
+                    face["gender"] = gender
+                    face["confidence"] = confidence
+                    matches[i][0].face = _without_duplicate_info(face)
+                self.embedded += len(new)
+
+        faces = []
+        for face, (track, is_new) in zip(frame.faces, matches):
+            # Still unembedded (encoding None) tracks are reported as detected, and retried next frame
+            base = track.face if track.face is not None else _without_duplicate_info(face)
+            faces.append(dict(base, bbox=face['bbox'], track_id=track.track_id, is_new_track=is_new))
+        start = time.perf_counter()
+        engine.mark_duplicates(faces, self.events)
+        frame.timings['duplicates'] = time.perf_counter() - start
+        engine._observe_frame(frame)
+        return faces
+
+    def reset(self):
+        self.tracker.reset()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="camera index or video file")
+    parser.add_argument("--backend", default="opencv", help="preferred detector backend (default: opencv)")
+    parser.add_argument("--skip-gender", action="store_true", help="skip gender classification")
+    args = parser.parse_args(argv)
+
+    import cv2
+    from face_engine import FaceEngine
+
+    engine = FaceEngine()
+    engine.warmup(detector_backends=(args.backend,), skip_gender=args.skip_gender)
+    stream = engine.open_stream(detector_backend=args.backend, skip_gender=args.skip_gender)
+    capture = cv2.VideoCapture(int(args.source) if args.source.isdigit() else args.source)
+
+    frames = 0
+    start = time.perf_counter()
+    try:
+        while True:
+            ok, bgr = capture.read()
+            if not ok:
+                break
+            frames += 1
+            for face in stream.process_frame(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)):
+                if face['is_new_track']:
+                    print(json.dumps({"frame": frames, "track_id": face['track_id'], "bbox": list(face['bbox']),
+                                      "gender": face['gender'], "is_duplicate": face['is_duplicate']}), flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        capture.release()
+    elapsed = time.perf_counter() - start
+    print(f"{frames} frames in {elapsed:.1f}s ({frames / elapsed if elapsed else 0:.2f} fps), "
+          f"{stream.embedded} faces embedded", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
-import numpy as np
-from PIL import Image
 from datetime import datetime
 import time
 import random
@@ -11,7 +9,6 @@ import json
 import uuid
 import re
 import html as html_mod
-import hashlib
 try:
     from fpdf import FPDF
 except ImportError:
@@ -19,8 +16,8 @@ except ImportError:
     print("Warning: FPDF not found. Install 'fpdf' for PDF reports.")
 import base64
 import tempfile
+from concurrent.futures.process import BrokenProcessPool
 import plotly.express as px
-import cv2
 
 import os
 
@@ -29,6281 +26,157 @@ st.set_page_config(page_title="EquiVision — Gender Attendance AI", layout="wid
 
 # Custom Modules
 try:
-    from face_engine import FaceEngine
+    from face_engine import FaceEngineView, get_shared_engine, image_scale
+    from inference_pool import default_workers
+    from content_cache import content_key
+    from overlay import FaceOverlayRenderer
+    from quality_gate import FaceFilter, QualityGate
+    from rerun_profiler import profiled, record, render_diagnostics, timed
+    from theme_assets import (PREMIUM_HTML, PREMIUM_JS, THEME_CSS, load_asset, publish_asset, script_loader,
+                              style_loader, url_loader)
     from utils import SeatingManager, TeamManager, TeamBalancer
 except ImportError as e:
     st.error(f"Missing modules: {e}")
     st.stop()
 
 import db  # Database layer
+from batch_pipeline import run_batch
 
-# --- STATE INITIALIZATION ---
-if 'face_engine' not in st.session_state: st.session_state.face_engine = FaceEngine()
-if 'main_folders' not in st.session_state: st.session_state.main_folders = {}
-if 'events' not in st.session_state: st.session_state.events = {} 
-if 'current_user' not in st.session_state: st.session_state.current_user = None
-if 'user_id' not in st.session_state: st.session_state.user_id = None
-if 'page' not in st.session_state: st.session_state.page = "login"
-if 'current_event' not in st.session_state: st.session_state.current_event = None
-if 'subpage' not in st.session_state: st.session_state.subpage = None
-if 'upload_key' not in st.session_state: st.session_state.upload_key = 0
-if 'db_loaded' not in st.session_state: st.session_state.db_loaded = False
-if 'show_welcome' not in st.session_state: st.session_state.show_welcome = False
-
-def load_from_db():
-    """Sync events and folders from Supabase into session state."""
-    uid = st.session_state.user_id
-    if not uid: return
-    
-    # Load events
-    events_raw = db.get_events(uid)
-    for e in events_raw:
-        eid = e['id']
-        if eid not in st.session_state.events:
-            tm = e.get('team_members', '[]')
-            if isinstance(tm, str):
-                try: tm = json.loads(tm)
-                except (ValueError, json.JSONDecodeError): tm = []
-            elif tm is None: tm = []
-            
-            rl = e.get('roles', '[]')
-            if isinstance(rl, str):
-                try: rl = json.loads(rl)
-                except (ValueError, json.JSONDecodeError): rl = {}
-            elif rl is None: rl = {}
-            
-            st.session_state.events[eid] = {
-                'name': e.get('name', ''),
-                'date': e.get('date', ''),
-                'password': e.get('password', ''),
-                'hall_rows': e.get('hall_rows', 5),
-                'hall_cols': e.get('hall_cols', 10),
-                'cluster_size': e.get('cluster_size', 1),
-                'data': db.get_attendees(eid),
-                'roles': rl if isinstance(rl, dict) else {},
-                'team_members': tm if isinstance(tm, list) else []
-            }
-    
-    # Load folders
-    folders_raw = db.get_folders(uid)
-    for f in folders_raw:
-        fname = f.get('name', '')
-        if fname not in st.session_state.main_folders:
-            folder_event_ids = db.get_folder_events(f['id'])
-            st.session_state.main_folders[fname] = {
-                'date': f.get('date', ''),
-                'events': folder_event_ids,
-                'db_id': f['id']
-            }
-    
-    st.session_state.db_loaded = True
-    # Reload face encodings so duplicate detection works across server restarts
-    st.session_state.face_engine.load_known_faces(st.session_state.events)
-
-# --- CSS STYLES ---
-def local_css():
-    st.markdown("""
-    <style>
-        /* ═══════════════════════════════════════════════════════════════════
-           EQUIVISION — ULTRA-PREMIUM DESIGN SYSTEM v5.0
-           World-class glassmorphic interface with cinematic depth
-           ═══════════════════════════════════════════════════════════════════ */
-
-        /* FONT STACK — Optimized loading with display swap */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&family=Outfit:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&family=Space+Grotesk:wght@400;500;600;700&display=swap');
-
-        /* ══════════════ DESIGN TOKENS ══════════════ */
-        :root {
-            /* Primary spectrum */
-            --primary: #7C5CFC;
-            --primary-50: rgba(124, 92, 252, 0.05);
-            --primary-100: rgba(124, 92, 252, 0.10);
-            --primary-200: #C4B5FD;
-            --primary-300: #A78BFA;
-            --primary-400: #8B6FF8;
-            --primary-500: #7C5CFC;
-            --primary-600: #6D4AE6;
-            --primary-700: #5B34E8;
-            --primary-800: #4C1D95;
-            --primary-glow: rgba(124, 92, 252, 0.35);
-            --primary-glow-soft: rgba(124, 92, 252, 0.12);
-
-            /* Secondary spectrum */
-            --secondary: #34D399;
-            --secondary-100: rgba(52, 211, 153, 0.10);
-            --secondary-300: #6EE7B7;
-            --secondary-400: #4ADE80;
-            --secondary-500: #34D399;
-            --secondary-700: #059669;
-            --secondary-glow: rgba(52, 211, 153, 0.25);
-
-            /* Accent spectrum */
-            --accent: #F59E0B;
-            --accent-300: #FCD34D;
-            --accent-glow: rgba(245, 158, 11, 0.15);
-
-            /* Rose spectrum (for female indicators) */
-            --rose-400: #FB7185;
-            --rose-500: #F43F5E;
-            --rose-600: #E11D48;
-            --rose-glow: rgba(244, 63, 94, 0.25);
-
-            /* Sky spectrum (for other indicators) */
-            --sky-400: #38BDF8;
-            --sky-500: #0EA5E9;
-            --sky-glow: rgba(56, 189, 248, 0.25);
-
-            /* Surfaces — Deep space palette */
-            --bg-void: #060810;
-            --bg-deep: #0A0D16;
-            --bg-base: #0F1219;
-            --bg-elevated: #151922;
-            --bg-surface: #1A1F2B;
-            --bg-card: rgba(255, 255, 255, 0.022);
-            --bg-card-hover: rgba(255, 255, 255, 0.048);
-            --bg-card-active: rgba(124, 92, 252, 0.06);
-            --bg-input: rgba(0, 0, 0, 0.28);
-            --bg-input-hover: rgba(0, 0, 0, 0.35);
-            --bg-input-focus: rgba(0, 0, 0, 0.42);
-
-            /* Text hierarchy */
-            --text-primary: #F1F5F9;
-            --text-secondary: #94A3B8;
-            --text-muted: #64748B;
-            --text-faint: #475569;
-            --text-inverse: #0F172A;
-
-            /* Borders */
-            --border-invisible: rgba(255, 255, 255, 0.03);
-            --border-subtle: rgba(255, 255, 255, 0.055);
-            --border-default: rgba(255, 255, 255, 0.085);
-            --border-hover: rgba(124, 92, 252, 0.3);
-            --border-focus: rgba(124, 92, 252, 0.5);
-            --border-active: rgba(124, 92, 252, 0.6);
-
-            /* Radii */
-            --radius-xs: 6px;
-            --radius-sm: 10px;
-            --radius-md: 16px;
-            --radius-lg: 22px;
-            --radius-xl: 30px;
-            --radius-2xl: 40px;
-            --radius-full: 9999px;
-
-            /* Shadows — Layered depth system */
-            --shadow-xs: 0 1px 3px rgba(0,0,0,0.12);
-            --shadow-sm: 0 2px 8px rgba(0,0,0,0.18), 0 1px 2px rgba(0,0,0,0.08);
-            --shadow-md: 0 6px 24px rgba(0,0,0,0.22), 0 2px 6px rgba(0,0,0,0.12);
-            --shadow-lg: 0 12px 40px rgba(0,0,0,0.28), 0 4px 12px rgba(0,0,0,0.15);
-            --shadow-xl: 0 20px 60px rgba(0,0,0,0.35), 0 8px 20px rgba(0,0,0,0.18);
-            --shadow-glow-purple: 0 0 30px var(--primary-glow-soft), 0 0 60px rgba(124, 92, 252, 0.05);
-            --shadow-glow-green: 0 0 30px var(--secondary-100), 0 0 60px rgba(52, 211, 153, 0.05);
-            --shadow-card: 0 4px 20px rgba(0,0,0,0.18), 0 1px 3px rgba(0,0,0,0.1), inset 0 1px 0 rgba(255,255,255,0.03);
-            --shadow-card-hover: 0 16px 48px rgba(124, 92, 252, 0.12), 0 6px 16px rgba(0,0,0,0.18), inset 0 1px 0 rgba(255,255,255,0.06);
-
-            /* Transitions */
-            --ease-out: cubic-bezier(0.16, 1, 0.3, 1);
-            --ease-spring: cubic-bezier(0.34, 1.56, 0.64, 1);
-            --ease-smooth: cubic-bezier(0.4, 0, 0.2, 1);
-            --ease-bounce: cubic-bezier(0.68, -0.55, 0.265, 1.55);
-            --duration-instant: 0.08s;
-            --duration-fast: 0.15s;
-            --duration-normal: 0.28s;
-            --duration-slow: 0.45s;
-            --duration-glacial: 0.7s;
-
-            /* Spacing scale */
-            --space-1: 0.25rem;
-            --space-2: 0.5rem;
-            --space-3: 0.75rem;
-            --space-4: 1rem;
-            --space-5: 1.25rem;
-            --space-6: 1.5rem;
-            --space-8: 2rem;
-            --space-10: 2.5rem;
-            --space-12: 3rem;
-
-            /* Typography scale */
-            --text-xs: 0.75rem;
-            --text-sm: 0.875rem;
-            --text-base: 1rem;
-            --text-lg: 1.125rem;
-            --text-xl: 1.25rem;
-            --text-2xl: 1.5rem;
-            --text-3xl: 1.875rem;
-
-            /* Glass */
-            --glass-blur: 24px;
-            --glass-saturate: 1.8;
-            --glass-bg: rgba(255, 255, 255, 0.025);
-            --glass-border: rgba(255, 255, 255, 0.06);
-        }
-
-        /* ══════════════ GLOBAL FOUNDATION ══════════════ */
-        html {
-            scroll-behavior: smooth;
-            -webkit-font-smoothing: antialiased;
-            -moz-osx-font-smoothing: grayscale;
-            text-rendering: optimizeLegibility;
-            font-feature-settings: 'cv02', 'cv03', 'cv04', 'cv11';
-        }
-
-        body, .stApp {
-            background-color: var(--bg-void) !important;
-            color: var(--text-primary);
-            font-family: 'Outfit', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            font-weight: 400;
-            line-height: 1.65;
-            font-size: 15px;
-        }
-
-        /* Deep space ambient mesh — multi-layer */
-        .stApp {
-            background-image:
-                radial-gradient(ellipse 90% 70% at 3% 3%, rgba(124, 92, 252, 0.07) 0%, transparent 55%),
-                radial-gradient(ellipse 70% 55% at 97% 8%, rgba(52, 211, 153, 0.05) 0%, transparent 50%),
-                radial-gradient(ellipse 55% 45% at 50% 97%, rgba(245, 158, 11, 0.035) 0%, transparent 45%),
-                radial-gradient(ellipse 45% 35% at 75% 55%, rgba(124, 92, 252, 0.025) 0%, transparent 45%),
-                radial-gradient(ellipse 35% 25% at 20% 70%, rgba(244, 63, 94, 0.02) 0%, transparent 40%),
-                radial-gradient(ellipse 60% 40% at 40% 30%, rgba(56, 189, 248, 0.015) 0%, transparent 45%);
-            background-attachment: fixed;
-        }
-
-        /* Animated nebula overlay */
-        .stApp::before {
-            content: '';
-            position: fixed;
-            inset: 0;
-            background:
-                radial-gradient(circle 700px at 15% 25%, rgba(124, 92, 252, 0.035) 0%, transparent 100%),
-                radial-gradient(circle 500px at 85% 65%, rgba(52, 211, 153, 0.025) 0%, transparent 100%),
-                radial-gradient(circle 350px at 50% 90%, rgba(244, 63, 94, 0.015) 0%, transparent 100%);
-            pointer-events: none;
-            z-index: 0;
-            animation: nebulaBreath 25s ease-in-out infinite alternate;
-            will-change: transform;
-        }
-
-        @keyframes nebulaBreath {
-            0% { transform: translate3d(0, 0, 0) scale(1) rotate(0deg); opacity: 1; }
-            33% { transform: translate3d(-1.5%, 0.8%, 0) scale(1.015) rotate(0.3deg); opacity: 0.9; }
-            66% { transform: translate3d(0.8%, -0.5%, 0) scale(1.01) rotate(-0.2deg); opacity: 0.95; }
-            100% { transform: translate3d(0.5%, -0.8%, 0) scale(1.005) rotate(0.1deg); opacity: 1; }
-        }
-
-        /* Grain texture overlay for cinematic depth */
-        .stApp::after {
-            content: '';
-            position: fixed;
-            inset: 0;
-            background-image: url("data:image/svg+xml,%3Csvg viewBox='0 0 256 256' xmlns='http://www.w3.org/2000/svg'%3E%3Cfilter id='noise'%3E%3CfeTurbulence type='fractalNoise' baseFrequency='0.9' numOctaves='4' stitchTiles='stitch'/%3E%3C/filter%3E%3Crect width='100%25' height='100%25' filter='url(%23noise)' opacity='0.015'/%3E%3C/svg%3E");
-            pointer-events: none;
-            z-index: 0;
-            opacity: 0.4;
-            mix-blend-mode: overlay;
-        }
-
-        /* ══════════════ SCROLLBAR ══════════════ */
-        ::-webkit-scrollbar { width: 5px; height: 5px; }
-        ::-webkit-scrollbar-track { background: transparent; }
-        ::-webkit-scrollbar-thumb {
-            background: linear-gradient(180deg, var(--primary-500) 0%, var(--secondary-500) 100%);
-            border-radius: var(--radius-full);
-        }
-        ::-webkit-scrollbar-thumb:hover {
-            background: linear-gradient(180deg, var(--primary-400) 0%, var(--secondary-300) 100%);
-        }
-        * { scrollbar-width: thin; scrollbar-color: var(--primary-500) transparent; }
-
-        /* ══════════════ TYPOGRAPHY ══════════════ */
-        h1, h2, h3, h4, h5, h6 {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-            font-weight: 700 !important;
-            letter-spacing: -0.03em;
-            background: linear-gradient(140deg, #FFFFFF 0%, #E2E8F0 35%, var(--primary-300) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 0.6rem !important;
-            line-height: 1.2 !important;
-            position: relative;
-        }
-
-        h1 {
-            font-weight: 900 !important;
-            font-size: 2.4rem !important;
-            letter-spacing: -0.04em;
-            background: linear-gradient(140deg, #FFFFFF 0%, var(--primary-300) 45%, var(--secondary-300) 100%);
-            -webkit-background-clip: text;
-            background-clip: text;
-            animation: h1Breathe 7s ease-in-out infinite;
-            will-change: transform;
-            filter: drop-shadow(0 0 20px rgba(124, 92, 252, 0.08));
-        }
-
-        h2 { font-size: 1.7rem !important; font-weight: 800 !important; }
-        h3 { font-size: 1.35rem !important; font-weight: 700 !important; }
-        h4 { font-size: 1.15rem !important; }
-
-        @keyframes h1Breathe {
-            0%, 100% { transform: translate3d(0, 0, 0); filter: drop-shadow(0 0 20px rgba(124, 92, 252, 0.08)); }
-            50% { transform: translate3d(0, -3px, 0); filter: drop-shadow(0 0 30px rgba(124, 92, 252, 0.15)); }
-        }
-
-        p, span, label, .stMarkdown { color: var(--text-secondary); }
-
-        /* ══════════════ GLASSMORPHIC CARD SYSTEM ══════════════ */
-        .card,
-        [data-testid="stMetric"],
-        [data-testid="stExpander"],
-        div.stDataFrame,
-        div[data-testid="stForm"],
-        div[data-testid="stSidebar"] {
-            background: var(--glass-bg) !important;
-            backdrop-filter: blur(var(--glass-blur)) saturate(var(--glass-saturate)) !important;
-            -webkit-backdrop-filter: blur(var(--glass-blur)) saturate(var(--glass-saturate)) !important;
-            border: 1px solid var(--glass-border) !important;
-            border-radius: var(--radius-lg) !important;
-            box-shadow: var(--shadow-card) !important;
-            transition:
-                transform var(--duration-normal) var(--ease-out),
-                box-shadow var(--duration-slow) var(--ease-out),
-                border-color var(--duration-normal) var(--ease-smooth),
-                background var(--duration-normal) var(--ease-smooth);
-            position: relative;
-            overflow: hidden;
-        }
-
-        /* Top edge specular highlight */
-        .card::before,
-        [data-testid="stMetric"]::before,
-        [data-testid="stExpander"]::before,
-        div[data-testid="stForm"]::before {
-            content: '';
-            position: absolute;
-            top: 0; left: 8%; right: 8%;
-            height: 1px;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.1), rgba(255,255,255,0.15), rgba(255,255,255,0.1), transparent);
-            pointer-events: none;
-            z-index: 1;
-        }
-
-        /* Bottom edge subtle shadow line */
-        .card::after,
-        [data-testid="stMetric"]::after {
-            content: '';
-            position: absolute;
-            bottom: 0; left: 15%; right: 15%;
-            height: 1px;
-            background: linear-gradient(90deg, transparent, rgba(0,0,0,0.15), transparent);
-            pointer-events: none;
-        }
-
-        .card:hover,
-        [data-testid="stMetric"]:hover,
-        [data-testid="stExpander"]:hover {
-            transform: translate3d(0, -3px, 0);
-            background: var(--bg-card-hover) !important;
-            box-shadow: var(--shadow-card-hover) !important;
-            border-color: var(--border-hover) !important;
-        }
-
-        .card:hover::before,
-        [data-testid="stMetric"]:hover::before {
-            background: linear-gradient(90deg, transparent, rgba(124, 92, 252, 0.15), rgba(124, 92, 252, 0.25), rgba(124, 92, 252, 0.15), transparent);
-        }
-
-        /* ── METRIC CARDS ── */
-        [data-testid="stMetric"] {
-            padding: 1.6rem 1.4rem;
-            text-align: center;
-            background: linear-gradient(160deg, var(--glass-bg), rgba(124, 92, 252, 0.015)) !important;
-        }
-
-        [data-testid="stMetricLabel"] {
-            font-size: 0.7rem;
-            color: var(--text-muted) !important;
-            letter-spacing: 0.1em;
-            text-transform: uppercase;
-            font-weight: 600;
-            font-family: 'Space Grotesk', sans-serif;
-            margin-bottom: 0.3rem;
-        }
-
-        [data-testid="stMetricValue"] {
-            font-size: 2.1rem !important;
-            font-weight: 800 !important;
-            font-family: 'Inter', sans-serif !important;
-            background: linear-gradient(140deg, #FFFFFF, var(--primary-300));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            filter: drop-shadow(0 0 8px rgba(124, 92, 252, 0.1));
-        }
-
-        [data-testid="stMetricDelta"] {
-            font-family: 'JetBrains Mono', monospace !important;
-            font-size: 0.75rem !important;
-        }
-
-        /* ══════════════ BUTTONS — Premium Interactive System ══════════════ */
-        div.stButton > button {
-            background: linear-gradient(140deg, var(--primary-500) 0%, var(--primary-700) 100%) !important;
-            color: white !important;
-            border: 1px solid rgba(255,255,255,0.1) !important;
-            border-radius: var(--radius-md) !important;
-            padding: 0.72rem 1.6rem !important;
-            font-weight: 600 !important;
-            font-family: 'Inter', sans-serif !important;
-            font-size: 0.85rem !important;
-            letter-spacing: 0.015em !important;
-            box-shadow:
-                0 4px 14px rgba(124, 92, 252, 0.2),
-                0 1px 3px rgba(0,0,0,0.12),
-                inset 0 1px 0 rgba(255,255,255,0.12) !important;
-            transition:
-                transform var(--duration-normal) var(--ease-spring),
-                box-shadow var(--duration-normal) var(--ease-out),
-                border-color var(--duration-fast) ease,
-                filter var(--duration-normal) ease !important;
-            position: relative;
-            overflow: hidden;
-            width: 100%;
-            cursor: pointer;
-            will-change: transform;
-            -webkit-tap-highlight-color: transparent;
-        }
-
-        /* Shimmer sweep on hover */
-        div.stButton > button::before {
-            content: '';
-            position: absolute;
-            top: 0; left: -200%;
-            width: 80%; height: 100%;
-            background: linear-gradient(
-                105deg,
-                transparent 25%,
-                rgba(255,255,255,0.06) 38%,
-                rgba(255,255,255,0.15) 46%,
-                rgba(255,255,255,0.2) 50%,
-                rgba(255,255,255,0.15) 54%,
-                rgba(255,255,255,0.06) 62%,
-                transparent 75%
-            );
-            transition: left 0.7s var(--ease-out);
-            pointer-events: none;
-        }
-
-        /* Inner glow ring on hover */
-        div.stButton > button::after {
-            content: '';
-            position: absolute;
-            inset: 0;
-            border-radius: inherit;
-            opacity: 0;
-            background: radial-gradient(circle at 50% 0%, rgba(255,255,255,0.12) 0%, transparent 60%);
-            transition: opacity var(--duration-normal) ease;
-            pointer-events: none;
-        }
-
-        div.stButton > button:hover {
-            transform: translate3d(0, -2px, 0) scale(1.012);
-            box-shadow:
-                0 8px 28px rgba(124, 92, 252, 0.3),
-                0 3px 10px rgba(0,0,0,0.15),
-                inset 0 1px 0 rgba(255,255,255,0.18) !important;
-            border-color: rgba(255,255,255,0.22) !important;
-            filter: brightness(1.05);
-        }
-
-        div.stButton > button:hover::before { left: 200%; }
-        div.stButton > button:hover::after { opacity: 1; }
-
-        div.stButton > button:active {
-            transform: translate3d(0, 0, 0) scale(0.975);
-            transition-duration: var(--duration-instant);
-            box-shadow: 0 2px 8px rgba(124, 92, 252, 0.2), inset 0 2px 4px rgba(0,0,0,0.15) !important;
-            filter: brightness(0.95);
-        }
-
-        /* ── FORM CONTAINERS ── */
-        div[data-testid="stForm"] {
-            padding: 1.75rem !important;
-            border: 1px solid var(--border-subtle) !important;
-            background: linear-gradient(165deg, var(--glass-bg), rgba(124, 92, 252, 0.01)) !important;
-        }
-
-        /* ══════════════ INPUT FIELDS — Refined Interaction ══════════════ */
-        .stTextInput > div > div > input,
-        .stDateInput > div > div > input,
-        .stNumberInput > div > div > input,
-        .stSelectbox > div > div > div,
-        .stMultiSelect > div > div > div,
-        .stTextArea textarea {
-            background-color: var(--bg-input) !important;
-            color: var(--text-primary) !important;
-            border: 1px solid var(--border-default) !important;
-            border-radius: var(--radius-sm) !important;
-            padding: 0.65rem 1rem !important;
-            font-family: 'Outfit', sans-serif !important;
-            font-size: 0.9rem !important;
-            transition:
-                border-color var(--duration-fast) ease,
-                box-shadow var(--duration-fast) ease,
-                background-color var(--duration-fast) ease !important;
-        }
-
-        .stTextInput > div > div > input:hover,
-        .stDateInput > div > div > input:hover,
-        .stNumberInput > div > div > input:hover,
-        .stTextArea textarea:hover {
-            background-color: var(--bg-input-hover) !important;
-            border-color: var(--border-hover) !important;
-        }
-
-        .stTextInput > div > div > input:focus,
-        .stDateInput > div > div > input:focus,
-        .stNumberInput > div > div > input:focus,
-        .stTextArea textarea:focus {
-            border-color: var(--primary-500) !important;
-            box-shadow: 0 0 0 3px var(--primary-glow-soft), 0 0 24px rgba(124, 92, 252, 0.06) !important;
-            background-color: var(--bg-input-focus) !important;
-            outline: none !important;
-        }
-
-        /* Input labels */
-        .stTextInput label, .stSelectbox label, .stNumberInput label,
-        .stDateInput label, .stMultiSelect label, .stTextArea label {
-            font-weight: 500 !important;
-            color: var(--text-secondary) !important;
-            font-size: 0.82rem !important;
-            letter-spacing: 0.015em;
-            font-family: 'Space Grotesk', sans-serif !important;
-        }
-
-        /* ══════════════ RADIO / TOGGLE ══════════════ */
-        .stRadio > div { gap: 0.35rem; }
-
-        .stRadio > div > label {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-subtle) !important;
-            border-radius: var(--radius-sm) !important;
-            padding: 0.55rem 1.1rem !important;
-            transition: all var(--duration-fast) var(--ease-smooth) !important;
-            cursor: pointer;
-        }
-
-        .stRadio > div > label:hover {
-            border-color: var(--border-hover) !important;
-            background: var(--bg-card-hover) !important;
-            transform: translate3d(0, -1px, 0);
-            box-shadow: 0 4px 12px rgba(124, 92, 252, 0.08);
-        }
-
-        /* ══════════════ TABS — Segmented Control ══════════════ */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 3px;
-            background: rgba(0, 0, 0, 0.2) !important;
-            border-radius: var(--radius-md) !important;
-            padding: 4px !important;
-            border: 1px solid var(--border-subtle) !important;
-            backdrop-filter: blur(12px);
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            border-radius: var(--radius-sm) !important;
-            font-weight: 500 !important;
-            font-family: 'Space Grotesk', sans-serif !important;
-            font-size: 0.82rem !important;
-            padding: 0.55rem 1.3rem !important;
-            color: var(--text-muted) !important;
-            transition: all var(--duration-fast) var(--ease-smooth) !important;
-            border: 1px solid transparent !important;
-        }
-
-        .stTabs [data-baseweb="tab"]:hover {
-            color: var(--text-primary) !important;
-            background: rgba(124, 92, 252, 0.06) !important;
-        }
-
-        .stTabs [aria-selected="true"] {
-            background: linear-gradient(140deg, var(--primary-500), var(--primary-700)) !important;
-            color: white !important;
-            box-shadow: 0 3px 14px rgba(124, 92, 252, 0.25), inset 0 1px 0 rgba(255,255,255,0.1) !important;
-            border: 1px solid rgba(255,255,255,0.1) !important;
-        }
-
-        .stTabs [data-baseweb="tab-highlight"],
-        .stTabs [data-baseweb="tab-border"] { display: none !important; }
-
-        /* ══════════════ EXPANDER ══════════════ */
-        [data-testid="stExpander"] { overflow: hidden; }
-
-        [data-testid="stExpander"] details summary {
-            font-weight: 600 !important;
-            font-family: 'Space Grotesk', sans-serif !important;
-            color: var(--text-secondary) !important;
-            padding: 1.1rem 1.3rem !important;
-            transition: all var(--duration-fast) ease !important;
-            border-radius: var(--radius-lg) !important;
-        }
-
-        [data-testid="stExpander"] details summary:hover {
-            color: var(--text-primary) !important;
-            background: rgba(124, 92, 252, 0.03);
-        }
-
-        /* ══════════════ DATA TABLE ══════════════ */
-        div.stDataFrame { overflow: hidden; }
-
-        .stDataFrame [data-testid="stDataFrameResizable"] {
-            border-radius: var(--radius-md) !important;
-            overflow: hidden;
-        }
-
-        .stDataFrame table { border-collapse: separate !important; border-spacing: 0 !important; }
-
-        .stDataFrame th {
-            background: linear-gradient(180deg, rgba(124, 92, 252, 0.1), rgba(124, 92, 252, 0.06)) !important;
-            color: var(--text-primary) !important;
-            font-weight: 600 !important;
-            font-family: 'Space Grotesk', sans-serif !important;
-            font-size: 0.75rem !important;
-            text-transform: uppercase !important;
-            letter-spacing: 0.06em !important;
-            border-bottom: 1px solid var(--border-default) !important;
-            padding: 0.8rem 1rem !important;
-        }
-
-        .stDataFrame td {
-            color: var(--text-secondary) !important;
-            border-bottom: 1px solid var(--border-invisible) !important;
-            font-size: 0.85rem !important;
-            padding: 0.6rem 1rem !important;
-            transition: background var(--duration-fast) ease;
-        }
-
-        .stDataFrame tr:hover td {
-            background: rgba(124, 92, 252, 0.035) !important;
-        }
-
-        /* ══════════════ CAMERA / FILE UPLOAD ══════════════ */
-        div[data-testid="stCameraInput"] {
-            border: 2px solid var(--border-default);
-            border-radius: var(--radius-lg);
-            overflow: hidden;
-            box-shadow: var(--shadow-lg);
-            transition: all var(--duration-normal) var(--ease-out);
-        }
-        div[data-testid="stCameraInput"]:hover {
-            border-color: var(--border-hover);
-            box-shadow: var(--shadow-xl), var(--shadow-glow-purple);
-        }
-
-        [data-testid="stFileUploader"] {
-            border: 2px dashed var(--border-default) !important;
-            border-radius: var(--radius-lg) !important;
-            padding: 2rem !important;
-            transition: all var(--duration-normal) var(--ease-out) !important;
-            background: rgba(124, 92, 252, 0.01) !important;
-            position: relative;
-        }
-        [data-testid="stFileUploader"]:hover {
-            border-color: var(--primary-500) !important;
-            background: rgba(124, 92, 252, 0.035) !important;
-            box-shadow: inset 0 0 30px rgba(124, 92, 252, 0.03);
-        }
-
-        /* ══════════════ SLIDER ══════════════ */
-        .stSlider > div > div > div > div { background: var(--primary-500) !important; }
-        .stSlider [data-baseweb="slider"] [role="slider"] {
-            background: var(--primary-500) !important;
-            border: 3px solid rgba(255,255,255,0.9) !important;
-            box-shadow: 0 2px 10px rgba(124, 92, 252, 0.4), 0 0 20px rgba(124, 92, 252, 0.15) !important;
-            transition: transform var(--duration-fast) var(--ease-spring) !important;
-        }
-        .stSlider [data-baseweb="slider"] [role="slider"]:hover {
-            transform: scale(1.15);
-        }
-
-        /* ══════════════ PROGRESS BAR ══════════════ */
-        .stProgress > div > div > div > div {
-            background: linear-gradient(90deg, var(--primary-500), var(--primary-400), var(--secondary-500)) !important;
-            background-size: 200% 100%;
-            border-radius: var(--radius-full) !important;
-            box-shadow: 0 0 16px var(--primary-glow-soft);
-            animation: progressShimmer 2s ease-in-out infinite;
-        }
-
-        @keyframes progressShimmer {
-            0% { background-position: 0% 50%; }
-            100% { background-position: 200% 50%; }
-        }
-
-        /* ══════════════ ALERTS — Color-Coded System ══════════════ */
-        .stAlert, [data-testid="stAlert"] {
-            border-radius: var(--radius-md) !important;
-            border: 1px solid var(--border-subtle) !important;
-            backdrop-filter: blur(16px) !important;
-            animation: alertSlideIn var(--duration-slow) var(--ease-out) both;
-        }
-
-        div[data-testid="stAlert"] > div[role="alert"] {
-            border-radius: var(--radius-md) !important;
-        }
-
-        /* Success alerts — Green glow */
-        [data-testid="stAlert"][data-baseweb*="positive"],
-        div[role="alert"]:has(> div > svg[data-testid*="check"]) {
-            border-color: rgba(52, 211, 153, 0.3) !important;
-            background: linear-gradient(135deg, rgba(52, 211, 153, 0.06), rgba(52, 211, 153, 0.02)) !important;
-            box-shadow: 0 0 20px rgba(52, 211, 153, 0.06), inset 0 1px 0 rgba(52, 211, 153, 0.08) !important;
-        }
-
-        /* Error alerts — Rose glow */
-        [data-testid="stAlert"][data-baseweb*="negative"],
-        div[role="alert"]:has(> div > svg[data-testid*="error"]) {
-            border-color: rgba(244, 63, 94, 0.3) !important;
-            background: linear-gradient(135deg, rgba(244, 63, 94, 0.06), rgba(244, 63, 94, 0.02)) !important;
-            box-shadow: 0 0 20px rgba(244, 63, 94, 0.06), inset 0 1px 0 rgba(244, 63, 94, 0.08) !important;
-        }
-
-        /* Warning alerts — Amber glow */
-        [data-testid="stAlert"][data-baseweb*="warning"] {
-            border-color: rgba(245, 158, 11, 0.3) !important;
-            background: linear-gradient(135deg, rgba(245, 158, 11, 0.06), rgba(245, 158, 11, 0.02)) !important;
-            box-shadow: 0 0 20px rgba(245, 158, 11, 0.06), inset 0 1px 0 rgba(245, 158, 11, 0.08) !important;
-        }
-
-        /* Info alerts — Sky glow */
-        [data-testid="stAlert"][data-baseweb*="info"] {
-            border-color: rgba(56, 189, 248, 0.3) !important;
-            background: linear-gradient(135deg, rgba(56, 189, 248, 0.06), rgba(56, 189, 248, 0.02)) !important;
-            box-shadow: 0 0 20px rgba(56, 189, 248, 0.06), inset 0 1px 0 rgba(56, 189, 248, 0.08) !important;
-        }
-
-        /* ══════════════ DIVIDER ══════════════ */
-        hr {
-            border: none !important;
-            height: 1px !important;
-            background: linear-gradient(90deg,
-                transparent 0%,
-                var(--border-subtle) 15%,
-                var(--primary-glow-soft) 40%,
-                rgba(124, 92, 252, 0.15) 50%,
-                var(--primary-glow-soft) 60%,
-                var(--border-subtle) 85%,
-                transparent 100%
-            ) !important;
-            margin: var(--space-8) 0 !important;
-        }
-
-        /* ══════════════ CAPTIONS ══════════════ */
-        .stCaption, small {
-            color: var(--text-faint) !important;
-            font-size: var(--text-xs) !important;
-            font-family: 'Space Grotesk', sans-serif;
-        }
-
-        /* ══════════════ DOWNLOAD BUTTON ══════════════ */
-        .stDownloadButton > button {
-            background: linear-gradient(140deg, var(--secondary-700), var(--secondary-500)) !important;
-            border: 1px solid rgba(52, 211, 153, 0.25) !important;
-            box-shadow: 0 4px 14px rgba(52, 211, 153, 0.15), inset 0 1px 0 rgba(255,255,255,0.1) !important;
-        }
-        .stDownloadButton > button:hover {
-            box-shadow: 0 8px 28px rgba(52, 211, 153, 0.25), inset 0 1px 0 rgba(255,255,255,0.15) !important;
-            filter: brightness(1.06);
-            transform: translate3d(0, -2px, 0);
-        }
-
-        /* ══════════════ PLOTLY ══════════════ */
-        .js-plotly-plot .plotly .modebar {
-            background: rgba(15, 18, 25, 0.8) !important;
-            backdrop-filter: blur(8px);
-            border-radius: var(--radius-sm) !important;
-            border: 1px solid var(--border-subtle);
-        }
-
-        /* ══════════════ SIDEBAR — Premium Glass Panel ══════════════ */
-        div[data-testid="stSidebar"] {
-            border-radius: 0 var(--radius-xl) var(--radius-xl) 0 !important;
-            border-left: none !important;
-            background: linear-gradient(180deg, rgba(15, 18, 25, 0.95), rgba(10, 13, 22, 0.98)) !important;
-            border-right: 1px solid var(--border-subtle) !important;
-            box-shadow: 4px 0 40px rgba(0,0,0,0.3), 1px 0 0 var(--border-invisible) !important;
-        }
-
-        /* Sidebar animated top accent */
-        div[data-testid="stSidebar"]::before {
-            content: '';
-            position: absolute;
-            top: 0; left: var(--space-8); right: var(--space-8);
-            height: 2px;
-            background: linear-gradient(90deg, var(--primary-500), var(--secondary-500), var(--primary-500));
-            background-size: 200% 100%;
-            animation: sidebarAccent 4s ease infinite;
-            border-radius: 0 0 2px 2px;
-            z-index: 1;
-        }
-
-        @keyframes sidebarAccent {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        /* Sidebar content polish */
-        div[data-testid="stSidebar"] .stMarkdown p {
-            font-size: var(--text-sm) !important;
-        }
-
-        div[data-testid="stSidebar"] .stRadio > div > label {
-            font-size: var(--text-sm) !important;
-            padding: var(--space-3) var(--space-4) !important;
-        }
-
-        /* ══════════════ STREAMLIT HEADER — Glass Treatment ══════════════ */
-        header[data-testid="stHeader"] {
-            background: linear-gradient(180deg, rgba(6, 8, 16, 0.85), rgba(6, 8, 16, 0.4), transparent) !important;
-            backdrop-filter: blur(20px) saturate(1.5) !important;
-            -webkit-backdrop-filter: blur(20px) saturate(1.5) !important;
-            border-bottom: 1px solid var(--border-invisible) !important;
-        }
-
-        /* ══════════════ TOOLTIP / JSON / SPINNER ══════════════ */
-        [data-testid="stTooltipIcon"] {
-            color: var(--text-faint) !important;
-            transition: color var(--duration-fast) ease;
-        }
-        [data-testid="stTooltipIcon"]:hover {
-            color: var(--primary-400) !important;
-        }
-
-        .stJson {
-            background: var(--bg-input) !important;
-            border-radius: var(--radius-sm) !important;
-            border: 1px solid var(--border-subtle) !important;
-            font-family: 'JetBrains Mono', monospace !important;
-            font-size: var(--text-xs) !important;
-        }
-
-        /* Enhanced spinner with gradient */
-        .stSpinner > div {
-            border-top-color: var(--primary-500) !important;
-            border-right-color: rgba(124, 92, 252, 0.3) !important;
-            border-bottom-color: rgba(52, 211, 153, 0.15) !important;
-            border-left-color: rgba(124, 92, 252, 0.15) !important;
-            filter: drop-shadow(0 0 6px rgba(124, 92, 252, 0.2));
-        }
-
-        /* ══════════════ TOGGLE — Enhanced ══════════════ */
-        .stToggle label span {
-            font-family: 'Space Grotesk', sans-serif !important;
-            font-weight: 500;
-        }
-
-        /* Toggle track styling */
-        .stToggle [data-baseweb="checkbox"] > div:first-child {
-            border-radius: var(--radius-full) !important;
-            transition: background-color var(--duration-fast) var(--ease-smooth) !important;
-        }
-
-        /* ══════════════ CHECKBOX / RADIO — Enhanced Active States ══════════════ */
-        .stCheckbox label:hover,
-        .stRadio > div > label[data-checked="true"] {
-            border-color: var(--primary-400) !important;
-            background: var(--bg-card-active) !important;
-            box-shadow: 0 0 16px rgba(124, 92, 252, 0.08) !important;
-        }
-
-        /* ══════════════ IMAGES — Enhanced ══════════════ */
-        .stImage {
-            border-radius: var(--radius-md);
-            overflow: hidden;
-            position: relative;
-        }
-
-        .stImage img {
-            border-radius: var(--radius-md) !important;
-            transition: transform var(--duration-slow) var(--ease-out), filter var(--duration-slow) ease;
-        }
-
-        .stImage:hover img {
-            transform: scale(1.02);
-            filter: brightness(1.03);
-        }
-
-        /* ══════════════ SELECTBOX — Glass Dropdown ══════════════ */
-        [data-baseweb="popover"] {
-            border-radius: var(--radius-md) !important;
-            border: 1px solid var(--border-default) !important;
-            background: rgba(15, 18, 25, 0.95) !important;
-            backdrop-filter: blur(24px) !important;
-            box-shadow: var(--shadow-xl) !important;
-            overflow: hidden;
-            animation: dropdownReveal var(--duration-normal) var(--ease-out) both;
-        }
-
-        @keyframes dropdownReveal {
-            from { opacity: 0; transform: translate3d(0, -6px, 0) scale(0.97); }
-            to { opacity: 1; transform: translate3d(0, 0, 0) scale(1); }
-        }
-
-        [data-baseweb="popover"] li {
-            transition: background var(--duration-fast) ease !important;
-            border-radius: var(--radius-xs) !important;
-            margin: 2px var(--space-2) !important;
-        }
-
-        [data-baseweb="popover"] li:hover {
-            background: rgba(124, 92, 252, 0.1) !important;
-        }
-
-        [data-baseweb="popover"] li[aria-selected="true"] {
-            background: rgba(124, 92, 252, 0.15) !important;
-            box-shadow: inset 3px 0 0 var(--primary-500) !important;
-        }
-
-        /* ══════════════ CTA GLOW PULSE ══════════════ */
-        div.stButton > button[kind="primary"],
-        div.stButton > button:first-child {
-            animation: ctaGlowPulse 3s ease-in-out infinite;
-        }
-
-        @keyframes ctaGlowPulse {
-            0%, 100% {
-                box-shadow:
-                    0 4px 14px rgba(124, 92, 252, 0.2),
-                    0 1px 3px rgba(0,0,0,0.12),
-                    inset 0 1px 0 rgba(255,255,255,0.12);
-            }
-            50% {
-                box-shadow:
-                    0 4px 20px rgba(124, 92, 252, 0.35),
-                    0 0 40px rgba(124, 92, 252, 0.1),
-                    0 1px 3px rgba(0,0,0,0.12),
-                    inset 0 1px 0 rgba(255,255,255,0.12);
-            }
-        }
-
-        /* ══════════════ PAGE ENTRANCE ANIMATION ══════════════ */
-        .main .block-container {
-            animation: pageEntrance var(--duration-glacial) var(--ease-out) both;
-        }
-
-        @keyframes pageEntrance {
-            from {
-                opacity: 0;
-                transform: translate3d(0, 12px, 0);
-            }
-            to {
-                opacity: 1;
-                transform: translate3d(0, 0, 0);
-            }
-        }
-
-        /* Staggered column entrance */
-        [data-testid="column"] {
-            animation: columnEntrance var(--duration-slow) var(--ease-out) both;
-        }
-
-        [data-testid="column"]:nth-child(1) { animation-delay: 0.05s; }
-        [data-testid="column"]:nth-child(2) { animation-delay: 0.12s; }
-        [data-testid="column"]:nth-child(3) { animation-delay: 0.19s; }
-        [data-testid="column"]:nth-child(4) { animation-delay: 0.26s; }
-
-        @keyframes columnEntrance {
-            from {
-                opacity: 0;
-                transform: translate3d(0, 16px, 0) scale(0.98);
-            }
-            to {
-                opacity: 1;
-                transform: translate3d(0, 0, 0) scale(1);
-            }
-        }
-
-        /* ══════════════ METRIC CARD — Animated Border Glow on Hover ══════════════ */
-        [data-testid="stMetric"]::after {
-            content: '';
-            position: absolute;
-            bottom: 0; left: 15%; right: 15%;
-            height: 1px;
-            background: linear-gradient(90deg, transparent, rgba(0,0,0,0.15), transparent);
-            pointer-events: none;
-            transition: all var(--duration-normal) var(--ease-out);
-        }
-
-        [data-testid="stMetric"]:hover::after {
-            left: 5%; right: 5%;
-            background: linear-gradient(90deg, transparent, rgba(124, 92, 252, 0.2), transparent);
-        }
-
-        /* ══════════════ FILE UPLOADER — Drag Active State ══════════════ */
-        [data-testid="stFileUploader"].drag-active,
-        [data-testid="stFileUploader"]:focus-within {
-            border-color: var(--primary-400) !important;
-            background: rgba(124, 92, 252, 0.05) !important;
-            box-shadow: 0 0 30px rgba(124, 92, 252, 0.08), inset 0 0 20px rgba(124, 92, 252, 0.02) !important;
-        }
-
-        /* ══════════════ STATUS BADGES ══════════════ */
-        .status-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: var(--space-2);
-            padding: var(--space-1) var(--space-3);
-            border-radius: var(--radius-full);
-            font-size: var(--text-xs);
-            font-weight: 600;
-            font-family: 'Space Grotesk', sans-serif;
-            letter-spacing: 0.02em;
-        }
-
-        .status-badge--success {
-            background: rgba(52, 211, 153, 0.1);
-            color: var(--secondary-300);
-            border: 1px solid rgba(52, 211, 153, 0.2);
-        }
-
-        .status-badge--error {
-            background: rgba(244, 63, 94, 0.1);
-            color: var(--rose-400);
-            border: 1px solid rgba(244, 63, 94, 0.2);
-        }
-
-        .status-badge--info {
-            background: rgba(56, 189, 248, 0.1);
-            color: var(--sky-400);
-            border: 1px solid rgba(56, 189, 248, 0.2);
-        }
-
-        /* ══════════════ EMPTY STATES ══════════════ */
-        .stEmpty, [data-testid="stEmpty"] {
-            color: var(--text-faint) !important;
-            font-style: italic;
-        }
-
-        /* ══════════════ LINK BUTTON ══════════════ */
-        .stLinkButton > a {
-            color: var(--primary-400) !important;
-            text-decoration: none !important;
-            transition: color var(--duration-fast) ease, text-shadow var(--duration-fast) ease !important;
-            font-weight: 500;
-        }
-        .stLinkButton > a:hover {
-            color: var(--primary-300) !important;
-            text-shadow: 0 0 12px rgba(124, 92, 252, 0.2);
-        }
-
-        /* ══════════════ MULTISELECT TAGS ══════════════ */
-        [data-baseweb="tag"] {
-            background: rgba(124, 92, 252, 0.12) !important;
-            border: 1px solid rgba(124, 92, 252, 0.2) !important;
-            border-radius: var(--radius-sm) !important;
-            color: var(--primary-200) !important;
-            font-family: 'Space Grotesk', sans-serif !important;
-            font-size: var(--text-xs) !important;
-            transition: all var(--duration-fast) ease !important;
-        }
-
-        [data-baseweb="tag"]:hover {
-            background: rgba(124, 92, 252, 0.2) !important;
-            border-color: rgba(124, 92, 252, 0.35) !important;
-        }
-
-        /* ══════════════ NUMBER INPUT — Stepper Buttons ══════════════ */
-        .stNumberInput button {
-            background: rgba(124, 92, 252, 0.08) !important;
-            border: 1px solid var(--border-subtle) !important;
-            color: var(--text-secondary) !important;
-            transition: all var(--duration-fast) ease !important;
-        }
-
-        .stNumberInput button:hover {
-            background: rgba(124, 92, 252, 0.15) !important;
-            border-color: var(--border-hover) !important;
-            color: var(--text-primary) !important;
-        }
-
-        /* ══════════════ DATE INPUT — Calendar Picker ══════════════ */
-        [data-baseweb="calendar"] {
-            background: rgba(15, 18, 25, 0.95) !important;
-            border: 1px solid var(--border-default) !important;
-            border-radius: var(--radius-md) !important;
-            backdrop-filter: blur(20px) !important;
-            box-shadow: var(--shadow-xl) !important;
-        }
-
-        [data-baseweb="calendar"] [role="gridcell"] button {
-            color: var(--text-secondary) !important;
-            border-radius: var(--radius-xs) !important;
-            transition: all var(--duration-fast) ease !important;
-        }
-
-        [data-baseweb="calendar"] [role="gridcell"] button:hover {
-            background: rgba(124, 92, 252, 0.12) !important;
-            color: var(--text-primary) !important;
-        }
-
-        [data-baseweb="calendar"] [aria-selected="true"] button {
-            background: var(--primary-500) !important;
-            color: white !important;
-        }
-
-        /* ══════════════ RESPONSIVE — Mobile Polish ══════════════ */
-        @media (max-width: 768px) {
-            .main .block-container {
-                padding-left: var(--space-4) !important;
-                padding-right: var(--space-4) !important;
-            }
-
-            [data-testid="stMetric"] {
-                padding: var(--space-4) var(--space-3) !important;
-            }
-
-            [data-testid="stMetricValue"] {
-                font-size: var(--text-xl) !important;
-            }
-
-            div.stButton > button {
-                padding: var(--space-3) var(--space-4) !important;
-                font-size: var(--text-sm) !important;
-            }
-
-            .stTabs [data-baseweb="tab"] {
-                padding: var(--space-3) var(--space-4) !important;
-                font-size: var(--text-xs) !important;
-            }
-        }
-
-        @media (max-width: 480px) {
-            h1 { font-size: var(--text-2xl) !important; }
-            h2 { font-size: var(--text-xl) !important; }
-
-            .login-title {
-                font-size: clamp(2rem, 10vw, 3rem) !important;
-            }
-        }
-
-        /* ══════════════ ULTRA-WIDE — Scale Up ══════════════ */
-        @media (min-width: 2000px) {
-            :root {
-                --glass-blur: 32px;
-            }
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           LOGIN PAGE — CINEMATIC IMMERSIVE EXPERIENCE
-           ═══════════════════════════════════════════════════════ */
-
-        .login-title {
-            font-family: 'Inter', sans-serif;
-            font-weight: 900;
-            font-size: clamp(2.8rem, 7vw, 5rem);
-            text-align: center;
-            margin-bottom: 0.15rem;
-            letter-spacing: -0.055em;
-            line-height: 1.05;
-            background: linear-gradient(
-                135deg,
-                #FFFFFF 0%,
-                var(--primary-300) 25%,
-                #FFFFFF 45%,
-                var(--secondary-300) 65%,
-                #FFFFFF 85%,
-                var(--primary-200) 100%
-            );
-            background-size: 300% 300%;
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            animation: titleShimmer 8s ease-in-out infinite;
-            filter: drop-shadow(0 0 40px var(--primary-glow)) drop-shadow(0 0 80px rgba(52, 211, 153, 0.1));
-            position: relative;
-        }
-
-        @keyframes titleShimmer {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        .login-subtitle {
-            font-family: 'Space Grotesk', sans-serif;
-            font-weight: 400;
-            font-size: clamp(0.8rem, 1.8vw, 1.05rem);
-            color: var(--text-muted);
-            text-align: center;
-            font-style: normal;
-            margin-bottom: 2.5rem;
-            letter-spacing: 0.15em;
-            text-transform: uppercase;
-            opacity: 0;
-            animation: subtitleReveal 1.5s ease-out 0.6s forwards;
-        }
-
-        @keyframes subtitleReveal {
-            from { opacity: 0; transform: translateY(10px) scale(0.97); letter-spacing: 0.3em; }
-            to { opacity: 0.6; transform: translateY(0) scale(1); letter-spacing: 0.15em; }
-        }
-
-        /* ── STARFIELD ── */
-        #stars-container {
-            position: fixed;
-            inset: 0;
-            z-index: 1;
-            overflow: hidden;
-            pointer-events: none;
-            background: transparent;
-        }
-
-        .stApp > header, .stApp > div:nth-child(1) {
-            z-index: 2;
-            position: relative;
-        }
-
-        .star {
-            position: absolute;
-            border-radius: 50%;
-            opacity: 0;
-            will-change: transform, opacity;
-        }
-
-        .star--sm {
-            width: 1px; height: 1px;
-            background: rgba(255, 255, 255, 0.5);
-            box-shadow: 0 0 2px rgba(255, 255, 255, 0.25);
-            animation: starPulse 4s ease-in-out infinite;
-        }
-
-        .star--md {
-            width: 1.5px; height: 1.5px;
-            background: rgba(200, 210, 255, 0.7);
-            box-shadow: 0 0 5px rgba(200, 210, 255, 0.35), 0 0 10px rgba(124, 92, 252, 0.15);
-            animation: starPulse 5s ease-in-out infinite;
-        }
-
-        .star--lg {
-            width: 2.5px; height: 2.5px;
-            background: rgba(255, 255, 255, 0.85);
-            box-shadow: 0 0 7px rgba(255, 255, 255, 0.4), 0 0 16px rgba(124, 92, 252, 0.12);
-            animation: starPulse 6.5s ease-in-out infinite;
-        }
-
-        @keyframes starPulse {
-            0%, 100% { opacity: 0.08; transform: scale(0.7); }
-            25% { opacity: 0.5; }
-            50% { opacity: 1; transform: scale(1.4); }
-            75% { opacity: 0.5; }
-        }
-
-        /* Shooting stars */
-        .shooting-star {
-            position: absolute;
-            width: 2px; height: 2px;
-            background: white;
-            border-radius: 50%;
-            box-shadow:
-                0 0 4px 1px rgba(255,255,255,0.5),
-                -20px 0 8px rgba(124, 92, 252, 0.3),
-                -40px 0 5px rgba(124, 92, 252, 0.15),
-                -60px 0 3px rgba(124, 92, 252, 0.05);
-            animation: shoot 4s ease-in infinite;
-            opacity: 0;
-        }
-
-        @keyframes shoot {
-            0% { transform: translate3d(0, 0, 0) rotate(-35deg); opacity: 0; }
-            3% { opacity: 1; }
-            12% { transform: translate3d(350px, 220px, 0) rotate(-35deg); opacity: 0; }
-            100% { opacity: 0; }
-        }
-
-        /* Aurora borealis */
-        .aurora {
-            position: fixed;
-            bottom: -25%;
-            left: -15%;
-            width: 130%;
-            height: 55%;
-            background: linear-gradient(
-                180deg,
-                transparent 0%,
-                rgba(124, 92, 252, 0.015) 30%,
-                rgba(52, 211, 153, 0.025) 50%,
-                rgba(56, 189, 248, 0.015) 70%,
-                transparent 100%
-            );
-            filter: blur(70px);
-            animation: auroraWave 18s ease-in-out infinite alternate;
-            pointer-events: none;
-            z-index: 0;
-        }
-
-        @keyframes auroraWave {
-            0% { transform: translate3d(-6%, 0, 0) skewY(-1.5deg) scaleX(1); }
-            50% { transform: translate3d(3%, -2%, 0) skewY(0.5deg) scaleX(1.03); }
-            100% { transform: translate3d(6%, -4%, 0) skewY(1.5deg) scaleX(0.98); }
-        }
-
-        /* Orbital ring behind title */
-        .login-orbital {
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            width: 400px;
-            height: 400px;
-            border-radius: 50%;
-            border: 1px solid rgba(124, 92, 252, 0.06);
-            animation: orbitalSpin 30s linear infinite;
-            pointer-events: none;
-        }
-
-        .login-orbital::before {
-            content: '';
-            position: absolute;
-            top: -2px; left: 50%;
-            width: 4px; height: 4px;
-            border-radius: 50%;
-            background: var(--primary-300);
-            box-shadow: 0 0 8px var(--primary-glow);
-        }
-
-        @keyframes orbitalSpin {
-            from { transform: translate(-50%, -50%) rotate(0deg); }
-            to { transform: translate(-50%, -50%) rotate(360deg); }
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           PERSON CARD — Premium Attendance Card V2
-           ═══════════════════════════════════════════════════════ */
-        .person-card {
-            background: linear-gradient(155deg, 
-                rgba(124, 92, 252, 0.08) 0%, 
-                rgba(52, 211, 153, 0.04) 50%, 
-                rgba(124, 92, 252, 0.05) 100%
-            ) !important;
-            backdrop-filter: blur(32px) saturate(2.2) !important;
-            -webkit-backdrop-filter: blur(32px) saturate(2.2) !important;
-            border: 1px solid rgba(124, 92, 252, 0.18) !important;
-            border-radius: var(--radius-xl) !important;
-            padding: 1.8rem 1.5rem !important;
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-            box-shadow:
-                0 12px 40px rgba(0,0,0,0.22),
-                0 4px 12px rgba(124, 92, 252, 0.1),
-                0 1px 3px rgba(0,0,0,0.1),
-                inset 0 1px 0 rgba(255,255,255,0.08);
-            animation: personCardIn 0.5s var(--ease-out) both;
-            transform-style: preserve-3d;
-            transition: all 0.4s cubic-bezier(0.16, 1, 0.3, 1);
-        }
-
-        .person-card:hover {
-            transform: translateY(-4px) scale(1.01);
-            border-color: rgba(124, 92, 252, 0.3) !important;
-            box-shadow:
-                0 20px 50px rgba(0,0,0,0.25),
-                0 8px 20px rgba(124, 92, 252, 0.15),
-                0 0 30px rgba(124, 92, 252, 0.08),
-                inset 0 1px 0 rgba(255,255,255,0.1);
-        }
-
-        .person-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 12%;
-            right: 12%;
-            height: 1px;
-            background: linear-gradient(90deg, 
-                transparent 0%,
-                rgba(124, 92, 252, 0.4) 30%,
-                rgba(52, 211, 153, 0.35) 50%,
-                rgba(124, 92, 252, 0.4) 70%,
-                transparent 100%
-            );
-            opacity: 0.9;
-        }
-
-        .person-card::after {
-            content: '';
-            position: absolute;
-            top: -60%;
-            left: -40%;
-            width: 180%;
-            height: 180%;
-            background: radial-gradient(
-                ellipse at 30% 30%,
-                rgba(124, 92, 252, 0.06) 0%,
-                transparent 50%
-            );
-            animation: personCardGlow 8s ease-in-out infinite alternate;
-            pointer-events: none;
-            z-index: 0;
-        }
-
-        .person-card h3 {
-            margin: 0 0 0.3rem 0 !important;
-            font-size: 1.15rem !important;
-            font-weight: 700 !important;
-            background: linear-gradient(140deg, #FFFFFF 0%, var(--primary-200) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            position: relative;
-            z-index: 1;
-            letter-spacing: -0.01em;
-        }
-
-        .person-card-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.35rem;
-            padding: 0.3rem 0.75rem;
-            background: rgba(124, 92, 252, 0.15);
-            border: 1px solid rgba(124, 92, 252, 0.25);
-            border-radius: var(--radius-full);
-            font-family: 'Space Grotesk', sans-serif;
-            font-size: 0.72rem;
-            font-weight: 600;
-            color: var(--primary-200);
-            margin-top: 0.5rem;
-            position: relative;
-            z-index: 1;
-        }
-
-        @keyframes personCardIn {
-            from { 
-                opacity: 0; 
-                transform: translate3d(0, 20px, 0) scale(0.95) rotateX(-5deg);
-                filter: blur(4px);
-            }
-            to { 
-                opacity: 1; 
-                transform: translate3d(0, 0, 0) scale(1) rotateX(0deg);
-                filter: blur(0);
-            }
-        }
-
-        @keyframes personCardGlow {
-            0% { transform: translate(0%, 0%) rotate(0deg); opacity: 0.8; }
-            50% { transform: translate(3%, 2%) rotate(1deg); opacity: 1; }
-            100% { transform: translate(5%, 5%) rotate(2deg); opacity: 0.9; }
-        }
-
-        /* Person card face image container */
-        .person-card-image {
-            width: 80px;
-            height: 80px;
-            border-radius: 50%;
-            margin: 0 auto 1rem;
-            overflow: hidden;
-            border: 3px solid rgba(124, 92, 252, 0.3);
-            box-shadow: 
-                0 4px 15px rgba(0, 0, 0, 0.2),
-                0 0 20px rgba(124, 92, 252, 0.15);
-            position: relative;
-            z-index: 1;
-        }
-
-        .person-card-image img {
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-        }
-
-        /* Stats inside person card */
-        .person-card-stats {
-            display: flex;
-            justify-content: center;
-            gap: 1.5rem;
-            margin-top: 1rem;
-            padding-top: 1rem;
-            border-top: 1px solid rgba(255, 255, 255, 0.06);
-            position: relative;
-            z-index: 1;
-        }
-
-        .person-card-stat {
-            text-align: center;
-        }
-
-        .person-card-stat-value {
-            font-family: 'Inter', sans-serif;
-            font-weight: 700;
-            font-size: 1.1rem;
-            color: var(--text-primary);
-            display: block;
-        }
-
-        .person-card-stat-label {
-            font-family: 'Space Grotesk', sans-serif;
-            font-size: 0.65rem;
-            color: var(--text-faint);
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           PAGE TRANSITIONS
-           ═══════════════════════════════════════════════════════ */
-        .main .block-container {
-            animation: pageReveal 0.4s var(--ease-out) both;
-        }
-
-        @keyframes pageReveal {
-            from { opacity: 0; transform: translate3d(0, 10px, 0); }
-            to { opacity: 1; transform: translate3d(0, 0, 0); }
-        }
-
-        /* Staggered column animation */
-        .main .block-container [data-testid="column"] {
-            animation: colPop 0.4s var(--ease-out) both;
-        }
-        .main .block-container [data-testid="column"]:nth-child(1) { animation-delay: 0.05s; }
-        .main .block-container [data-testid="column"]:nth-child(2) { animation-delay: 0.1s; }
-        .main .block-container [data-testid="column"]:nth-child(3) { animation-delay: 0.15s; }
-        .main .block-container [data-testid="column"]:nth-child(4) { animation-delay: 0.2s; }
-
-        @keyframes colPop {
-            from { opacity: 0; transform: translate3d(0, 6px, 0) scale(0.98); }
-            to { opacity: 1; transform: translate3d(0, 0, 0) scale(1); }
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           SEATING GRID — Premium Interactive Map
-           ═══════════════════════════════════════════════════════ */
-        .seat-grid-container {
-            display: flex;
-            flex-direction: column;
-            gap: 5px;
-            overflow-x: auto;
-            padding: 1.75rem;
-            background:
-                linear-gradient(150deg, rgba(124, 92, 252, 0.025), rgba(0,0,0,0.12), rgba(52, 211, 153, 0.015));
-            border-radius: var(--radius-lg);
-            border: 1px solid var(--border-subtle);
-            backdrop-filter: blur(12px);
-            box-shadow: inset 0 1px 0 rgba(255,255,255,0.03), var(--shadow-md);
-        }
-
-        .seat-row { display: flex; gap: 5px; }
-
-        .seat-row-label {
-            width: 34px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 700;
-            font-family: 'Space Grotesk', sans-serif;
-            font-size: 0.7rem;
-            color: var(--text-faint);
-            letter-spacing: 0.05em;
-        }
-
-        .seat-cell {
-            width: 56px;
-            height: 44px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border-radius: var(--radius-xs);
-            font-family: 'Inter', sans-serif;
-            color: white;
-            transition:
-                transform var(--duration-fast) var(--ease-spring),
-                box-shadow var(--duration-fast) ease,
-                filter var(--duration-fast) ease;
-            cursor: default;
-            position: relative;
-        }
-
-        .seat-cell:hover {
-            transform: scale(1.12) translate3d(0, -2px, 0);
-            z-index: 3;
-            filter: brightness(1.1);
-        }
-
-        .seat-empty {
-            background: rgba(255,255,255,0.018);
-            border: 1px solid rgba(255,255,255,0.03);
-        }
-
-        .seat-empty:hover {
-            background: rgba(255,255,255,0.04);
-            border-color: rgba(255,255,255,0.08);
-        }
-
-        .seat-male {
-            background: linear-gradient(140deg, rgba(108, 93, 211, 0.8) 0%, rgba(91, 52, 232, 0.85) 100%);
-            border: 1px solid rgba(124, 92, 252, 0.45);
-            box-shadow: 0 2px 8px rgba(108, 93, 211, 0.25), inset 0 1px 0 rgba(255,255,255,0.08);
-        }
-        .seat-male:hover { box-shadow: 0 6px 20px rgba(108, 93, 211, 0.45), inset 0 1px 0 rgba(255,255,255,0.12); }
-
-        .seat-female {
-            background: linear-gradient(140deg, rgba(244, 63, 94, 0.8) 0%, rgba(225, 29, 72, 0.85) 100%);
-            border: 1px solid rgba(244, 63, 94, 0.45);
-            box-shadow: 0 2px 8px rgba(244, 63, 94, 0.25), inset 0 1px 0 rgba(255,255,255,0.08);
-        }
-        .seat-female:hover { box-shadow: 0 6px 20px rgba(244, 63, 94, 0.45), inset 0 1px 0 rgba(255,255,255,0.12); }
-
-        .seat-other {
-            background: linear-gradient(140deg, rgba(56, 189, 248, 0.8) 0%, rgba(14, 165, 233, 0.85) 100%);
-            border: 1px solid rgba(56, 189, 248, 0.45);
-            box-shadow: 0 2px 8px rgba(56, 189, 248, 0.25), inset 0 1px 0 rgba(255,255,255,0.08);
-        }
-        .seat-other:hover { box-shadow: 0 6px 20px rgba(56, 189, 248, 0.45), inset 0 1px 0 rgba(255,255,255,0.12); }
-
-        .seat-name {
-            font-weight: 600;
-            font-size: 0.72rem;
-            white-space: nowrap;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            max-width: 50px;
-            display: block;
-            text-shadow: 0 1px 3px rgba(0,0,0,0.35);
-        }
-
-        .seat-num { font-size: 0.6rem; opacity: 0.15; font-family: 'JetBrains Mono', monospace; }
-
-        .seat-legend {
-            display: flex;
-            gap: 1.8rem;
-            margin-top: 1rem;
-            padding: 0.75rem 1rem;
-            background: rgba(0,0,0,0.15);
-            border-radius: var(--radius-sm);
-            border: 1px solid var(--border-invisible);
-        }
-
-        .seat-legend-item {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            font-size: 0.75rem;
-            color: var(--text-muted);
-            font-family: 'Space Grotesk', sans-serif;
-            font-weight: 500;
-        }
-
-        .seat-legend-dot {
-            width: 12px;
-            height: 12px;
-            border-radius: 4px;
-            box-shadow: 0 2px 6px rgba(0,0,0,0.2);
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           PDF DOWNLOAD
-           ═══════════════════════════════════════════════════════ */
-        .pdf-download-btn {
-            display: block;
-            text-align: center;
-            padding: 0.9rem 2rem;
-            margin-top: 1.2rem;
-            background: linear-gradient(140deg, var(--primary-500), var(--primary-700));
-            color: white !important;
-            text-decoration: none !important;
-            border-radius: var(--radius-md);
-            font-weight: 600;
-            font-family: 'Inter', sans-serif;
-            font-size: 0.88rem;
-            letter-spacing: 0.02em;
-            box-shadow: 0 4px 18px rgba(124, 92, 252, 0.25), inset 0 1px 0 rgba(255,255,255,0.1);
-            transition:
-                transform var(--duration-normal) var(--ease-spring),
-                box-shadow var(--duration-normal) ease,
-                filter var(--duration-normal) ease;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .pdf-download-btn:hover {
-            transform: translate3d(0, -2px, 0);
-            box-shadow: 0 10px 32px rgba(124, 92, 252, 0.35), inset 0 1px 0 rgba(255,255,255,0.15);
-            filter: brightness(1.05);
-        }
-
-        .pdf-download-btn::after {
-            content: '';
-            position: absolute;
-            inset: 0;
-            background: linear-gradient(
-                120deg,
-                transparent 30%,
-                rgba(255,255,255,0.06) 45%,
-                rgba(255,255,255,0.1) 50%,
-                rgba(255,255,255,0.06) 55%,
-                transparent 70%
-            );
-            background-size: 250% 250%;
-            animation: pdfSheen 4s ease-in-out infinite;
-        }
-
-        @keyframes pdfSheen {
-            0%, 100% { background-position: 250% 50%; }
-            50% { background-position: -50% 50%; }
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           DASHBOARD MENU CARDS (Event Menu) — ULTRA PREMIUM V2
-           ═══════════════════════════════════════════════════════ */
-        
-        /* Menu Grid Container */
-        .menu-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 1.25rem;
-            padding: 1rem 0;
-        }
-
-        @media (max-width: 900px) {
-            .menu-grid {
-                grid-template-columns: repeat(2, 1fr);
-                gap: 1rem;
-            }
-        }
-
-        @media (max-width: 600px) {
-            .menu-grid {
-                grid-template-columns: 1fr;
-                gap: 0.85rem;
-            }
-        }
-
-        .menu-card {
-            background: linear-gradient(165deg, 
-                rgba(255, 255, 255, 0.04) 0%,
-                rgba(124, 92, 252, 0.025) 50%,
-                rgba(52, 211, 153, 0.015) 100%
-            );
-            backdrop-filter: blur(24px) saturate(1.8);
-            -webkit-backdrop-filter: blur(24px) saturate(1.8);
-            border: 1px solid rgba(255, 255, 255, 0.06);
-            border-radius: var(--radius-xl);
-            padding: 1.75rem 1.5rem 1.25rem;
-            text-align: center;
-            transition: all 0.4s cubic-bezier(0.16, 1, 0.3, 1);
-            position: relative;
-            overflow: hidden;
-            cursor: pointer;
-            min-height: 160px;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            transform-style: preserve-3d;
-            perspective: 1000px;
-        }
-
-        /* Top specular highlight */
-        .menu-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 15%;
-            right: 15%;
-            height: 1px;
-            background: linear-gradient(90deg, 
-                transparent 0%,
-                rgba(255, 255, 255, 0.12) 30%,
-                rgba(255, 255, 255, 0.2) 50%,
-                rgba(255, 255, 255, 0.12) 70%,
-                transparent 100%
-            );
-            opacity: 0.8;
-            transition: opacity 0.3s ease;
-        }
-
-        /* Animated gradient background on hover */
-        .menu-card::after {
-            content: '';
-            position: absolute;
-            inset: 0;
-            background: radial-gradient(
-                ellipse 80% 80% at var(--mouse-x, 50%) var(--mouse-y, 50%),
-                rgba(124, 92, 252, 0.15) 0%,
-                transparent 60%
-            );
-            opacity: 0;
-            transition: opacity 0.4s ease;
-            pointer-events: none;
-            z-index: 0;
-        }
-
-        .menu-card:hover {
-            transform: translateY(-8px) scale(1.02) rotateX(2deg);
-            border-color: rgba(124, 92, 252, 0.35);
-            box-shadow: 
-                0 20px 50px rgba(0, 0, 0, 0.25),
-                0 10px 25px rgba(124, 92, 252, 0.2),
-                0 0 0 1px rgba(124, 92, 252, 0.1),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1);
-            background: linear-gradient(165deg, 
-                rgba(255, 255, 255, 0.06) 0%,
-                rgba(124, 92, 252, 0.06) 50%,
-                rgba(52, 211, 153, 0.03) 100%
-            );
-        }
-
-        .menu-card:hover::before {
-            background: linear-gradient(90deg, 
-                transparent 0%,
-                rgba(124, 92, 252, 0.3) 30%,
-                rgba(124, 92, 252, 0.5) 50%,
-                rgba(124, 92, 252, 0.3) 70%,
-                transparent 100%
-            );
-            opacity: 1;
-        }
-
-        .menu-card:hover::after {
-            opacity: 1;
-        }
-
-        .menu-card:active {
-            transform: translateY(-2px) scale(0.98);
-            transition-duration: 0.1s;
-        }
-
-        /* Icon Container */
-        .menu-card-icon-wrap {
-            width: 64px;
-            height: 64px;
-            border-radius: 18px;
-            background: linear-gradient(145deg, 
-                rgba(124, 92, 252, 0.15),
-                rgba(124, 92, 252, 0.05)
-            );
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin-bottom: 1rem;
-            position: relative;
-            z-index: 1;
-            transition: all 0.4s cubic-bezier(0.34, 1.56, 0.64, 1);
-            box-shadow: 
-                0 4px 15px rgba(124, 92, 252, 0.15),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1);
-        }
-
-        .menu-card:hover .menu-card-icon-wrap {
-            transform: scale(1.1) translateY(-4px);
-            background: linear-gradient(145deg, 
-                rgba(124, 92, 252, 0.25),
-                rgba(52, 211, 153, 0.1)
-            );
-            box-shadow: 
-                0 8px 25px rgba(124, 92, 252, 0.3),
-                0 0 30px rgba(124, 92, 252, 0.1),
-                inset 0 1px 0 rgba(255, 255, 255, 0.15);
-        }
-
-        .menu-card-icon {
-            font-size: 2rem;
-            display: block;
-            filter: drop-shadow(0 2px 8px rgba(124, 92, 252, 0.3));
-            transition: all 0.4s cubic-bezier(0.34, 1.56, 0.64, 1);
-            animation: iconFloat 4s ease-in-out infinite;
-        }
-
-        .menu-card:hover .menu-card-icon {
-            transform: scale(1.15);
-            filter: drop-shadow(0 4px 15px rgba(124, 92, 252, 0.5));
-            animation-play-state: paused;
-        }
-
-        @keyframes iconFloat {
-            0%, 100% { transform: translateY(0); }
-            50% { transform: translateY(-3px); }
-        }
-
-        .menu-card-title {
-            font-family: 'Inter', -apple-system, sans-serif;
-            font-weight: 700;
-            font-size: 1rem;
-            color: var(--text-primary);
-            margin-bottom: 0.4rem;
-            letter-spacing: -0.01em;
-            position: relative;
-            z-index: 1;
-            transition: all 0.3s ease;
-            background: linear-gradient(140deg, #FFFFFF 0%, #E2E8F0 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-
-        .menu-card:hover .menu-card-title {
-            background: linear-gradient(140deg, #FFFFFF 0%, var(--primary-200) 100%);
-            -webkit-background-clip: text;
-            background-clip: text;
-        }
-
-        .menu-card-desc {
-            font-family: 'Outfit', sans-serif;
-            font-size: 0.82rem;
-            color: var(--text-muted);
-            line-height: 1.45;
-            margin-bottom: 0;
-            max-width: 200px;
-            position: relative;
-            z-index: 1;
-            transition: color 0.3s ease;
-        }
-
-        .menu-card:hover .menu-card-desc {
-            color: var(--text-secondary);
-        }
-
-        /* Shimmer effect on hover */
-        .menu-card-shimmer {
-            position: absolute;
-            top: 0;
-            left: -150%;
-            width: 50%;
-            height: 100%;
-            background: linear-gradient(
-                90deg,
-                transparent 0%,
-                rgba(255, 255, 255, 0.03) 25%,
-                rgba(255, 255, 255, 0.08) 50%,
-                rgba(255, 255, 255, 0.03) 75%,
-                transparent 100%
-            );
-            transform: skewX(-20deg);
-            transition: left 0.8s ease;
-            pointer-events: none;
-        }
-
-        .menu-card:hover .menu-card-shimmer {
-            left: 150%;
-        }
-
-        /* Color variants for different card types */
-        .menu-card[data-variant="capture"] .menu-card-icon-wrap {
-            background: linear-gradient(145deg, rgba(52, 211, 153, 0.2), rgba(52, 211, 153, 0.05));
-        }
-        .menu-card[data-variant="capture"]:hover {
-            border-color: rgba(52, 211, 153, 0.35);
-            box-shadow: 0 20px 50px rgba(0, 0, 0, 0.25), 0 10px 25px rgba(52, 211, 153, 0.2);
-        }
-
-        .menu-card[data-variant="analytics"] .menu-card-icon-wrap {
-            background: linear-gradient(145deg, rgba(56, 189, 248, 0.2), rgba(56, 189, 248, 0.05));
-        }
-        .menu-card[data-variant="analytics"]:hover {
-            border-color: rgba(56, 189, 248, 0.35);
-            box-shadow: 0 20px 50px rgba(0, 0, 0, 0.25), 0 10px 25px rgba(56, 189, 248, 0.2);
-        }
-
-        .menu-card[data-variant="settings"] .menu-card-icon-wrap {
-            background: linear-gradient(145deg, rgba(245, 158, 11, 0.2), rgba(245, 158, 11, 0.05));
-        }
-        .menu-card[data-variant="settings"]:hover {
-            border-color: rgba(245, 158, 11, 0.35);
-            box-shadow: 0 20px 50px rgba(0, 0, 0, 0.25), 0 10px 25px rgba(245, 158, 11, 0.2);
-        }
-
-        .menu-card[data-variant="team"] .menu-card-icon-wrap {
-            background: linear-gradient(145deg, rgba(244, 63, 94, 0.2), rgba(244, 63, 94, 0.05));
-        }
-        .menu-card[data-variant="team"]:hover {
-            border-color: rgba(244, 63, 94, 0.35);
-            box-shadow: 0 20px 50px rgba(0, 0, 0, 0.25), 0 10px 25px rgba(244, 63, 94, 0.2);
-        }
-
-        /* Entrance animation for cards */
-        .menu-card {
-            animation: menuCardEntrance 0.6s cubic-bezier(0.16, 1, 0.3, 1) backwards;
-        }
-
-        .menu-card:nth-child(1) { animation-delay: 0.05s; }
-        .menu-card:nth-child(2) { animation-delay: 0.1s; }
-        .menu-card:nth-child(3) { animation-delay: 0.15s; }
-        .menu-card:nth-child(4) { animation-delay: 0.2s; }
-        .menu-card:nth-child(5) { animation-delay: 0.25s; }
-        .menu-card:nth-child(6) { animation-delay: 0.3s; }
-        .menu-card:nth-child(7) { animation-delay: 0.35s; }
-
-        @keyframes menuCardEntrance {
-            from {
-                opacity: 0;
-                transform: translateY(30px) scale(0.9);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0) scale(1);
-            }
-        }
-
-        /* Responsive adjustments */
-        @media (max-width: 768px) {
-            .menu-card {
-                padding: 1.4rem 1.2rem 1rem;
-                min-height: 140px;
-                border-radius: var(--radius-lg);
-            }
-            
-            .menu-card-icon-wrap {
-                width: 54px;
-                height: 54px;
-                border-radius: 14px;
-                margin-bottom: 0.8rem;
-            }
-            
-            .menu-card-icon {
-                font-size: 1.7rem;
-            }
-            
-            .menu-card-title {
-                font-size: 0.92rem;
-            }
-            
-            .menu-card-desc {
-                font-size: 0.75rem;
-            }
-        }
-
-        @media (max-width: 480px) {
-            .menu-card {
-                padding: 1.2rem 1rem 0.9rem;
-                min-height: 120px;
-                flex-direction: row;
-                text-align: left;
-                gap: 1rem;
-            }
-            
-            .menu-card-icon-wrap {
-                width: 48px;
-                height: 48px;
-                border-radius: 12px;
-                margin-bottom: 0;
-                flex-shrink: 0;
-            }
-            
-            .menu-card-icon {
-                font-size: 1.5rem;
-            }
-            
-            .menu-card-content {
-                flex: 1;
-            }
-            
-            .menu-card-title {
-                font-size: 0.88rem;
-                margin-bottom: 0.2rem;
-            }
-            
-            .menu-card-desc {
-                font-size: 0.72rem;
-                max-width: none;
-            }
-        }
-
-        /* Button inside card styling override */
-        .menu-card-container div.stButton > button {
-            margin-top: 0.5rem;
-            background: linear-gradient(140deg, rgba(124, 92, 252, 0.2), rgba(124, 92, 252, 0.1)) !important;
-            border: 1px solid rgba(124, 92, 252, 0.25) !important;
-            color: var(--text-primary) !important;
-            font-size: 0.8rem !important;
-            padding: 0.5rem 1rem !important;
-            backdrop-filter: blur(8px);
-        }
-
-        .menu-card-container div.stButton > button:hover {
-            background: linear-gradient(140deg, rgba(124, 92, 252, 0.35), rgba(124, 92, 252, 0.2)) !important;
-            border-color: rgba(124, 92, 252, 0.5) !important;
-            transform: translateY(-2px) scale(1.02);
-        }
-
-        /* Hidden button approach - make card clickable */
-        .menu-card-clickable {
-            cursor: pointer;
-        }
-
-        .menu-card-clickable div.stButton {
-            position: absolute;
-            inset: 0;
-            opacity: 0;
-        }
-
-        .menu-card-clickable div.stButton > button {
-            width: 100% !important;
-            height: 100% !important;
-            background: transparent !important;
-            border: none !important;
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           EVENT LIST CARDS
-           ═══════════════════════════════════════════════════════ */
-        .event-list-card {
-            background: var(--glass-bg);
-            backdrop-filter: blur(16px) saturate(1.5);
-            border: 1px solid var(--border-subtle);
-            border-radius: var(--radius-lg);
-            padding: 1.2rem 1.5rem;
-            margin-bottom: 0.5rem;
-            transition: all var(--duration-normal) var(--ease-out);
-            position: relative;
-            overflow: hidden;
-        }
-
-        .event-list-card::before {
-            content: '';
-            position: absolute;
-            left: 0; top: 20%; bottom: 20%;
-            width: 3px;
-            border-radius: 0 var(--radius-full) var(--radius-full) 0;
-            background: linear-gradient(180deg, var(--primary-500), var(--secondary-500));
-            opacity: 0;
-            transition: opacity var(--duration-normal) ease;
-        }
-
-        .event-list-card:hover {
-            border-color: var(--border-hover);
-            box-shadow: var(--shadow-card-hover);
-            transform: translate3d(0, -2px, 0);
-        }
-
-        .event-list-card:hover::before { opacity: 1; }
-
-        .event-list-card h3 {
-            font-size: 1.15rem !important;
-            margin-bottom: 0.3rem !important;
-        }
-
-        .event-list-meta {
-            font-family: 'Space Grotesk', sans-serif;
-            font-size: 0.78rem;
-            color: var(--text-faint);
-            letter-spacing: 0.02em;
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           WELCOME BANNER (Home Page) — ENHANCED V2
-           ═══════════════════════════════════════════════════════ */
-        .welcome-banner {
-            background: linear-gradient(155deg, 
-                rgba(124, 92, 252, 0.06) 0%,
-                rgba(52, 211, 153, 0.04) 50%, 
-                rgba(124, 92, 252, 0.03) 100%
-            );
-            backdrop-filter: blur(24px) saturate(1.8);
-            -webkit-backdrop-filter: blur(24px) saturate(1.8);
-            border: 1px solid rgba(255, 255, 255, 0.06);
-            border-radius: var(--radius-xl);
-            padding: 2rem 2.5rem;
-            margin-bottom: 1.5rem;
-            position: relative;
-            overflow: hidden;
-            box-shadow:
-                0 8px 32px rgba(0, 0, 0, 0.15),
-                0 0 0 1px rgba(124, 92, 252, 0.05),
-                inset 0 1px 0 rgba(255, 255, 255, 0.05);
-        }
-
-        .welcome-banner::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 8%;
-            right: 8%;
-            height: 1px;
-            background: linear-gradient(90deg, 
-                transparent 0%,
-                rgba(255, 255, 255, 0.12) 25%,
-                rgba(124, 92, 252, 0.2) 50%,
-                rgba(255, 255, 255, 0.12) 75%,
-                transparent 100%
-            );
-        }
-
-        .welcome-banner::after {
-            content: '';
-            position: absolute;
-            top: -60%;
-            right: -25%;
-            width: 400px;
-            height: 400px;
-            border-radius: 50%;
-            background: radial-gradient(circle, 
-                rgba(124, 92, 252, 0.06) 0%,
-                rgba(52, 211, 153, 0.03) 40%,
-                transparent 70%
-            );
-            pointer-events: none;
-            animation: welcomeOrbFloat 20s ease-in-out infinite alternate;
-        }
-
-        @keyframes welcomeOrbFloat {
-            0% { transform: translate(0, 0) rotate(0deg); }
-            100% { transform: translate(-30px, 20px) rotate(10deg); }
-        }
-
-        .welcome-greeting {
-            font-family: 'Inter', -apple-system, sans-serif;
-            font-weight: 800;
-            font-size: 2rem;
-            letter-spacing: -0.03em;
-            background: linear-gradient(140deg, #FFFFFF 0%, var(--primary-200) 60%, var(--secondary-300) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 0.4rem;
-            line-height: 1.2;
-        }
-
-        .welcome-time {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.82rem;
-            color: var(--text-muted);
-            letter-spacing: 0.03em;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            flex-wrap: wrap;
-        }
-
-        /* Responsive welcome banner */
-        @media (max-width: 768px) {
-            .welcome-banner {
-                padding: 1.5rem 1.3rem;
-                border-radius: var(--radius-lg);
-            }
-            
-            .welcome-greeting {
-                font-size: 1.5rem;
-            }
-            
-            .welcome-time {
-                font-size: 0.72rem;
-            }
-        }
-
-        @media (max-width: 480px) {
-            .welcome-banner {
-                padding: 1.2rem 1rem;
-            }
-            
-            .welcome-greeting {
-                font-size: 1.25rem;
-            }
-            
-            .welcome-time {
-                font-size: 0.68rem;
-            }
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           ACCESSIBILITY & PERFORMANCE
-           ═══════════════════════════════════════════════════════ */
-
-        *:focus-visible {
-            outline: 2px solid var(--primary-500) !important;
-            outline-offset: 2px;
-            border-radius: 4px;
-        }
-
-        @media (prefers-reduced-motion: reduce) {
-            *, *::before, *::after {
-                animation-duration: 0.01ms !important;
-                animation-iteration-count: 1 !important;
-                transition-duration: 0.01ms !important;
-                scroll-behavior: auto !important;
-            }
-        }
-
-        @media (prefers-color-scheme: light) {
-            /* Future: Light mode overrides could go here */
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           RESPONSIVE BREAKPOINTS — COMPREHENSIVE MOBILE-FIRST
-           ═══════════════════════════════════════════════════════ */
-        
-        /* Extra Large Screens (1400px+) */
-        @media (min-width: 1400px) {
-            .main .block-container {
-                max-width: 1320px;
-                padding: 2rem 3rem;
-            }
-        }
-
-        /* Large Tablets & Small Laptops (1024px - 1199px) */
-        @media (max-width: 1199px) {
-            h1 { font-size: 2rem !important; }
-            .welcome-banner { padding: 1.8rem 2rem; }
-            [data-testid="stMetric"] { padding: 1.3rem 1.1rem; }
-        }
-
-        /* Tablets (768px - 1023px) */
-        @media (max-width: 1024px) {
-            h1 { font-size: 1.8rem !important; }
-            h2 { font-size: 1.4rem !important; }
-            h3 { font-size: 1.2rem !important; }
-            
-            .main .block-container {
-                padding: 1rem 1.5rem;
-            }
-            
-            /* Stack columns on tablet */
-            [data-testid="column"] {
-                min-width: 45% !important;
-            }
-            
-            .welcome-banner {
-                padding: 1.6rem 1.8rem;
-            }
-            
-            .welcome-greeting {
-                font-size: 1.6rem;
-            }
-            
-            [data-testid="stMetricValue"] {
-                font-size: 1.8rem !important;
-            }
-            
-            .seat-grid-container {
-                padding: 1.25rem;
-            }
-            
-            .seat-cell {
-                width: 50px;
-                height: 40px;
-            }
-        }
-
-        /* Small Tablets & Large Phones (768px) */
-        @media (max-width: 768px) {
-            h1 { font-size: 1.6rem !important; }
-            h2 { font-size: 1.3rem !important; }
-            h3 { font-size: 1.1rem !important; }
-            
-            .main .block-container {
-                padding: 0.75rem 1rem;
-            }
-            
-            /* Full width columns on mobile */
-            [data-testid="column"] {
-                min-width: 100% !important;
-                margin-bottom: 0.5rem;
-            }
-            
-            [data-testid="stMetricValue"] {
-                font-size: 1.5rem !important;
-            }
-            
-            [data-testid="stMetric"] {
-                padding: 1rem 0.8rem;
-            }
-            
-            [data-testid="stMetricLabel"] {
-                font-size: 0.65rem;
-            }
-            
-            div.stButton > button {
-                padding: 0.6rem 1rem !important;
-                font-size: 0.82rem !important;
-            }
-            
-            .login-title {
-                font-size: 2.2rem !important;
-            }
-            
-            .login-subtitle {
-                font-size: 0.75rem !important;
-                letter-spacing: 0.1em;
-            }
-            
-            .welcome-banner {
-                padding: 1.4rem 1.3rem;
-                margin-bottom: 1rem;
-                border-radius: var(--radius-lg);
-            }
-            
-            .welcome-greeting {
-                font-size: 1.4rem;
-            }
-            
-            .welcome-time {
-                font-size: 0.72rem;
-            }
-            
-            .seat-grid-container {
-                padding: 1rem;
-                border-radius: var(--radius-md);
-            }
-            
-            .seat-cell {
-                width: 44px;
-                height: 36px;
-            }
-            
-            .seat-name {
-                max-width: 38px;
-                font-size: 0.62rem;
-            }
-            
-            .seat-row-label {
-                width: 28px;
-                font-size: 0.6rem;
-            }
-            
-            .seat-legend {
-                flex-wrap: wrap;
-                gap: 1rem;
-                padding: 0.6rem 0.8rem;
-            }
-            
-            .seat-legend-item {
-                font-size: 0.68rem;
-            }
-            
-            /* Person Card Mobile */
-            .person-card {
-                padding: 1.2rem !important;
-                border-radius: var(--radius-md) !important;
-            }
-            
-            .person-card h3 {
-                font-size: 1rem !important;
-            }
-            
-            /* Form containers */
-            div[data-testid="stForm"] {
-                padding: 1.2rem !important;
-                border-radius: var(--radius-md) !important;
-            }
-            
-            /* Tabs */
-            .stTabs [data-baseweb="tab-list"] {
-                gap: 2px;
-                padding: 3px !important;
-            }
-            
-            .stTabs [data-baseweb="tab"] {
-                padding: 0.45rem 0.9rem !important;
-                font-size: 0.75rem !important;
-            }
-            
-            /* Expander */
-            [data-testid="stExpander"] details summary {
-                padding: 0.9rem 1rem !important;
-                font-size: 0.85rem !important;
-            }
-            
-            /* Data table */
-            .stDataFrame th {
-                padding: 0.6rem 0.5rem !important;
-                font-size: 0.68rem !important;
-            }
-            
-            .stDataFrame td {
-                padding: 0.5rem 0.5rem !important;
-                font-size: 0.78rem !important;
-            }
-            
-            /* File uploader */
-            [data-testid="stFileUploader"] {
-                padding: 1.5rem !important;
-            }
-            
-            /* Sidebar */
-            div[data-testid="stSidebar"] {
-                border-radius: 0 var(--radius-lg) var(--radius-lg) 0 !important;
-            }
-        }
-
-        /* Mobile Phones (480px) */
-        @media (max-width: 480px) {
-            h1 { font-size: 1.35rem !important; }
-            h2 { font-size: 1.15rem !important; }
-            h3 { font-size: 1rem !important; }
-            
-            .main .block-container {
-                padding: 0.5rem 0.75rem;
-            }
-            
-            .login-title {
-                font-size: 1.8rem !important;
-            }
-            
-            .login-subtitle {
-                font-size: 0.68rem !important;
-                margin-bottom: 1.8rem;
-            }
-            
-            .welcome-banner {
-                padding: 1.1rem 1rem;
-            }
-            
-            .welcome-greeting {
-                font-size: 1.2rem;
-            }
-            
-            .welcome-time {
-                font-size: 0.68rem;
-            }
-            
-            div.stButton > button {
-                padding: 0.55rem 0.8rem !important;
-                font-size: 0.78rem !important;
-                border-radius: var(--radius-sm) !important;
-            }
-            
-            [data-testid="stMetric"] {
-                padding: 0.9rem 0.7rem;
-                border-radius: var(--radius-md) !important;
-            }
-            
-            [data-testid="stMetricValue"] {
-                font-size: 1.3rem !important;
-            }
-            
-            [data-testid="stMetricLabel"] {
-                font-size: 0.6rem;
-            }
-            
-            .seat-grid-container {
-                padding: 0.75rem;
-            }
-            
-            .seat-cell {
-                width: 38px;
-                height: 30px;
-            }
-            
-            .seat-name {
-                max-width: 32px;
-                font-size: 0.55rem;
-            }
-            
-            .seat-row-label {
-                width: 24px;
-                font-size: 0.55rem;
-            }
-            
-            /* Inputs mobile */
-            .stTextInput > div > div > input,
-            .stDateInput > div > div > input,
-            .stNumberInput > div > div > input,
-            .stTextArea textarea {
-                padding: 0.55rem 0.8rem !important;
-                font-size: 0.85rem !important;
-            }
-            
-            /* Radio buttons mobile */
-            .stRadio > div > label {
-                padding: 0.45rem 0.8rem !important;
-                font-size: 0.8rem !important;
-            }
-            
-            /* Tabs mobile */
-            .stTabs [data-baseweb="tab"] {
-                padding: 0.4rem 0.7rem !important;
-                font-size: 0.7rem !important;
-            }
-            
-            /* Alerts mobile */
-            .stAlert {
-                padding: 0.7rem 0.9rem !important;
-                font-size: 0.8rem !important;
-            }
-            
-            /* PDF download button */
-            .pdf-download-btn {
-                padding: 0.7rem 1.2rem;
-                font-size: 0.8rem;
-            }
-        }
-
-        /* Extra Small Phones (360px) */
-        @media (max-width: 360px) {
-            h1 { font-size: 1.2rem !important; }
-            h2 { font-size: 1.05rem !important; }
-            
-            .login-title {
-                font-size: 1.5rem !important;
-            }
-            
-            .welcome-greeting {
-                font-size: 1.1rem;
-            }
-            
-            div.stButton > button {
-                padding: 0.5rem 0.7rem !important;
-                font-size: 0.72rem !important;
-            }
-            
-            .seat-cell {
-                width: 32px;
-                height: 26px;
-            }
-            
-            .seat-name {
-                max-width: 28px;
-                font-size: 0.5rem;
-            }
-        }
-
-        /* Landscape orientation on mobile */
-        @media (max-height: 500px) and (orientation: landscape) {
-            .login-title {
-                font-size: 1.8rem !important;
-                margin-bottom: 0.5rem;
-            }
-            
-            .login-subtitle {
-                margin-bottom: 1rem;
-            }
-            
-            .welcome-banner {
-                padding: 1rem;
-                margin-bottom: 0.75rem;
-            }
-        }
-
-        /* Touch device optimizations */
-        @media (hover: none) and (pointer: coarse) {
-            /* Larger touch targets */
-            div.stButton > button {
-                min-height: 44px;
-            }
-            
-            .stRadio > div > label {
-                min-height: 44px;
-            }
-            
-            .stCheckbox > label {
-                min-height: 44px;
-            }
-            
-            /* Remove hover effects that don't work on touch */
-            .menu-card:hover {
-                transform: none;
-            }
-            
-            .menu-card:active {
-                transform: scale(0.98);
-                background: linear-gradient(165deg, 
-                    rgba(255, 255, 255, 0.06) 0%,
-                    rgba(124, 92, 252, 0.06) 50%,
-                    rgba(52, 211, 153, 0.03) 100%
-                );
-            }
-            
-            /* Seat cells touch feedback */
-            .seat-cell:active {
-                transform: scale(0.95);
-            }
-        }
-
-        /* High contrast mode support */
-        @media (prefers-contrast: high) {
-            :root {
-                --border-default: rgba(255, 255, 255, 0.2);
-                --border-hover: rgba(124, 92, 252, 0.5);
-                --text-muted: #B8C0CC;
-            }
-            
-            div.stButton > button {
-                border-width: 2px !important;
-            }
-            
-            .stTextInput > div > div > input,
-            .stTextArea textarea {
-                border-width: 2px !important;
-            }
-        }
-
-        /* ═══════════════════════════════════════════════════════
-           HIGH DPI / RETINA ADJUSTMENTS
-           ═══════════════════════════════════════════════════════ */
-        @media (-webkit-min-device-pixel-ratio: 2), (min-resolution: 192dpi) {
-            .star--sm { box-shadow: 0 0 1.5px rgba(255, 255, 255, 0.2); }
-            .star--md { box-shadow: 0 0 3px rgba(200, 210, 255, 0.3); }
-        }
-
-        /* ═══════════════════════════════════════════════════════════════════
-           EQUIVISION — ULTRA-PREMIUM ENHANCEMENTS v5.5
-           World-class micro-interactions & advanced effects
-           ═══════════════════════════════════════════════════════════════════ */
-
-        /* ══════════════ BUTTON RIPPLE EFFECT ══════════════ */
-        div.stButton > button {
-            position: relative;
-            overflow: hidden;
-            transform-style: preserve-3d;
-            perspective: 1000px;
-        }
-
-        div.stButton > button .ripple {
-            position: absolute;
-            border-radius: 50%;
-            transform: scale(0);
-            animation: rippleEffect 0.6s linear;
-            background: rgba(255, 255, 255, 0.25);
-            pointer-events: none;
-        }
-
-        @keyframes rippleEffect {
-            to { transform: scale(4); opacity: 0; }
-        }
-
-        /* Button 3D lift on hover */
-        div.stButton > button:hover {
-            transform: translate3d(0, -3px, 0) rotateX(2deg) scale(1.015);
-            box-shadow:
-                0 12px 35px rgba(124, 92, 252, 0.35),
-                0 4px 12px rgba(0,0,0,0.2),
-                0 1px 3px rgba(0,0,0,0.15),
-                inset 0 1px 0 rgba(255,255,255,0.2) !important;
-        }
-
-        /* Magnetic button effect - subtle movement toward cursor */
-        div.stButton > button:hover::after {
-            content: '';
-            position: absolute;
-            inset: 0;
-            background: radial-gradient(
-                circle at var(--mouse-x, 50%) var(--mouse-y, 50%),
-                rgba(255,255,255,0.15) 0%,
-                transparent 50%
-            );
-            opacity: 1;
-            pointer-events: none;
-        }
-
-        /* ══════════════ SKELETON LOADING ANIMATION ══════════════ */
-        @keyframes skeletonPulse {
-            0%, 100% { 
-                background-position: 200% 50%;
-                opacity: 0.6;
-            }
-            50% { 
-                background-position: -200% 50%;
-                opacity: 1;
-            }
-        }
-
-        .skeleton-loader {
-            background: linear-gradient(
-                90deg,
-                rgba(255,255,255,0.03) 0%,
-                rgba(124, 92, 252, 0.08) 25%,
-                rgba(255,255,255,0.12) 50%,
-                rgba(124, 92, 252, 0.08) 75%,
-                rgba(255,255,255,0.03) 100%
-            );
-            background-size: 400% 100%;
-            animation: skeletonPulse 2s ease-in-out infinite;
-            border-radius: var(--radius-md);
-        }
-
-        /* ══════════════ FLOATING LABEL EFFECT FOR INPUTS ══════════════ */
-        .stTextInput > div,
-        .stNumberInput > div,
-        .stDateInput > div {
-            position: relative;
-        }
-
-        .stTextInput > div > div > input:not(:placeholder-shown) + label,
-        .stTextInput > div > div > input:focus + label {
-            transform: translateY(-1.6rem) scale(0.85);
-            color: var(--primary-400);
-            font-weight: 600;
-        }
-
-        /* Enhanced input focus ring with glow animation */
-        .stTextInput > div > div > input:focus,
-        .stDateInput > div > div > input:focus,
-        .stNumberInput > div > div > input:focus,
-        .stTextArea textarea:focus {
-            border-color: var(--primary-400) !important;
-            box-shadow: 
-                0 0 0 4px var(--primary-glow-soft),
-                0 0 30px rgba(124, 92, 252, 0.1),
-                0 4px 20px rgba(0,0,0,0.15) !important;
-            background-color: rgba(0, 0, 0, 0.45) !important;
-            outline: none !important;
-            animation: inputFocusPulse 2s ease-in-out infinite;
-        }
-
-        @keyframes inputFocusPulse {
-            0%, 100% { box-shadow: 0 0 0 4px var(--primary-glow-soft), 0 0 30px rgba(124, 92, 252, 0.1); }
-            50% { box-shadow: 0 0 0 5px rgba(124, 92, 252, 0.18), 0 0 40px rgba(124, 92, 252, 0.15); }
-        }
-
-        /* Input typing animation cursor */
-        .stTextInput > div > div > input:focus::placeholder {
-            animation: typingCursor 1s steps(1) infinite;
-        }
-
-        @keyframes typingCursor {
-            50% { opacity: 0; }
-        }
-
-        /* ══════════════ PREMIUM CHECKBOX / TOGGLE STYLING ══════════════ */
-        .stCheckbox > label > div[data-testid="stCheckbox"] {
-            position: relative;
-        }
-
-        .stCheckbox > label > div > div {
-            width: 22px !important;
-            height: 22px !important;
-            border: 2px solid var(--border-default) !important;
-            border-radius: 7px !important;
-            background: var(--bg-input) !important;
-            transition: all var(--duration-fast) var(--ease-spring) !important;
-            position: relative;
-        }
-
-        .stCheckbox > label > div > div:hover {
-            border-color: var(--primary-400) !important;
-            box-shadow: 0 0 12px var(--primary-glow-soft);
-            transform: scale(1.05);
-        }
-
-        .stCheckbox > label > div > div[aria-checked="true"] {
-            background: linear-gradient(140deg, var(--primary-500), var(--primary-700)) !important;
-            border-color: var(--primary-400) !important;
-            box-shadow: 0 2px 10px rgba(124, 92, 252, 0.35);
-            animation: checkBounce 0.35s var(--ease-spring);
-        }
-
-        @keyframes checkBounce {
-            0% { transform: scale(0.8); }
-            50% { transform: scale(1.15); }
-            100% { transform: scale(1); }
-        }
-
-        /* Checkmark animation */
-        .stCheckbox > label > div > div[aria-checked="true"]::after {
-            content: '';
-            position: absolute;
-            left: 6px;
-            top: 2px;
-            width: 6px;
-            height: 12px;
-            border: solid white;
-            border-width: 0 2.5px 2.5px 0;
-            transform: rotate(45deg);
-            animation: checkmarkDraw 0.2s ease-out 0.1s both;
-        }
-
-        @keyframes checkmarkDraw {
-            from { clip-path: inset(100% 0 0 0); }
-            to { clip-path: inset(0 0 0 0); }
-        }
-
-        /* Toggle Switch Enhancement */
-        .stToggle [data-baseweb="checkbox"] {
-            transform-origin: center;
-            transition: all var(--duration-fast) var(--ease-spring) !important;
-        }
-
-        .stToggle [data-baseweb="checkbox"]:hover {
-            transform: scale(1.03);
-        }
-
-        .stToggle [data-baseweb="checkbox"] > div {
-            background: var(--bg-input) !important;
-            border: 1px solid var(--border-default) !important;
-            transition: all var(--duration-normal) var(--ease-out) !important;
-        }
-
-        .stToggle [data-baseweb="checkbox"][aria-checked="true"] > div {
-            background: linear-gradient(90deg, var(--primary-500), var(--secondary-500)) !important;
-            border-color: var(--primary-400) !important;
-            box-shadow: 0 0 16px var(--primary-glow-soft), inset 0 1px 0 rgba(255,255,255,0.15);
-        }
-
-        /* ══════════════ ENHANCED TOOLTIP STYLING ══════════════ */
-        [data-testid="stTooltipIcon"] {
-            color: var(--text-faint) !important;
-            transition: all var(--duration-fast) ease !important;
-        }
-
-        [data-testid="stTooltipIcon"]:hover {
-            color: var(--primary-400) !important;
-            transform: scale(1.15);
-            filter: drop-shadow(0 0 6px var(--primary-glow-soft));
-        }
-
-        /* Tooltip bubble enhancement */
-        [role="tooltip"],
-        .stTooltipContent {
-            background: rgba(15, 18, 25, 0.95) !important;
-            backdrop-filter: blur(20px) saturate(1.8) !important;
-            border: 1px solid var(--border-default) !important;
-            border-radius: var(--radius-sm) !important;
-            box-shadow: 
-                0 8px 32px rgba(0,0,0,0.35),
-                0 0 0 1px rgba(124, 92, 252, 0.1),
-                inset 0 1px 0 rgba(255,255,255,0.05) !important;
-            padding: 0.75rem 1rem !important;
-            animation: tooltipFadeIn 0.2s var(--ease-out) !important;
-        }
-
-        @keyframes tooltipFadeIn {
-            from { opacity: 0; transform: translateY(4px) scale(0.96); }
-            to { opacity: 1; transform: translateY(0) scale(1); }
-        }
-
-        /* ══════════════ ENHANCED ALERT/NOTIFICATION STYLING ══════════════ */
-        .stAlert, [data-testid="stAlert"] {
-            animation: alertSlideIn 0.4s var(--ease-out) !important;
-            position: relative;
-            overflow: hidden;
-        }
-
-        @keyframes alertSlideIn {
-            from { 
-                opacity: 0; 
-                transform: translateX(-12px);
-                filter: blur(4px);
-            }
-            to { 
-                opacity: 1; 
-                transform: translateX(0);
-                filter: blur(0);
-            }
-        }
-
-        /* Alert left accent bar animation */
-        .stAlert::before,
-        [data-testid="stAlert"]::before {
-            content: '';
-            position: absolute;
-            left: 0;
-            top: 0;
-            bottom: 0;
-            width: 4px;
-            border-radius: 4px 0 0 4px;
-            animation: alertBarGrow 0.5s var(--ease-out) 0.1s both;
-        }
-
-        @keyframes alertBarGrow {
-            from { transform: scaleY(0); }
-            to { transform: scaleY(1); }
-        }
-
-        /* Success alert */
-        div[data-testid="stAlert"][data-baseweb*="positive"]::before,
-        .element-container:has(.stSuccess)::before {
-            background: linear-gradient(180deg, var(--secondary-300), var(--secondary-500));
-            box-shadow: 0 0 12px var(--secondary-glow);
-        }
-
-        /* Error alert */
-        div[data-testid="stAlert"][data-baseweb*="negative"]::before {
-            background: linear-gradient(180deg, var(--rose-400), var(--rose-600));
-            box-shadow: 0 0 12px var(--rose-glow);
-        }
-
-        /* Warning alert */
-        div[data-testid="stAlert"][data-baseweb*="warning"]::before {
-            background: linear-gradient(180deg, var(--accent-300), var(--accent));
-            box-shadow: 0 0 12px var(--accent-glow);
-        }
-
-        /* Info alert shimmer */
-        div[data-testid="stAlert"]::after {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 60%;
-            height: 100%;
-            background: linear-gradient(
-                90deg,
-                transparent,
-                rgba(255,255,255,0.03),
-                rgba(255,255,255,0.06),
-                rgba(255,255,255,0.03),
-                transparent
-            );
-            animation: alertShimmer 3s ease-in-out infinite;
-            pointer-events: none;
-        }
-
-        @keyframes alertShimmer {
-            0%, 100% { left: -100%; }
-            50% { left: 150%; }
-        }
-
-        /* ══════════════ ENHANCED IMAGE STYLING ══════════════ */
-        .stImage {
-            position: relative;
-            overflow: hidden;
-            border-radius: var(--radius-lg) !important;
-        }
-
-        .stImage::before {
-            content: '';
-            position: absolute;
-            inset: 0;
-            border-radius: inherit;
-            border: 1px solid var(--border-subtle);
-            pointer-events: none;
-            z-index: 1;
-            transition: border-color var(--duration-normal) ease;
-        }
-
-        .stImage:hover::before {
-            border-color: var(--border-hover);
-        }
-
-        .stImage img {
-            border-radius: var(--radius-lg) !important;
-            transition: 
-                transform var(--duration-slow) var(--ease-out),
-                filter var(--duration-normal) ease !important;
-            will-change: transform;
-        }
-
-        .stImage:hover img {
-            transform: scale(1.02);
-            filter: brightness(1.03) contrast(1.02);
-        }
-
-        /* Image reflection/glow effect on hover */
-        .stImage::after {
-            content: '';
-            position: absolute;
-            bottom: -50%;
-            left: 10%;
-            right: 10%;
-            height: 50%;
-            background: inherit;
-            filter: blur(25px);
-            opacity: 0;
-            transition: opacity var(--duration-normal) ease;
-            pointer-events: none;
-            z-index: -1;
-        }
-
-        .stImage:hover::after {
-            opacity: 0.15;
-        }
-
-        /* ══════════════ ENHANCED SPINNER / LOADER ══════════════ */
-        .stSpinner > div {
-            position: relative;
-        }
-
-        .stSpinner > div::before {
-            content: '';
-            position: absolute;
-            inset: -4px;
-            border-radius: 50%;
-            background: conic-gradient(
-                from 0deg,
-                transparent,
-                var(--primary-glow-soft),
-                var(--primary-400),
-                var(--secondary-400),
-                transparent
-            );
-            animation: spinnerGlow 1.5s linear infinite;
-            opacity: 0.5;
-            filter: blur(8px);
-        }
-
-        @keyframes spinnerGlow {
-            from { transform: rotate(0deg); }
-            to { transform: rotate(360deg); }
-        }
-
-        /* Custom loading dots animation */
-        .loading-dots {
-            display: inline-flex;
-            gap: 4px;
-        }
-
-        .loading-dots span {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            background: var(--primary-400);
-            animation: dotBounce 1.4s ease-in-out infinite both;
-        }
-
-        .loading-dots span:nth-child(1) { animation-delay: -0.32s; }
-        .loading-dots span:nth-child(2) { animation-delay: -0.16s; }
-        .loading-dots span:nth-child(3) { animation-delay: 0s; }
-
-        @keyframes dotBounce {
-            0%, 80%, 100% { transform: scale(0.6); opacity: 0.5; }
-            40% { transform: scale(1); opacity: 1; }
-        }
-
-        /* ══════════════ ENHANCED SELECTBOX/DROPDOWN ══════════════ */
-        .stSelectbox > div > div,
-        .stMultiSelect > div > div {
-            transition: all var(--duration-fast) var(--ease-out) !important;
-        }
-
-        .stSelectbox > div > div:hover,
-        .stMultiSelect > div > div:hover {
-            border-color: var(--border-hover) !important;
-            box-shadow: 0 4px 16px rgba(124, 92, 252, 0.08);
-        }
-
-        /* Dropdown menu enhancement */
-        [data-baseweb="popover"],
-        [data-baseweb="menu"],
-        [data-baseweb="select"] [role="listbox"] {
-            background: rgba(15, 18, 25, 0.95) !important;
-            backdrop-filter: blur(24px) saturate(1.8) !important;
-            border: 1px solid var(--border-default) !important;
-            border-radius: var(--radius-md) !important;
-            box-shadow: 
-                0 16px 48px rgba(0,0,0,0.4),
-                0 0 0 1px rgba(124, 92, 252, 0.08),
-                inset 0 1px 0 rgba(255,255,255,0.04) !important;
-            animation: dropdownSlide 0.2s var(--ease-out) !important;
-            overflow: hidden;
-        }
-
-        @keyframes dropdownSlide {
-            from { opacity: 0; transform: translateY(-8px) scale(0.97); }
-            to { opacity: 1; transform: translateY(0) scale(1); }
-        }
-
-        /* Dropdown option hover */
-        [data-baseweb="menu"] li:hover,
-        [role="option"]:hover {
-            background: rgba(124, 92, 252, 0.1) !important;
-            transition: background var(--duration-instant) ease !important;
-        }
-
-        [data-baseweb="menu"] li[aria-selected="true"],
-        [role="option"][aria-selected="true"] {
-            background: linear-gradient(90deg, rgba(124, 92, 252, 0.15), rgba(124, 92, 252, 0.08)) !important;
-            border-left: 3px solid var(--primary-500);
-        }
-
-        /* ══════════════ ENHANCED EXPANDER ANIMATION ══════════════ */
-        [data-testid="stExpander"] {
-            transition: all var(--duration-normal) var(--ease-out) !important;
-        }
-
-        [data-testid="stExpander"] details {
-            transition: all var(--duration-normal) var(--ease-out) !important;
-        }
-
-        [data-testid="stExpander"] details[open] {
-            background: rgba(124, 92, 252, 0.02) !important;
-        }
-
-        [data-testid="stExpander"] details summary svg {
-            transition: transform var(--duration-normal) var(--ease-spring) !important;
-        }
-
-        [data-testid="stExpander"] details[open] summary svg {
-            transform: rotate(90deg);
-        }
-
-        /* Expander content slide animation */
-        [data-testid="stExpander"] details > div {
-            animation: expanderOpen 0.35s var(--ease-out);
-        }
-
-        @keyframes expanderOpen {
-            from { 
-                opacity: 0;
-                transform: translateY(-8px);
-                max-height: 0;
-            }
-            to { 
-                opacity: 1;
-                transform: translateY(0);
-                max-height: 2000px;
-            }
-        }
-
-        /* ══════════════ NUMBER INPUT ARROWS STYLING ══════════════ */
-        .stNumberInput button {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-subtle) !important;
-            border-radius: var(--radius-xs) !important;
-            color: var(--text-secondary) !important;
-            transition: all var(--duration-fast) var(--ease-out) !important;
-        }
-
-        .stNumberInput button:hover {
-            background: rgba(124, 92, 252, 0.1) !important;
-            border-color: var(--primary-400) !important;
-            color: var(--primary-300) !important;
-            transform: scale(1.08);
-        }
-
-        .stNumberInput button:active {
-            transform: scale(0.95);
-            background: rgba(124, 92, 252, 0.2) !important;
-        }
-
-        /* ══════════════ ENHANCED FILE UPLOADER ══════════════ */
-        [data-testid="stFileUploader"] {
-            position: relative;
-            overflow: hidden;
-        }
-
-        [data-testid="stFileUploader"]::before {
-            content: '';
-            position: absolute;
-            inset: 4px;
-            border: 2px dashed var(--border-default);
-            border-radius: calc(var(--radius-lg) - 4px);
-            pointer-events: none;
-            transition: all var(--duration-normal) ease;
-        }
-
-        [data-testid="stFileUploader"]:hover::before {
-            border-color: var(--primary-400);
-            animation: dashedBorderMove 0.8s linear infinite;
-        }
-
-        @keyframes dashedBorderMove {
-            from { stroke-dashoffset: 0; }
-            to { stroke-dashoffset: 20; }
-        }
-
-        /* File uploader drag active state */
-        [data-testid="stFileUploader"]:focus-within {
-            border-color: var(--primary-500) !important;
-            background: rgba(124, 92, 252, 0.06) !important;
-            box-shadow: 
-                inset 0 0 40px rgba(124, 92, 252, 0.05),
-                0 0 30px rgba(124, 92, 252, 0.08) !important;
-        }
-
-        /* Upload icon pulse animation */
-        [data-testid="stFileUploader"] svg {
-            animation: uploadIconFloat 3s ease-in-out infinite;
-        }
-
-        @keyframes uploadIconFloat {
-            0%, 100% { transform: translateY(0); }
-            50% { transform: translateY(-4px); }
-        }
-
-        /* ══════════════ ENHANCED DATA EDITOR ══════════════ */
-        [data-testid="stDataFrame"] [role="grid"] {
-            border-radius: var(--radius-md) !important;
-            overflow: hidden;
-        }
-
-        [data-testid="stDataFrame"] [role="gridcell"] {
-            transition: background var(--duration-instant) ease !important;
-        }
-
-        [data-testid="stDataFrame"] [role="gridcell"]:focus {
-            outline: 2px solid var(--primary-400) !important;
-            outline-offset: -2px;
-            background: rgba(124, 92, 252, 0.08) !important;
-        }
-
-        /* Row selection animation */
-        [data-testid="stDataFrame"] [role="row"]:hover [role="gridcell"] {
-            background: rgba(124, 92, 252, 0.04) !important;
-        }
-
-        /* ══════════════ COPY BUTTON ENHANCEMENT ══════════════ */
-        .stCodeBlock button,
-        button[aria-label*="Copy"] {
-            background: var(--bg-card) !important;
-            border: 1px solid var(--border-subtle) !important;
-            border-radius: var(--radius-xs) !important;
-            transition: all var(--duration-fast) var(--ease-out) !important;
-        }
-
-        .stCodeBlock button:hover,
-        button[aria-label*="Copy"]:hover {
-            background: rgba(124, 92, 252, 0.15) !important;
-            border-color: var(--primary-400) !important;
-            transform: scale(1.05);
-        }
-
-        .stCodeBlock button:active,
-        button[aria-label*="Copy"]:active {
-            transform: scale(0.95);
-        }
-
-        /* Copy success state */
-        .stCodeBlock button[data-copied="true"]::after {
-            content: '✓';
-            position: absolute;
-            animation: copySuccess 0.3s var(--ease-spring);
-        }
-
-        @keyframes copySuccess {
-            from { transform: scale(0); opacity: 0; }
-            to { transform: scale(1); opacity: 1; }
-        }
-
-        /* ══════════════ ENHANCED RADIO BUTTONS ══════════════ */
-        .stRadio > div > label {
-            position: relative;
-            overflow: hidden;
-        }
-
-        .stRadio > div > label::before {
-            content: '';
-            position: absolute;
-            inset: 0;
-            background: linear-gradient(
-                90deg,
-                transparent,
-                rgba(124, 92, 252, 0.04),
-                transparent
-            );
-            transform: translateX(-100%);
-            transition: transform 0.5s ease;
-        }
-
-        .stRadio > div > label:hover::before {
-            transform: translateX(100%);
-        }
-
-        /* Selected radio glow */
-        .stRadio > div > label[data-baseweb="radio"]:has(input:checked) {
-            background: linear-gradient(140deg, rgba(124, 92, 252, 0.12), rgba(124, 92, 252, 0.05)) !important;
-            border-color: var(--primary-400) !important;
-            box-shadow: 
-                0 4px 16px rgba(124, 92, 252, 0.15),
-                inset 0 1px 0 rgba(255,255,255,0.05) !important;
-        }
-
-        /* ══════════════ CAMERA INPUT ENHANCEMENT ══════════════ */
-        div[data-testid="stCameraInput"] {
-            position: relative;
-        }
-
-        div[data-testid="stCameraInput"]::before {
-            content: '';
-            position: absolute;
-            inset: -2px;
-            border-radius: calc(var(--radius-lg) + 2px);
-            background: linear-gradient(
-                135deg,
-                var(--primary-500),
-                var(--secondary-500),
-                var(--primary-500)
-            );
-            background-size: 300% 300%;
-            animation: cameraGradient 4s ease infinite;
-            z-index: -1;
-            opacity: 0;
-            transition: opacity var(--duration-normal) ease;
-        }
-
-        div[data-testid="stCameraInput"]:hover::before {
-            opacity: 1;
-        }
-
-        @keyframes cameraGradient {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        /* Camera button pulse when active */
-        div[data-testid="stCameraInput"] button {
-            animation: cameraPulse 2s ease-in-out infinite;
-        }
-
-        @keyframes cameraPulse {
-            0%, 100% { box-shadow: 0 0 0 0 rgba(124, 92, 252, 0.4); }
-            50% { box-shadow: 0 0 0 8px rgba(124, 92, 252, 0); }
-        }
-
-        /* ══════════════ TEXT SELECTION STYLING ══════════════ */
-        ::selection {
-            background: rgba(124, 92, 252, 0.35);
-            color: white;
-        }
-
-        ::-moz-selection {
-            background: rgba(124, 92, 252, 0.35);
-            color: white;
-        }
-
-        /* ══════════════ LINK STYLING ══════════════ */
-        a {
-            color: var(--primary-300);
-            text-decoration: none;
-            position: relative;
-            transition: color var(--duration-fast) ease;
-        }
-
-        a::after {
-            content: '';
-            position: absolute;
-            bottom: -2px;
-            left: 0;
-            width: 0;
-            height: 2px;
-            background: linear-gradient(90deg, var(--primary-400), var(--secondary-400));
-            transition: width var(--duration-normal) var(--ease-out);
-        }
-
-        a:hover {
-            color: var(--primary-200);
-        }
-
-        a:hover::after {
-            width: 100%;
-        }
-
-        /* ══════════════ ENHANCED FORM CONTAINER ══════════════ */
-        div[data-testid="stForm"] {
-            position: relative;
-        }
-
-        div[data-testid="stForm"]::after {
-            content: '';
-            position: absolute;
-            bottom: 0;
-            left: 50%;
-            transform: translateX(-50%);
-            width: 60%;
-            height: 1px;
-            background: linear-gradient(
-                90deg,
-                transparent,
-                rgba(124, 92, 252, 0.2),
-                rgba(52, 211, 153, 0.15),
-                rgba(124, 92, 252, 0.2),
-                transparent
-            );
-        }
-
-        /* Form submit animation */
-        div[data-testid="stForm"] div.stButton > button[type="submit"] {
-            position: relative;
-        }
-
-        div[data-testid="stForm"] div.stButton > button[type="submit"]::before {
-            content: '';
-            position: absolute;
-            inset: -3px;
-            border-radius: calc(var(--radius-md) + 3px);
-            background: linear-gradient(
-                90deg,
-                var(--primary-500),
-                var(--secondary-500),
-                var(--primary-500)
-            );
-            background-size: 200% 100%;
-            animation: submitGlow 2s ease-in-out infinite;
-            opacity: 0;
-            z-index: -1;
-            transition: opacity var(--duration-normal) ease;
-        }
-
-        div[data-testid="stForm"] div.stButton > button[type="submit"]:hover::before {
-            opacity: 0.6;
-        }
-
-        @keyframes submitGlow {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        /* ══════════════ COLUMN HOVER EFFECTS ══════════════ */
-        [data-testid="column"] > div > div {
-            transition: transform var(--duration-normal) var(--ease-out);
-        }
-
-        [data-testid="column"]:hover > div > div {
-            transform: translateY(-1px);
-        }
-
-        /* ══════════════ MARKDOWN CONTENT STYLING ══════════════ */
-        .stMarkdown code {
-            background: rgba(124, 92, 252, 0.12) !important;
-            padding: 0.15em 0.4em !important;
-            border-radius: var(--radius-xs) !important;
-            font-family: 'JetBrains Mono', monospace !important;
-            font-size: 0.88em !important;
-            color: var(--primary-200) !important;
-            border: 1px solid rgba(124, 92, 252, 0.15);
-        }
-
-        .stMarkdown blockquote {
-            border-left: 3px solid var(--primary-500);
-            padding-left: 1rem;
-            margin-left: 0;
-            background: rgba(124, 92, 252, 0.03);
-            border-radius: 0 var(--radius-sm) var(--radius-sm) 0;
-            padding: 0.75rem 1rem;
-        }
-
-        /* ══════════════ BADGE STYLING ══════════════ */
-        .badge {
-            display: inline-flex;
-            align-items: center;
-            padding: 0.25rem 0.7rem;
-            border-radius: var(--radius-full);
-            font-size: 0.72rem;
-            font-weight: 600;
-            font-family: 'Space Grotesk', sans-serif;
-            letter-spacing: 0.02em;
-            text-transform: uppercase;
-            animation: badgePop 0.3s var(--ease-spring);
-        }
-
-        .badge-purple {
-            background: linear-gradient(140deg, rgba(124, 92, 252, 0.2), rgba(124, 92, 252, 0.1));
-            color: var(--primary-200);
-            border: 1px solid rgba(124, 92, 252, 0.25);
-        }
-
-        .badge-green {
-            background: linear-gradient(140deg, rgba(52, 211, 153, 0.2), rgba(52, 211, 153, 0.1));
-            color: var(--secondary-300);
-            border: 1px solid rgba(52, 211, 153, 0.25);
-        }
-
-        .badge-rose {
-            background: linear-gradient(140deg, rgba(244, 63, 94, 0.2), rgba(244, 63, 94, 0.1));
-            color: var(--rose-400);
-            border: 1px solid rgba(244, 63, 94, 0.25);
-        }
-
-        @keyframes badgePop {
-            from { transform: scale(0.8); opacity: 0; }
-            to { transform: scale(1); opacity: 1; }
-        }
-
-        /* ══════════════ GLASS CARD VARIATIONS ══════════════ */
-        .card-glow-purple {
-            box-shadow: 
-                var(--shadow-card),
-                0 0 40px rgba(124, 92, 252, 0.08),
-                inset 0 0 30px rgba(124, 92, 252, 0.02) !important;
-        }
-
-        .card-glow-green {
-            box-shadow: 
-                var(--shadow-card),
-                0 0 40px rgba(52, 211, 153, 0.08),
-                inset 0 0 30px rgba(52, 211, 153, 0.02) !important;
-        }
-
-        /* ══════════════ FOCUS RING IMPROVEMENTS ══════════════ */
-        *:focus-visible {
-            outline: 2px solid var(--primary-400) !important;
-            outline-offset: 3px;
-            border-radius: var(--radius-xs);
-            animation: focusRingPulse 1.5s ease-in-out infinite;
-        }
-
-        /* ══════════════ CURSOR ENHANCEMENTS ══════════════ */
-        div.stButton > button,
-        .stRadio label,
-        .stCheckbox label,
-        .stSelectbox,
-        .stMultiSelect,
-        .menu-card,
-        .event-list-card,
-        a {
-            cursor: pointer;
-        }
-
-        /* ══════════════ PRINT STYLES ══════════════ */
-        @media print {
-            .stApp::before,
-            .stApp::after,
-            .aurora,
-            #stars-container,
-            .shooting-star {
-                display: none !important;
-            }
-
-            body, .stApp {
-                background: white !important;
-                color: black !important;
-            }
-
-            * {
-                animation: none !important;
-                transition: none !important;
-            }
-        }
-
-        /* ══════════════ UTILITY ANIMATIONS ══════════════ */
-        .animate-fade-in {
-            animation: fadeIn 0.5s var(--ease-out) both;
-        }
-
-        .animate-slide-up {
-            animation: slideUp 0.5s var(--ease-out) both;
-        }
-
-        .animate-scale-in {
-            animation: scaleIn 0.4s var(--ease-spring) both;
-        }
-
-        .animate-bounce-in {
-            animation: bounceIn 0.6s var(--ease-bounce) both;
-        }
-
-        @keyframes fadeIn {
-            from { opacity: 0; }
-            to { opacity: 1; }
-        }
-
-        @keyframes slideUp {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        @keyframes scaleIn {
-            from { opacity: 0; transform: scale(0.9); }
-            to { opacity: 1; transform: scale(1); }
-        }
-
-        @keyframes bounceIn {
-            0% { opacity: 0; transform: scale(0.3); }
-            50% { transform: scale(1.05); }
-            70% { transform: scale(0.9); }
-            100% { opacity: 1; transform: scale(1); }
-        }
-
-        /* ══════════════ STAGGER DELAY UTILITIES ══════════════ */
-        .stagger-1 { animation-delay: 0.05s; }
-        .stagger-2 { animation-delay: 0.1s; }
-        .stagger-3 { animation-delay: 0.15s; }
-        .stagger-4 { animation-delay: 0.2s; }
-        .stagger-5 { animation-delay: 0.25s; }
-        .stagger-6 { animation-delay: 0.3s; }
-
-        /* ══════════════ SHIMMER TEXT EFFECT ══════════════ */
-        .shimmer-text {
-            background: linear-gradient(
-                90deg,
-                var(--text-primary) 0%,
-                var(--primary-300) 25%,
-                var(--text-primary) 50%,
-                var(--secondary-300) 75%,
-                var(--text-primary) 100%
-            );
-            background-size: 400% 100%;
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            animation: shimmerText 4s ease-in-out infinite;
-        }
-
-        @keyframes shimmerText {
-            0% { background-position: 100% 50%; }
-            100% { background-position: -100% 50%; }
-        }
-
-        /* ══════════════ GLASS DIVIDER ══════════════ */
-        .glass-divider {
-            height: 1px;
-            background: linear-gradient(
-                90deg,
-                transparent,
-                var(--border-subtle) 10%,
-                rgba(124, 92, 252, 0.2) 30%,
-                rgba(52, 211, 153, 0.15) 50%,
-                rgba(124, 92, 252, 0.2) 70%,
-                var(--border-subtle) 90%,
-                transparent
-            );
-            margin: 2rem 0;
-            position: relative;
-        }
-
-        .glass-divider::after {
-            content: '';
-            position: absolute;
-            top: -2px;
-            left: 50%;
-            transform: translateX(-50%);
-            width: 6px;
-            height: 6px;
-            border-radius: 50%;
-            background: var(--primary-400);
-            box-shadow: 0 0 12px var(--primary-glow);
-        }
-
-        /* ══════════════ FLOATING ICON ANIMATION ══════════════ */
-        .float-icon {
-            animation: floatIcon 3s ease-in-out infinite;
-        }
-
-        @keyframes floatIcon {
-            0%, 100% { transform: translateY(0) rotate(0deg); }
-            25% { transform: translateY(-4px) rotate(2deg); }
-            75% { transform: translateY(2px) rotate(-1deg); }
-        }
-
-        /* ══════════════ SUCCESS CHECKMARK ANIMATION ══════════════ */
-        .success-check {
-            width: 56px;
-            height: 56px;
-            border-radius: 50%;
-            background: linear-gradient(140deg, var(--secondary-500), var(--secondary-700));
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            animation: successPop 0.5s var(--ease-spring);
-            box-shadow: 0 4px 20px var(--secondary-glow);
-        }
-
-        .success-check::after {
-            content: '✓';
-            color: white;
-            font-size: 1.5rem;
-            font-weight: bold;
-            animation: checkDraw 0.3s ease-out 0.2s both;
-        }
-
-        @keyframes successPop {
-            0% { transform: scale(0); opacity: 0; }
-            50% { transform: scale(1.2); }
-            100% { transform: scale(1); opacity: 1; }
-        }
-
-        @keyframes checkDraw {
-            from { opacity: 0; transform: scale(0.5); }
-            to { opacity: 1; transform: scale(1); }
-        }
-
-        /* ══════════════ COUNTER ANIMATION ══════════════ */
-        .counter-animate {
-            display: inline-block;
-            animation: counterPop 0.4s var(--ease-spring);
-        }
-
-        @keyframes counterPop {
-            0% { transform: scale(1.5); opacity: 0; }
-            100% { transform: scale(1); opacity: 1; }
-        }
-
-        /* ══════════════ CARD STACK EFFECT ══════════════ */
-        .card-stack {
-            position: relative;
-        }
-
-        .card-stack::before,
-        .card-stack::after {
-            content: '';
-            position: absolute;
-            inset: 0;
-            border-radius: inherit;
-            background: var(--glass-bg);
-            border: 1px solid var(--glass-border);
-            z-index: -1;
-        }
-
-        .card-stack::before {
-            transform: translateY(6px) translateX(3px) rotate(1deg);
-            opacity: 0.5;
-        }
-
-        .card-stack::after {
-            transform: translateY(12px) translateX(6px) rotate(2deg);
-            opacity: 0.3;
-        }
-
-        /* ══════════════ NOTIFICATION DOT ══════════════ */
-        .notification-dot {
-            position: relative;
-        }
-
-        .notification-dot::after {
-            content: '';
-            position: absolute;
-            top: -2px;
-            right: -2px;
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            background: var(--rose-500);
-            border: 2px solid var(--bg-base);
-            animation: notificationPulse 2s ease-in-out infinite;
-        }
-
-        @keyframes notificationPulse {
-            0%, 100% { transform: scale(1); box-shadow: 0 0 0 0 rgba(244, 63, 94, 0.5); }
-            50% { transform: scale(1.1); box-shadow: 0 0 0 6px rgba(244, 63, 94, 0); }
-        }
-
-        /* ═══════════════════════════════════════════════════════════════════════════
-           🌌 PREMIUM FUTURISTIC ENHANCEMENTS v6.0 - Ultra Modern UI System
-           ═══════════════════════════════════════════════════════════════════════════ */
-
-        /* ══════════════ ANIMATED STARFIELD BACKGROUND ══════════════ */
-        @keyframes twinkle {
-            0%, 100% { opacity: 0.3; transform: scale(1); }
-            50% { opacity: 1; transform: scale(1.2); }
-        }
-
-        @keyframes starFloat {
-            0% { transform: translateY(0) translateX(0); }
-            25% { transform: translateY(-10px) translateX(5px); }
-            50% { transform: translateY(-5px) translateX(-5px); }
-            75% { transform: translateY(5px) translateX(3px); }
-            100% { transform: translateY(0) translateX(0); }
-        }
-
-        .stApp {
-            position: relative;
-        }
-
-        /* Star Layer 1 - Small fast stars */
-        .stars-layer-1 {
-            position: fixed;
-            inset: 0;
-            background-image: 
-                radial-gradient(1px 1px at 10% 20%, rgba(255,255,255,0.6) 1px, transparent 0),
-                radial-gradient(1px 1px at 30% 40%, rgba(255,255,255,0.5) 1px, transparent 0),
-                radial-gradient(1px 1px at 50% 10%, rgba(255,255,255,0.7) 1px, transparent 0),
-                radial-gradient(1px 1px at 70% 60%, rgba(255,255,255,0.4) 1px, transparent 0),
-                radial-gradient(1px 1px at 90% 30%, rgba(255,255,255,0.6) 1px, transparent 0),
-                radial-gradient(1px 1px at 15% 80%, rgba(255,255,255,0.5) 1px, transparent 0),
-                radial-gradient(1px 1px at 85% 85%, rgba(255,255,255,0.4) 1px, transparent 0),
-                radial-gradient(1px 1px at 45% 70%, rgba(255,255,255,0.6) 1px, transparent 0);
-            animation: starFloat 60s ease-in-out infinite;
-            pointer-events: none;
-            z-index: 0;
-        }
-
-        /* Star Layer 2 - Medium twinkling stars */
-        .stars-layer-2 {
-            position: fixed;
-            inset: 0;
-            background-image:
-                radial-gradient(2px 2px at 25% 35%, rgba(124, 92, 252, 0.8) 1px, transparent 0),
-                radial-gradient(2px 2px at 65% 15%, rgba(52, 211, 153, 0.7) 1px, transparent 0),
-                radial-gradient(2px 2px at 85% 45%, rgba(255, 255, 255, 0.9) 1px, transparent 0),
-                radial-gradient(2px 2px at 35% 75%, rgba(245, 158, 11, 0.6) 1px, transparent 0),
-                radial-gradient(2px 2px at 55% 55%, rgba(124, 92, 252, 0.7) 1px, transparent 0);
-            animation: twinkle 4s ease-in-out infinite, starFloat 80s ease-in-out infinite reverse;
-            pointer-events: none;
-            z-index: 0;
-        }
-
-        /* Star Layer 3 - Large glowing stars */
-        .stars-layer-3 {
-            position: fixed;
-            inset: 0;
-            background-image:
-                radial-gradient(3px 3px at 20% 50%, rgba(255,255,255,0.9) 1px, transparent 0),
-                radial-gradient(4px 4px at 75% 25%, rgba(124, 92, 252, 0.8) 1px, transparent 0),
-                radial-gradient(3px 3px at 40% 90%, rgba(52, 211, 153, 0.7) 1px, transparent 0);
-            animation: twinkle 6s ease-in-out infinite 2s;
-            pointer-events: none;
-            z-index: 0;
-        }
-
-        /* ══════════════ GRADIENT MESH ANIMATED BACKGROUND ══════════════ */
-        @keyframes gradientShift {
-            0% { 
-                background-position: 0% 50%;
-                filter: hue-rotate(0deg);
-            }
-            25% { background-position: 50% 100%; }
-            50% { 
-                background-position: 100% 50%;
-                filter: hue-rotate(15deg);
-            }
-            75% { background-position: 50% 0%; }
-            100% { 
-                background-position: 0% 50%;
-                filter: hue-rotate(0deg);
-            }
-        }
-
-        .gradient-mesh-bg {
-            position: fixed;
-            inset: 0;
-            background: 
-                linear-gradient(45deg, rgba(124, 92, 252, 0.03), transparent 40%),
-                linear-gradient(135deg, rgba(52, 211, 153, 0.02), transparent 40%),
-                linear-gradient(225deg, rgba(245, 158, 11, 0.015), transparent 40%),
-                linear-gradient(315deg, rgba(244, 63, 94, 0.01), transparent 40%);
-            background-size: 400% 400%;
-            animation: gradientShift 30s ease infinite;
-            pointer-events: none;
-            z-index: -1;
-        }
-
-        /* ══════════════ MAGNETIC HOVER BUTTONS ══════════════ */
-        .magnetic-btn {
-            position: relative;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            transition: transform 0.2s cubic-bezier(0.25, 0.46, 0.45, 0.94);
-        }
-
-        .magnetic-btn:hover {
-            transform: translate3d(var(--mx, 0), var(--my, 0), 0);
-        }
-
-        /* ══════════════ NEON GLOW BUTTONS ══════════════ */
-        [data-testid="stButton"] > button {
-            position: relative;
-            overflow: hidden;
-            isolation: isolate;
-        }
-
-        [data-testid="stButton"] > button::before {
-            content: '';
-            position: absolute;
-            inset: -2px;
-            background: linear-gradient(135deg, var(--primary-500), var(--secondary-500), var(--primary-500));
-            background-size: 200% 200%;
-            border-radius: inherit;
-            z-index: -2;
-            opacity: 0;
-            transition: opacity 0.4s ease;
-            animation: borderGlow 3s ease infinite paused;
-        }
-
-        [data-testid="stButton"] > button:hover::before {
-            opacity: 1;
-            animation-play-state: running;
-        }
-
-        [data-testid="stButton"] > button::after {
-            content: '';
-            position: absolute;
-            inset: 1px;
-            background: var(--bg-elevated);
-            border-radius: calc(var(--radius-md) - 1px);
-            z-index: -1;
-            transition: background 0.3s ease;
-        }
-
-        [data-testid="stButton"] > button:hover::after {
-            background: linear-gradient(135deg, rgba(124, 92, 252, 0.15), rgba(52, 211, 153, 0.1));
-        }
-
-        @keyframes borderGlow {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        /* Neon edge lighting on hover */
-        [data-testid="stButton"] > button:hover {
-            box-shadow: 
-                0 0 20px rgba(124, 92, 252, 0.4),
-                0 0 40px rgba(124, 92, 252, 0.2),
-                0 0 60px rgba(124, 92, 252, 0.1),
-                inset 0 0 30px rgba(124, 92, 252, 0.05);
-        }
-
-        /* ══════════════ RIPPLE CLICK ANIMATION ══════════════ */
-        @keyframes rippleSpread {
-            0% {
-                transform: translate(-50%, -50%) scale(0);
-                opacity: 0.6;
-            }
-            100% {
-                transform: translate(-50%, -50%) scale(4);
-                opacity: 0;
-            }
-        }
-
-        .ripple-effect {
-            position: absolute;
-            border-radius: 50%;
-            background: radial-gradient(circle, rgba(255,255,255,0.4) 0%, transparent 70%);
-            width: 100px;
-            height: 100px;
-            pointer-events: none;
-            animation: rippleSpread 0.6s ease-out forwards;
-        }
-
-        /* ══════════════ FLOATING CARDS WITH SOFT SHADOWS ══════════════ */
-        @keyframes floatCard {
-            0%, 100% { 
-                transform: translateY(0) rotateX(0) rotateY(0);
-                box-shadow: var(--shadow-card);
-            }
-            25% { 
-                transform: translateY(-4px) rotateX(1deg) rotateY(-0.5deg);
-            }
-            50% { 
-                transform: translateY(-8px) rotateX(0) rotateY(0);
-                box-shadow: var(--shadow-xl), 0 30px 60px rgba(124, 92, 252, 0.08);
-            }
-            75% { 
-                transform: translateY(-4px) rotateX(-1deg) rotateY(0.5deg);
-            }
-        }
-
-        .float-card {
-            animation: floatCard 6s ease-in-out infinite;
-            transform-style: preserve-3d;
-            perspective: 1000px;
-        }
-
-        /* ══════════════ 3D TILT EFFECT ON MOUSE ══════════════ */
-        .tilt-card {
-            transform-style: preserve-3d;
-            transition: transform 0.15s ease-out;
-            will-change: transform;
-        }
-
-        .tilt-card:hover {
-            transform: perspective(1000px) rotateX(var(--tilt-x, 0deg)) rotateY(var(--tilt-y, 0deg)) scale(1.02);
-        }
-
-        .tilt-card::before {
-            content: '';
-            position: absolute;
-            inset: 0;
-            border-radius: inherit;
-            background: linear-gradient(
-                135deg,
-                rgba(255, 255, 255, 0.15) 0%,
-                transparent 50%,
-                rgba(0, 0, 0, 0.1) 100%
-            );
-            opacity: 0;
-            transition: opacity 0.3s ease;
-            pointer-events: none;
-        }
-
-        .tilt-card:hover::before {
-            opacity: 1;
-        }
-
-        /* ══════════════ HERO GRADIENT TEXT ══════════════ */
-        .hero-text {
-            font-size: 3.5rem !important;
-            font-weight: 900 !important;
-            background: linear-gradient(
-                135deg,
-                #FFFFFF 0%,
-                var(--primary-300) 25%,
-                var(--secondary-300) 50%,
-                var(--accent-300) 75%,
-                #FFFFFF 100%
-            );
-            background-size: 300% 300%;
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            animation: heroGradient 8s ease infinite;
-            filter: drop-shadow(0 4px 20px rgba(124, 92, 252, 0.3));
-        }
-
-        @keyframes heroGradient {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        /* ══════════════ TEXT SHIMMER EFFECT ══════════════ */
-        .shimmer-text {
-            position: relative;
-            display: inline-block;
-            background: linear-gradient(
-                120deg,
-                var(--text-secondary) 0%,
-                var(--text-secondary) 40%,
-                #FFFFFF 50%,
-                var(--text-secondary) 60%,
-                var(--text-secondary) 100%
-            );
-            background-size: 200% 100%;
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            animation: shimmerPass 3s ease-in-out infinite;
-        }
-
-        @keyframes shimmerPass {
-            0% { background-position: 100% 0; }
-            100% { background-position: -100% 0; }
-        }
-
-        /* ══════════════ TYPEWRITER ANIMATION ══════════════ */
-        .typewriter {
-            overflow: hidden;
-            border-right: 2px solid var(--primary-500);
-            white-space: nowrap;
-            animation: 
-                typewriter 3s steps(40, end),
-                blinkCursor 0.75s step-end infinite;
-        }
-
-        @keyframes typewriter {
-            from { width: 0; }
-            to { width: 100%; }
-        }
-
-        @keyframes blinkCursor {
-            from, to { border-color: transparent; }
-            50% { border-color: var(--primary-500); }
-        }
-
-        /* ══════════════ ANIMATED COUNTERS ══════════════ */
-        .counter-number {
-            display: inline-block;
-            font-family: 'JetBrains Mono', monospace;
-            font-weight: 700;
-            font-size: 2.5rem;
-            background: linear-gradient(135deg, var(--primary-300), var(--secondary-300));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            animation: counterBounce 0.5s var(--ease-spring);
-        }
-
-        @keyframes counterBounce {
-            0% { transform: scale(0.5) translateY(20px); opacity: 0; }
-            60% { transform: scale(1.1) translateY(-5px); }
-            100% { transform: scale(1) translateY(0); opacity: 1; }
-        }
-
-        /* ══════════════ GLASS NAVBAR STICKY ══════════════ */
-        .glass-navbar {
-            position: sticky;
-            top: 0;
-            z-index: 1000;
-            background: rgba(15, 18, 25, 0.7);
-            backdrop-filter: blur(20px) saturate(1.8);
-            -webkit-backdrop-filter: blur(20px) saturate(1.8);
-            border-bottom: 1px solid var(--border-subtle);
-            transition: all 0.3s ease;
-        }
-
-        .glass-navbar.scrolled {
-            background: rgba(15, 18, 25, 0.95);
-            box-shadow: 0 4px 30px rgba(0, 0, 0, 0.3);
-        }
-
-        /* ══════════════ SCROLL PROGRESS INDICATOR ══════════════ */
-        .scroll-progress {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: var(--scroll-progress, 0%);
-            height: 3px;
-            background: linear-gradient(90deg, var(--primary-500), var(--secondary-500), var(--accent));
-            z-index: 9999;
-            transition: width 0.1s ease;
-            box-shadow: 0 0 10px var(--primary-glow);
-        }
-
-        /* ══════════════ CUSTOM GRADIENT SCROLLBAR ══════════════ */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-
-        ::-webkit-scrollbar-track {
-            background: rgba(0, 0, 0, 0.2);
-            border-radius: 10px;
-        }
-
-        ::-webkit-scrollbar-thumb {
-            background: linear-gradient(180deg, var(--primary-500) 0%, var(--secondary-500) 50%, var(--accent) 100%);
-            border-radius: 10px;
-            border: 2px solid transparent;
-            background-clip: padding-box;
-        }
-
-        ::-webkit-scrollbar-thumb:hover {
-            background: linear-gradient(180deg, var(--primary-400) 0%, var(--secondary-400) 50%, var(--accent-300) 100%);
-        }
-
-        /* ══════════════ SMOOTH SCROLL SNAP SECTIONS ══════════════ */
-        .scroll-snap-container {
-            scroll-snap-type: y mandatory;
-            overflow-y: scroll;
-            height: 100vh;
-        }
-
-        .scroll-snap-section {
-            scroll-snap-align: start;
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }
-
-        /* ══════════════ ICON HOVER ANIMATIONS ══════════════ */
-        .icon-hover {
-            display: inline-flex;
-            transition: all 0.3s var(--ease-spring);
-        }
-
-        .icon-hover:hover {
-            transform: scale(1.15) rotate(-5deg);
-            filter: drop-shadow(0 0 8px var(--primary-glow));
-        }
-
-        /* Bounce on hover */
-        .icon-bounce:hover {
-            animation: iconBounce 0.5s var(--ease-spring);
-        }
-
-        @keyframes iconBounce {
-            0%, 100% { transform: translateY(0); }
-            25% { transform: translateY(-6px); }
-            50% { transform: translateY(0); }
-            75% { transform: translateY(-3px); }
-        }
-
-        /* Shake on hover */
-        .icon-shake:hover {
-            animation: iconShake 0.4s ease;
-        }
-
-        @keyframes iconShake {
-            0%, 100% { transform: translateX(0); }
-            20% { transform: translateX(-3px) rotate(-5deg); }
-            40% { transform: translateX(3px) rotate(5deg); }
-            60% { transform: translateX(-2px) rotate(-3deg); }
-            80% { transform: translateX(2px) rotate(3deg); }
-        }
-
-        /* Pulse glow on hover */
-        .icon-glow:hover {
-            animation: iconPulseGlow 1s ease infinite;
-        }
-
-        @keyframes iconPulseGlow {
-            0%, 100% { filter: drop-shadow(0 0 5px var(--primary-glow)); }
-            50% { filter: drop-shadow(0 0 15px var(--primary-glow)) drop-shadow(0 0 25px var(--primary-glow-soft)); }
-        }
-
-        /* ══════════════ SKELETON LOADING PREMIUM ══════════════ */
-        /* Skeleton shimmer defined below in enhanced section */
-
-        .skeleton-premium {
-            background: linear-gradient(
-                90deg,
-                rgba(255, 255, 255, 0.02) 0%,
-                rgba(255, 255, 255, 0.05) 20%,
-                rgba(124, 92, 252, 0.08) 40%,
-                rgba(52, 211, 153, 0.06) 60%,
-                rgba(255, 255, 255, 0.05) 80%,
-                rgba(255, 255, 255, 0.02) 100%
-            );
-            background-size: 200% 100%;
-            animation: skeletonShimmer 2s ease infinite;
-            border-radius: var(--radius-md);
-        }
-
-        /* ══════════════ PAGE TRANSITION ANIMATIONS ══════════════ */
-        @keyframes fadeSlideIn {
-            0% {
-                opacity: 0;
-                transform: translateY(30px);
-            }
-            100% {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-
-        @keyframes fadeSlideOut {
-            0% {
-                opacity: 1;
-                transform: translateY(0);
-            }
-            100% {
-                opacity: 0;
-                transform: translateY(-30px);
-            }
-        }
-
-        .page-transition-in {
-            animation: fadeSlideIn 0.5s var(--ease-out) forwards;
-        }
-
-        .page-transition-out {
-            animation: fadeSlideOut 0.3s var(--ease-smooth) forwards;
-        }
-
-        /* ══════════════ CONFETTI/SPARKLE SUCCESS EFFECT ══════════════ */
-        @keyframes confettiFloat {
-            0% {
-                transform: translateY(0) rotate(0deg);
-                opacity: 1;
-            }
-            100% {
-                transform: translateY(-100vh) rotate(720deg);
-                opacity: 0;
-            }
-        }
-
-        .confetti-particle {
-            position: fixed;
-            width: 10px;
-            height: 10px;
-            pointer-events: none;
-            z-index: 10000;
-            animation: confettiFloat 3s ease-out forwards;
-        }
-
-        .confetti-particle:nth-child(odd) {
-            background: var(--primary-500);
-            border-radius: 50%;
-        }
-
-        .confetti-particle:nth-child(even) {
-            background: var(--secondary-500);
-            clip-path: polygon(50% 0%, 0% 100%, 100% 100%);
-        }
-
-        /* Sparkle effect */
-        @keyframes sparkle {
-            0%, 100% { opacity: 0; transform: scale(0) rotate(0deg); }
-            50% { opacity: 1; transform: scale(1) rotate(180deg); }
-        }
-
-        .sparkle {
-            position: absolute;
-            width: 20px;
-            height: 20px;
-            background: radial-gradient(circle, #FFF 0%, transparent 70%);
-            animation: sparkle 0.8s ease-in-out forwards;
-            pointer-events: none;
-        }
-
-        /* ══════════════ DARK/LIGHT THEME TRANSITION ══════════════ */
-        .theme-transition {
-            transition: 
-                background-color 0.5s ease,
-                color 0.5s ease,
-                border-color 0.5s ease,
-                box-shadow 0.5s ease !important;
-        }
-
-        /* ══════════════ CURSOR GLOW EFFECT ══════════════ */
-        .cursor-glow {
-            position: fixed;
-            width: 300px;
-            height: 300px;
-            border-radius: 50%;
-            background: radial-gradient(circle, rgba(124, 92, 252, 0.08) 0%, transparent 70%);
-            pointer-events: none;
-            z-index: 9998;
-            transform: translate(-50%, -50%);
-            transition: opacity 0.3s ease;
-            mix-blend-mode: screen;
-        }
-
-        /* ══════════════ WELCOME ANIMATION AFTER LOGIN ══════════════ */
-        @keyframes welcomeReveal {
-            0% {
-                opacity: 0;
-                transform: scale(0.9) translateY(50px);
-                filter: blur(10px);
-            }
-            50% {
-                filter: blur(5px);
-            }
-            100% {
-                opacity: 1;
-                transform: scale(1) translateY(0);
-                filter: blur(0);
-            }
-        }
-
-        .welcome-animation {
-            animation: welcomeReveal 0.8s var(--ease-out) forwards;
-        }
-
-        /* Staggered children animation */
-        .welcome-animation > *:nth-child(1) { animation-delay: 0.1s; }
-        .welcome-animation > *:nth-child(2) { animation-delay: 0.2s; }
-        .welcome-animation > *:nth-child(3) { animation-delay: 0.3s; }
-        .welcome-animation > *:nth-child(4) { animation-delay: 0.4s; }
-        .welcome-animation > *:nth-child(5) { animation-delay: 0.5s; }
-
-        /* ══════════════ EXPANDABLE ACCORDION PREMIUM ══════════════ */
-        [data-testid="stExpander"] {
-            overflow: hidden;
-            transition: all 0.4s var(--ease-out);
-        }
-
-        [data-testid="stExpander"] summary {
-            padding: 1rem 1.5rem;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-
-        [data-testid="stExpander"] summary:hover {
-            background: rgba(124, 92, 252, 0.05);
-        }
-
-        [data-testid="stExpander"][open] {
-            background: rgba(124, 92, 252, 0.02);
-            border-color: var(--border-hover);
-        }
-
-        [data-testid="stExpander"] details[open] > div {
-            animation: accordionSlideDown 0.4s var(--ease-out);
-        }
-
-        @keyframes accordionSlideDown {
-            0% {
-                opacity: 0;
-                transform: translateY(-10px);
-                max-height: 0;
-            }
-            100% {
-                opacity: 1;
-                transform: translateY(0);
-                max-height: 1000px;
-            }
-        }
-
-        /* ══════════════ RESPONSIVE GRID AUTO-REARRANGE ══════════════ */
-        .auto-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 1.5rem;
-            transition: all 0.4s var(--ease-out);
-        }
-
-        .auto-grid > * {
-            animation: gridItemAppear 0.5s var(--ease-out) forwards;
-            opacity: 0;
-        }
-
-        @keyframes gridItemAppear {
-            0% {
-                opacity: 0;
-                transform: scale(0.9) translateY(20px);
-            }
-            100% {
-                opacity: 1;
-                transform: scale(1) translateY(0);
-            }
-        }
-
-        /* Stagger grid items */
-        .auto-grid > *:nth-child(1) { animation-delay: 0.05s; }
-        .auto-grid > *:nth-child(2) { animation-delay: 0.1s; }
-        .auto-grid > *:nth-child(3) { animation-delay: 0.15s; }
-        .auto-grid > *:nth-child(4) { animation-delay: 0.2s; }
-        .auto-grid > *:nth-child(5) { animation-delay: 0.25s; }
-        .auto-grid > *:nth-child(6) { animation-delay: 0.3s; }
-
-        /* ══════════════ GLASSMORPHISM PANELS PREMIUM ══════════════ */
-        .glass-panel {
-            background: rgba(255, 255, 255, 0.03);
-            backdrop-filter: blur(24px) saturate(1.8);
-            -webkit-backdrop-filter: blur(24px) saturate(1.8);
-            border: 1px solid rgba(255, 255, 255, 0.08);
-            border-radius: var(--radius-xl);
-            box-shadow: 
-                0 8px 32px rgba(0, 0, 0, 0.2),
-                inset 0 1px 0 rgba(255, 255, 255, 0.08),
-                inset 0 -1px 0 rgba(0, 0, 0, 0.1);
-            position: relative;
-            overflow: hidden;
-        }
-
-        /* Glass reflection */
-        .glass-panel::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 50%;
-            background: linear-gradient(180deg, rgba(255, 255, 255, 0.05) 0%, transparent 100%);
-            pointer-events: none;
-        }
-
-        /* ══════════════ ANIMATED GRADIENT BORDERS ══════════════ */
-        .gradient-border-animated {
-            position: relative;
-            padding: 2px;
-            border-radius: var(--radius-lg);
-            background: linear-gradient(135deg, var(--primary-500), var(--secondary-500), var(--accent), var(--rose-500), var(--primary-500));
-            background-size: 300% 300%;
-            animation: gradientBorderMove 4s ease infinite;
-        }
-
-        .gradient-border-animated > * {
-            background: var(--bg-base);
-            border-radius: calc(var(--radius-lg) - 2px);
-        }
-
-        @keyframes gradientBorderMove {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        /* ══════════════ HOVER LIFT EFFECT ENHANCED ══════════════ */
-        .hover-lift {
-            transition: all 0.4s var(--ease-out);
-        }
-
-        .hover-lift:hover {
-            transform: translateY(-8px) scale(1.02);
-            box-shadow: 
-                0 20px 40px rgba(0, 0, 0, 0.2),
-                0 0 60px rgba(124, 92, 252, 0.1);
-        }
-
-        /* ══════════════ AMBIENT GLOW CONTAINERS ══════════════ */
-        .ambient-glow {
-            position: relative;
-        }
-
-        .ambient-glow::after {
-            content: '';
-            position: absolute;
-            inset: -20px;
-            background: radial-gradient(circle at center, var(--primary-glow-soft) 0%, transparent 70%);
-            opacity: 0;
-            transition: opacity 0.5s ease;
-            pointer-events: none;
-            z-index: -1;
-        }
-
-        .ambient-glow:hover::after {
-            opacity: 1;
-        }
-
-        /* ══════════════ PREMIUM METRIC CARDS ══════════════ */
-        [data-testid="stMetric"] {
-            background: linear-gradient(145deg, rgba(255, 255, 255, 0.03), rgba(255, 255, 255, 0.01)) !important;
-            border: 1px solid rgba(255, 255, 255, 0.06) !important;
-            padding: 1.5rem !important;
-            position: relative;
-            overflow: hidden;
-        }
-
-        [data-testid="stMetric"]::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 3px;
-            background: linear-gradient(90deg, var(--primary-500), var(--secondary-500));
-            transform: scaleX(0);
-            transform-origin: left;
-            transition: transform 0.5s var(--ease-out);
-        }
-
-        [data-testid="stMetric"]:hover::before {
-            transform: scaleX(1);
-        }
-
-        /* ══════════════ SUCCESS/ERROR STATE ANIMATIONS ══════════════ */
-        @keyframes successPulse {
-            0% { box-shadow: 0 0 0 0 rgba(52, 211, 153, 0.4); }
-            70% { box-shadow: 0 0 0 15px rgba(52, 211, 153, 0); }
-            100% { box-shadow: 0 0 0 0 rgba(52, 211, 153, 0); }
-        }
-
-        @keyframes errorShake {
-            0%, 100% { transform: translateX(0); }
-            10%, 30%, 50%, 70%, 90% { transform: translateX(-5px); }
-            20%, 40%, 60%, 80% { transform: translateX(5px); }
-        }
-
-        .success-state {
-            animation: successPulse 0.6s ease-out;
-            border-color: var(--secondary-500) !important;
-        }
-
-        .error-state {
-            animation: errorShake 0.5s ease;
-            border-color: var(--rose-500) !important;
-        }
-
-        /* ══════════════ LOADING DOTS ANIMATION ══════════════ */
-        .loading-dots {
-            display: inline-flex;
-            gap: 4px;
-        }
-
-        .loading-dots span {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            background: var(--primary-500);
-            animation: dotPulse 1.4s ease-in-out infinite;
-        }
-
-        .loading-dots span:nth-child(1) { animation-delay: 0s; }
-        .loading-dots span:nth-child(2) { animation-delay: 0.2s; }
-        .loading-dots span:nth-child(3) { animation-delay: 0.4s; }
-
-        @keyframes dotPulse {
-            0%, 80%, 100% { transform: scale(0.6); opacity: 0.5; }
-            40% { transform: scale(1); opacity: 1; }
-        }
-
-        /* ══════════════ GLOW TEXT ON IMPORTANT ELEMENTS ══════════════ */
-        .glow-text {
-            text-shadow: 
-                0 0 10px var(--primary-glow),
-                0 0 20px var(--primary-glow-soft),
-                0 0 30px rgba(124, 92, 252, 0.1);
-            animation: textGlow 2s ease-in-out infinite alternate;
-        }
-
-        @keyframes textGlow {
-            0% {
-                text-shadow: 
-                    0 0 10px var(--primary-glow),
-                    0 0 20px var(--primary-glow-soft);
-            }
-            100% {
-                text-shadow: 
-                    0 0 15px var(--primary-glow),
-                    0 0 30px var(--primary-glow),
-                    0 0 45px var(--primary-glow-soft);
-            }
-        }
-
-        /* ══════════════ FUTURISTIC INPUT FIELDS ══════════════ */
-        [data-testid="stTextInput"] input,
-        [data-testid="stNumberInput"] input,
-        [data-testid="stTextArea"] textarea {
-            background: rgba(0, 0, 0, 0.3) !important;
-            border: 1px solid rgba(255, 255, 255, 0.08) !important;
-            border-radius: var(--radius-md) !important;
-            color: var(--text-primary) !important;
-            transition: all 0.3s var(--ease-out) !important;
-            position: relative;
-        }
-
-        [data-testid="stTextInput"] input:focus,
-        [data-testid="stNumberInput"] input:focus,
-        [data-testid="stTextArea"] textarea:focus {
-            border-color: var(--primary-500) !important;
-            box-shadow: 
-                0 0 0 3px rgba(124, 92, 252, 0.1),
-                0 0 20px rgba(124, 92, 252, 0.1) !important;
-            background: rgba(0, 0, 0, 0.4) !important;
-        }
-
-        /* Input glow line animation */
-        [data-testid="stTextInput"]::after,
-        [data-testid="stNumberInput"]::after {
-            content: '';
-            position: absolute;
-            bottom: 0;
-            left: 50%;
-            width: 0;
-            height: 2px;
-            background: linear-gradient(90deg, var(--primary-500), var(--secondary-500));
-            transition: all 0.3s var(--ease-out);
-            transform: translateX(-50%);
-        }
-
-        [data-testid="stTextInput"]:focus-within::after,
-        [data-testid="stNumberInput"]:focus-within::after {
-            width: 100%;
-        }
-
-        /* ══════════════ PARALLAX SCROLL ELEMENTS ══════════════ */
-        .parallax-slow {
-            transform: translateY(calc(var(--scroll-y, 0) * 0.3));
-            transition: transform 0.1s linear;
-        }
-
-        .parallax-fast {
-            transform: translateY(calc(var(--scroll-y, 0) * -0.5));
-            transition: transform 0.1s linear;
-        }
-
-        /* ══════════════ MORPHING SHAPES BACKGROUND ══════════════ */
-        @keyframes morphBlob {
-            0%, 100% {
-                border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%;
-            }
-            25% {
-                border-radius: 30% 60% 70% 40% / 50% 60% 30% 60%;
-            }
-            50% {
-                border-radius: 50% 60% 30% 60% / 30% 40% 70% 50%;
-            }
-            75% {
-                border-radius: 60% 40% 60% 30% / 70% 50% 40% 60%;
-            }
-        }
-
-        .morph-blob {
-            position: fixed;
-            width: 400px;
-            height: 400px;
-            background: linear-gradient(135deg, rgba(124, 92, 252, 0.05), rgba(52, 211, 153, 0.03));
-            animation: morphBlob 20s ease-in-out infinite;
-            filter: blur(60px);
-            pointer-events: none;
-            z-index: -1;
-        }
-
-        .morph-blob-1 {
-            top: 10%;
-            left: 10%;
-            animation-delay: 0s;
-        }
-
-        .morph-blob-2 {
-            bottom: 20%;
-            right: 15%;
-            animation-delay: -7s;
-            background: linear-gradient(135deg, rgba(52, 211, 153, 0.04), rgba(245, 158, 11, 0.02));
-        }
-
-        /* ══════════════════════════════════════════════════════════════════
-           LIGHTNING CUBE — 3D Rotating Cube with Electric Edge Glow
-           ══════════════════════════════════════════════════════════════════ */
-        .lightning-cube-layer {
-            position: fixed;
-            inset: 0;
-            pointer-events: none;
-            z-index: 0;
-            overflow: hidden;
-            perspective: 1200px;
-        }
-
-        .lightning-cube-wrapper {
-            position: absolute;
-            width: 80px;
-            height: 80px;
-            transform-style: preserve-3d;
-            animation: lightningCubeRotate 18s linear infinite;
-            will-change: transform;
-        }
-
-        .lightning-cube-wrapper.lc-1 {
-            top: 12%;
-            right: 8%;
-            width: 60px;
-            height: 60px;
-            animation-duration: 22s;
-            opacity: 0.3;
-        }
-
-        .lightning-cube-wrapper.lc-2 {
-            bottom: 18%;
-            left: 5%;
-            width: 45px;
-            height: 45px;
-            animation-duration: 28s;
-            animation-direction: reverse;
-            opacity: 0.2;
-        }
-
-        .lightning-cube-wrapper.lc-3 {
-            top: 55%;
-            right: 15%;
-            width: 35px;
-            height: 35px;
-            animation-duration: 25s;
-            opacity: 0.15;
-            animation-delay: -5s;
-        }
-
-        .lightning-cube-wrapper.lc-4 {
-            top: 30%;
-            left: 12%;
-            width: 50px;
-            height: 50px;
-            animation-duration: 20s;
-            opacity: 0.18;
-            animation-delay: -10s;
-        }
-
-        .lightning-cube-face {
-            position: absolute;
-            width: 100%;
-            height: 100%;
-            border: 1px solid rgba(124, 92, 252, 0.25);
-            background: rgba(124, 92, 252, 0.02);
-            box-shadow:
-                inset 0 0 15px rgba(124, 92, 252, 0.05),
-                0 0 8px rgba(124, 92, 252, 0.08);
-            backface-visibility: visible;
-        }
-
-        .lightning-cube-face--front  { transform: translateZ(calc(var(--cube-size, 40px) / 2)); }
-        .lightning-cube-face--back   { transform: rotateY(180deg) translateZ(calc(var(--cube-size, 40px) / 2)); }
-        .lightning-cube-face--right  { transform: rotateY(90deg) translateZ(calc(var(--cube-size, 40px) / 2)); }
-        .lightning-cube-face--left   { transform: rotateY(-90deg) translateZ(calc(var(--cube-size, 40px) / 2)); }
-        .lightning-cube-face--top    { transform: rotateX(90deg) translateZ(calc(var(--cube-size, 40px) / 2)); }
-        .lightning-cube-face--bottom { transform: rotateX(-90deg) translateZ(calc(var(--cube-size, 40px) / 2)); }
-
-        /* Electric edge glow on cube */
-        .lightning-cube-face::before {
-            content: '';
-            position: absolute;
-            inset: -1px;
-            border: 1px solid transparent;
-            border-image: linear-gradient(
-                var(--edge-angle, 135deg),
-                transparent 0%,
-                rgba(124, 92, 252, 0.6) 30%,
-                rgba(52, 211, 153, 0.5) 50%,
-                rgba(124, 92, 252, 0.6) 70%,
-                transparent 100%
-            ) 1;
-            animation: edgeGlowShift 3s ease-in-out infinite alternate;
-            opacity: 0.7;
-        }
-
-        .lightning-cube-face--front::before  { --edge-angle: 0deg; }
-        .lightning-cube-face--right::before  { --edge-angle: 90deg; }
-        .lightning-cube-face--back::before   { --edge-angle: 180deg; }
-        .lightning-cube-face--left::before   { --edge-angle: 270deg; }
-        .lightning-cube-face--top::before    { --edge-angle: 45deg; }
-        .lightning-cube-face--bottom::before { --edge-angle: 225deg; }
-
-        /* Energy pulse on cube */
-        .lightning-cube-wrapper::after {
-            content: '';
-            position: absolute;
-            inset: -20%;
-            border-radius: 50%;
-            background: radial-gradient(circle, rgba(124, 92, 252, 0.08) 0%, transparent 70%);
-            animation: cubePulse 4s ease-in-out infinite;
-            pointer-events: none;
-        }
-
-        @keyframes lightningCubeRotate {
-            0%   { transform: rotateX(0deg) rotateY(0deg) rotateZ(0deg); }
-            100% { transform: rotateX(360deg) rotateY(360deg) rotateZ(180deg); }
-        }
-
-        @keyframes edgeGlowShift {
-            0%   { opacity: 0.3; filter: hue-rotate(0deg); }
-            50%  { opacity: 0.8; filter: hue-rotate(15deg); }
-            100% { opacity: 0.4; filter: hue-rotate(-15deg); }
-        }
-
-        @keyframes cubePulse {
-            0%, 100% { transform: scale(1); opacity: 0.4; }
-            50%      { transform: scale(1.15); opacity: 0.7; }
-        }
-
-        /* Hover acceleration on cube parent hover */
-        .lightning-cube-layer:hover .lightning-cube-wrapper {
-            animation-duration: 6s !important;
-        }
-
-        /* Dynamic lighting reflection on cubes */
-        .lightning-cube-face::after {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(
-                135deg,
-                rgba(255, 255, 255, 0.06) 0%,
-                transparent 40%,
-                transparent 60%,
-                rgba(124, 92, 252, 0.04) 100%
-            );
-            animation: lightReflect 6s ease-in-out infinite alternate;
-        }
-
-        @keyframes lightReflect {
-            0%   { opacity: 0.3; }
-            50%  { opacity: 0.8; }
-            100% { opacity: 0.4; }
-        }
-
-        /* ══════════════════════════════════════════════════════════════════
-           WELCOME OVERLAY — Premium Signup Success Animation
-           ══════════════════════════════════════════════════════════════════ */
-        .welcome-overlay {
-            position: fixed;
-            inset: 0;
-            z-index: 99999;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            flex-direction: column;
-            background: rgba(6, 8, 16, 0.92);
-            backdrop-filter: blur(30px) saturate(1.5);
-            -webkit-backdrop-filter: blur(30px) saturate(1.5);
-            animation: welcomeOverlayIn 0.6s cubic-bezier(0.16, 1, 0.3, 1) forwards;
-            pointer-events: all;
-            overflow: hidden;
-        }
-
-        .welcome-overlay.exit {
-            animation: welcomeOverlayOut 0.8s cubic-bezier(0.4, 0, 0.2, 1) forwards;
-        }
-
-        @keyframes welcomeOverlayIn {
-            0% {
-                opacity: 0;
-                backdrop-filter: blur(0px);
-            }
-            100% {
-                opacity: 1;
-                backdrop-filter: blur(30px) saturate(1.5);
-            }
-        }
-
-        @keyframes welcomeOverlayOut {
-            0% {
-                opacity: 1;
-                transform: scale(1);
-            }
-            100% {
-                opacity: 0;
-                transform: scale(1.05);
-                pointer-events: none;
-            }
-        }
-
-        /* Welcome text with glow + spring scale-in */
-        .welcome-overlay-title {
-            font-family: 'Inter', sans-serif;
-            font-weight: 900;
-            font-size: clamp(3rem, 8vw, 6rem);
-            letter-spacing: -0.05em;
-            line-height: 1.05;
-            text-align: center;
-            background: linear-gradient(
-                135deg,
-                #FFFFFF 0%,
-                var(--primary-200) 30%,
-                #FFFFFF 50%,
-                var(--secondary-300) 70%,
-                #FFFFFF 100%
-            );
-            background-size: 300% 300%;
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            animation:
-                welcomeTextScale 0.8s cubic-bezier(0.34, 1.56, 0.64, 1) 0.2s both,
-                welcomeTextShimmer 4s ease-in-out infinite 1s;
-            filter: drop-shadow(0 0 40px rgba(124, 92, 252, 0.4))
-                    drop-shadow(0 0 80px rgba(52, 211, 153, 0.15));
-            position: relative;
-            z-index: 2;
-        }
-
-        @keyframes welcomeTextScale {
-            0% {
-                opacity: 0;
-                transform: scale(0.5) translateY(30px);
-                filter: blur(10px);
-            }
-            60% {
-                opacity: 1;
-                transform: scale(1.05) translateY(-5px);
-                filter: blur(0px);
-            }
-            100% {
-                opacity: 1;
-                transform: scale(1) translateY(0);
-                filter: blur(0);
-            }
-        }
-
-        @keyframes welcomeTextShimmer {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        /* Glow pulse behind welcome text */
-        .welcome-overlay-title::before {
-            content: '';
-            position: absolute;
-            inset: -40%;
-            background: radial-gradient(
-                ellipse 60% 60% at 50% 50%,
-                rgba(124, 92, 252, 0.15) 0%,
-                rgba(52, 211, 153, 0.05) 40%,
-                transparent 70%
-            );
-            animation: welcomeGlowPulse 3s ease-in-out infinite;
-            z-index: -1;
-        }
-
-        @keyframes welcomeGlowPulse {
-            0%, 100% { transform: scale(1); opacity: 0.6; }
-            50%      { transform: scale(1.2); opacity: 1; }
-        }
-
-        /* Letter-by-letter reveal via clip-path */
-        .welcome-letter {
-            display: inline-block;
-            opacity: 0;
-            animation: letterReveal 0.4s cubic-bezier(0.34, 1.56, 0.64, 1) forwards;
-            will-change: transform, opacity;
-        }
-
-        @keyframes letterReveal {
-            0% {
-                opacity: 0;
-                transform: translateY(30px) scale(0.7) rotateX(-40deg);
-                filter: blur(4px);
-            }
-            100% {
-                opacity: 1;
-                transform: translateY(0) scale(1) rotateX(0deg);
-                filter: blur(0);
-            }
-        }
-
-        /* Welcome subtitle */
-        .welcome-overlay-subtitle {
-            font-family: 'Space Grotesk', sans-serif;
-            font-size: clamp(0.9rem, 2vw, 1.2rem);
-            color: var(--text-muted);
-            letter-spacing: 0.15em;
-            text-transform: uppercase;
-            margin-top: 0.8rem;
-            opacity: 0;
-            animation: welcomeSubReveal 0.6s ease-out 1.2s forwards;
-            position: relative;
-            z-index: 2;
-        }
-
-        @keyframes welcomeSubReveal {
-            0% { opacity: 0; transform: translateY(15px); letter-spacing: 0.4em; }
-            100% { opacity: 0.7; transform: translateY(0); letter-spacing: 0.15em; }
-        }
-
-        /* Welcome CTA button */
-        .welcome-overlay-btn {
-            margin-top: 2.5rem;
-            padding: 0.85rem 2.5rem;
-            background: linear-gradient(140deg, var(--primary-500) 0%, var(--primary-700) 100%);
-            color: white;
-            border: 1px solid rgba(255,255,255,0.15);
-            border-radius: var(--radius-md);
-            font-family: 'Inter', sans-serif;
-            font-weight: 600;
-            font-size: 0.95rem;
-            letter-spacing: 0.02em;
-            cursor: pointer;
-            position: relative;
-            z-index: 2;
-            overflow: hidden;
-            opacity: 0;
-            animation: welcomeBtnIn 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) 1.6s forwards;
-            transition: transform 0.3s cubic-bezier(0.34, 1.56, 0.64, 1),
-                        box-shadow 0.3s ease;
-            box-shadow:
-                0 6px 20px rgba(124, 92, 252, 0.3),
-                0 2px 6px rgba(0,0,0,0.15),
-                inset 0 1px 0 rgba(255,255,255,0.12);
-        }
-
-        .welcome-overlay-btn:hover {
-            transform: translateY(-3px) scale(1.04);
-            box-shadow:
-                0 10px 35px rgba(124, 92, 252, 0.45),
-                0 4px 10px rgba(0,0,0,0.2),
-                inset 0 1px 0 rgba(255,255,255,0.2);
-        }
-
-        .welcome-overlay-btn:active {
-            transform: translateY(0) scale(0.97);
-            transition-duration: 0.08s;
-        }
-
-        /* Shimmer sweep on button */
-        .welcome-overlay-btn::before {
-            content: '';
-            position: absolute;
-            top: 0; left: -150%;
-            width: 80%; height: 100%;
-            background: linear-gradient(
-                105deg,
-                transparent 30%,
-                rgba(255,255,255,0.08) 42%,
-                rgba(255,255,255,0.18) 50%,
-                rgba(255,255,255,0.08) 58%,
-                transparent 70%
-            );
-            animation: welcomeBtnShimmer 3s ease-in-out 2.5s infinite;
-        }
-
-        @keyframes welcomeBtnIn {
-            0% { opacity: 0; transform: translateY(20px) scale(0.85); }
-            100% { opacity: 1; transform: translateY(0) scale(1); }
-        }
-
-        @keyframes welcomeBtnShimmer {
-            0%, 100% { left: -150%; }
-            50% { left: 150%; }
-        }
-
-        /* Particle burst behind welcome */
-        .welcome-particle {
-            position: absolute;
-            width: 4px;
-            height: 4px;
-            border-radius: 50%;
-            pointer-events: none;
-            z-index: 1;
-            animation: particleBurst 2s cubic-bezier(0.16, 1, 0.3, 1) forwards;
-            will-change: transform, opacity;
-        }
-
-        @keyframes particleBurst {
-            0% {
-                opacity: 1;
-                transform: translate(0, 0) scale(1);
-            }
-            100% {
-                opacity: 0;
-                transform: translate(var(--px, 100px), var(--py, -100px)) scale(0);
-            }
-        }
-
-        /* Light streak effect */
-        .welcome-light-streak {
-            position: absolute;
-            width: 200px;
-            height: 2px;
-            border-radius: 2px;
-            pointer-events: none;
-            z-index: 1;
-            animation: lightStreakMove 1.5s ease-out forwards;
-            opacity: 0;
-            will-change: transform, opacity;
-        }
-
-        @keyframes lightStreakMove {
-            0% {
-                opacity: 0;
-                transform: translateX(-100%) scaleX(0.3);
-            }
-            20% {
-                opacity: 1;
-            }
-            100% {
-                opacity: 0;
-                transform: translateX(200%) scaleX(1);
-            }
-        }
-
-        /* Welcome cube (larger, behind text) */
-        .welcome-cube-wrapper {
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            width: 200px;
-            height: 200px;
-            transform-style: preserve-3d;
-            animation: welcomeCubeRotate 12s linear infinite;
-            opacity: 0.12;
-            z-index: 1;
-            perspective: 800px;
-        }
-
-        .welcome-cube-face {
-            position: absolute;
-            width: 100%;
-            height: 100%;
-            border: 1.5px solid rgba(124, 92, 252, 0.35);
-            background: rgba(124, 92, 252, 0.03);
-            box-shadow:
-                inset 0 0 25px rgba(124, 92, 252, 0.08),
-                0 0 15px rgba(124, 92, 252, 0.12);
-        }
-
-        .welcome-cube-face--front  { transform: translateZ(100px); }
-        .welcome-cube-face--back   { transform: rotateY(180deg) translateZ(100px); }
-        .welcome-cube-face--right  { transform: rotateY(90deg) translateZ(100px); }
-        .welcome-cube-face--left   { transform: rotateY(-90deg) translateZ(100px); }
-        .welcome-cube-face--top    { transform: rotateX(90deg) translateZ(100px); }
-        .welcome-cube-face--bottom { transform: rotateX(-90deg) translateZ(100px); }
-
-        @keyframes welcomeCubeRotate {
-            0%   { transform: translate(-50%, -50%) rotateX(0deg) rotateY(0deg); }
-            100% { transform: translate(-50%, -50%) rotateX(360deg) rotateY(360deg); }
-        }
-
-        /* ══════════════════════════════════════════════════════════════════
-           ENHANCED MICRO-INTERACTIONS — Premium Level
-           ══════════════════════════════════════════════════════════════════ */
-
-        /* Smooth navbar underline animation */
-        .stRadio > div > label::after {
-            content: '';
-            position: absolute;
-            bottom: 0;
-            left: 50%;
-            width: 0;
-            height: 2px;
-            background: linear-gradient(90deg, var(--primary-500), var(--secondary-500));
-            transition: width 0.3s var(--ease-out), left 0.3s var(--ease-out);
-            border-radius: 2px;
-        }
-
-        .stRadio > div > label:hover::after,
-        .stRadio > div > label[data-checked="true"]::after {
-            width: 60%;
-            left: 20%;
-        }
-
-        /* Animated focus ring for inputs */
-        .stTextInput > div > div > input:focus,
-        .stTextArea textarea:focus,
-        .stNumberInput > div > div > input:focus {
-            outline: none !important;
-            box-shadow:
-                0 0 0 2px rgba(124, 92, 252, 0.3),
-                0 0 0 4px rgba(124, 92, 252, 0.1),
-                0 0 20px rgba(124, 92, 252, 0.08) !important;
-            animation: focusRingPulse 2s ease-in-out infinite;
-        }
-
-        @keyframes focusRingPulse {
-            0%, 100% {
-                box-shadow:
-                    0 0 0 2px rgba(124, 92, 252, 0.3),
-                    0 0 0 4px rgba(124, 92, 252, 0.1),
-                    0 0 20px rgba(124, 92, 252, 0.08);
-            }
-            50% {
-                box-shadow:
-                    0 0 0 3px rgba(124, 92, 252, 0.4),
-                    0 0 0 6px rgba(124, 92, 252, 0.15),
-                    0 0 30px rgba(124, 92, 252, 0.12);
-            }
-        }
-
-        /* Enhanced toast notification animation */
-        [data-testid="stAlert"] {
-            animation: toastSlideIn 0.5s cubic-bezier(0.34, 1.56, 0.64, 1) both !important;
-        }
-
-        @keyframes toastSlideIn {
-            0% {
-                opacity: 0;
-                transform: translateX(30px) scale(0.95);
-                filter: blur(4px);
-            }
-            100% {
-                opacity: 1;
-                transform: translateX(0) scale(1);
-                filter: blur(0);
-            }
-        }
-
-        /* Skeleton loading pulse */
-        .skeleton-loading {
-            background: linear-gradient(
-                90deg,
-                rgba(255,255,255,0.03) 25%,
-                rgba(255,255,255,0.06) 50%,
-                rgba(255,255,255,0.03) 75%
-            );
-            background-size: 200% 100%;
-            animation: skeletonShimmer 1.5s ease-in-out infinite;
-            border-radius: var(--radius-sm);
-        }
-
-        @keyframes skeletonShimmer {
-            0% { background-position: 200% 0; }
-            100% { background-position: -200% 0; }
-        }
-
-        /* Enhanced sidebar open/close animation */
-        div[data-testid="stSidebar"] {
-            transition: transform 0.4s cubic-bezier(0.16, 1, 0.3, 1),
-                        opacity 0.3s ease !important;
-        }
-
-        div[data-testid="stSidebar"][aria-expanded="false"] {
-            transform: translateX(-100%);
-            opacity: 0;
-        }
-
-        /* Floating label input simulation */
-        .stTextInput label,
-        .stTextArea label,
-        .stNumberInput label,
-        .stSelectbox label {
-            transition: all 0.3s var(--ease-out) !important;
-            transform-origin: left center;
-        }
-
-        .stTextInput:focus-within label,
-        .stTextArea:focus-within label,
-        .stNumberInput:focus-within label {
-            color: var(--primary-300) !important;
-            transform: scale(0.9);
-        }
-
-        /* ══════════════════════════════════════════════════════════════════
-           AMBIENT LIGHT STREAKS — Atmospheric Background Effect
-           ══════════════════════════════════════════════════════════════════ */
-        .ambient-light-streak {
-            position: fixed;
-            width: 300px;
-            height: 1px;
-            pointer-events: none;
-            z-index: 0;
-            opacity: 0;
-            will-change: transform, opacity;
-        }
-
-        .ambient-light-streak-1 {
-            top: 20%;
-            left: -10%;
-            background: linear-gradient(90deg, transparent, rgba(124, 92, 252, 0.15), transparent);
-            animation: ambientStreakFloat1 12s ease-in-out infinite;
-        }
-
-        .ambient-light-streak-2 {
-            top: 60%;
-            right: -10%;
-            background: linear-gradient(90deg, transparent, rgba(52, 211, 153, 0.1), transparent);
-            animation: ambientStreakFloat2 15s ease-in-out 3s infinite;
-        }
-
-        .ambient-light-streak-3 {
-            top: 40%;
-            left: -5%;
-            width: 200px;
-            background: linear-gradient(90deg, transparent, rgba(56, 189, 248, 0.08), transparent);
-            animation: ambientStreakFloat3 18s ease-in-out 6s infinite;
-        }
-
-        @keyframes ambientStreakFloat1 {
-            0%   { opacity: 0; transform: translateX(0) rotate(-5deg); }
-            20%  { opacity: 0.6; }
-            50%  { opacity: 0.8; transform: translateX(120vw) rotate(-3deg); }
-            80%  { opacity: 0.4; }
-            100% { opacity: 0; transform: translateX(120vw) rotate(-5deg); }
-        }
-
-        @keyframes ambientStreakFloat2 {
-            0%   { opacity: 0; transform: translateX(0) rotate(3deg); }
-            25%  { opacity: 0.5; }
-            50%  { opacity: 0.7; transform: translateX(-120vw) rotate(5deg); }
-            75%  { opacity: 0.3; }
-            100% { opacity: 0; transform: translateX(-120vw) rotate(3deg); }
-        }
-
-        @keyframes ambientStreakFloat3 {
-            0%   { opacity: 0; transform: translateX(0) rotate(-2deg); }
-            30%  { opacity: 0.5; }
-            60%  { opacity: 0.6; transform: translateX(100vw) rotate(0deg); }
-            100% { opacity: 0; transform: translateX(100vw) rotate(-2deg); }
-        }
-
-        /* ══════════════════════════════════════════════════════════════════
-           ANIMATED GRADIENT BACKGROUND — Smooth Section Transitions
-           ══════════════════════════════════════════════════════════════════ */
-        .stApp {
-            background-size: 400% 400%;
-            animation: gradientShift 30s ease infinite;
-        }
-
-        @keyframes gradientShift {
-            0%   { background-position: 0% 50%; }
-            25%  { background-position: 50% 0%; }
-            50%  { background-position: 100% 50%; }
-            75%  { background-position: 50% 100%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        /* ══════════════════════════════════════════════════════════════════
-           DEPTH ILLUSION LAYERING — Parallax Float Elements
-           ══════════════════════════════════════════════════════════════════ */
-        .depth-float-element {
-            position: fixed;
-            pointer-events: none;
-            z-index: 0;
-            border-radius: 50%;
-            filter: blur(40px);
-            will-change: transform;
-        }
-
-        .depth-float-1 {
-            width: 300px;
-            height: 300px;
-            top: -5%;
-            right: -5%;
-            background: rgba(124, 92, 252, 0.04);
-            animation: depthFloat1 20s ease-in-out infinite;
-        }
-
-        .depth-float-2 {
-            width: 200px;
-            height: 200px;
-            bottom: 10%;
-            left: -3%;
-            background: rgba(52, 211, 153, 0.03);
-            animation: depthFloat2 25s ease-in-out infinite;
-        }
-
-        .depth-float-3 {
-            width: 150px;
-            height: 150px;
-            top: 45%;
-            right: 20%;
-            background: rgba(245, 158, 11, 0.02);
-            animation: depthFloat3 22s ease-in-out infinite;
-        }
-
-        @keyframes depthFloat1 {
-            0%, 100% { transform: translate3d(0, 0, 0) scale(1); }
-            33% { transform: translate3d(-20px, 15px, 0) scale(1.08); }
-            66% { transform: translate3d(15px, -10px, 0) scale(0.95); }
-        }
-
-        @keyframes depthFloat2 {
-            0%, 100% { transform: translate3d(0, 0, 0) scale(1); }
-            40% { transform: translate3d(25px, -20px, 0) scale(1.1); }
-            70% { transform: translate3d(-10px, 10px, 0) scale(0.92); }
-        }
-
-        @keyframes depthFloat3 {
-            0%, 100% { transform: translate3d(0, 0, 0) scale(1); }
-            50% { transform: translate3d(-15px, 20px, 0) scale(1.12); }
-        }
-
-        /* ══════════════════════════════════════════════════════════════════
-           REDUCED MOTION — Accessibility Compliance
-           ══════════════════════════════════════════════════════════════════ */
-        @media (prefers-reduced-motion: reduce) {
-            *, *::before, *::after {
-                animation-duration: 0.01ms !important;
-                animation-delay: 0ms !important;
-                animation-iteration-count: 1 !important;
-                transition-duration: 0.01ms !important;
-            }
-
-            .lightning-cube-layer,
-            .welcome-particle,
-            .welcome-light-streak,
-            .ambient-light-streak,
-            .depth-float-element,
-            .morph-blob,
-            .aurora,
-            .shooting-star,
-            #stars-container .star {
-                display: none !important;
-            }
-
-            .welcome-overlay {
-                animation: none !important;
-                opacity: 1;
-            }
-
-            .welcome-overlay-title {
-                animation: none !important;
-                opacity: 1;
-            }
-        }
-
-        /* ══════════════════════════════════════════════════════════════════
-           PERFORMANCE — GPU & Low-End Device Optimizations
-           ══════════════════════════════════════════════════════════════════ */
-        .lightning-cube-wrapper,
-        .welcome-cube-wrapper,
-        .depth-float-element,
-        .morph-blob,
-        .ambient-light-streak {
-            contain: layout style;
-            will-change: transform;
-        }
-
-        /* Graceful degradation for low-performance devices */
-        @media (max-width: 768px) {
-            .lightning-cube-layer { opacity: 0.5; }
-            .lightning-cube-wrapper.lc-3,
-            .lightning-cube-wrapper.lc-4 { display: none; }
-            .depth-float-3 { display: none; }
-            .ambient-light-streak-3 { display: none; }
-        }
-
-        @media (max-width: 480px) {
-            .lightning-cube-layer { display: none; }
-            .depth-float-element { display: none; }
-            .ambient-light-streak { display: none; }
-        }
-
-        /* ═══════════════════════════════════════════════════════════
-           ELITE MOTION ARCHITECTURE — Physics-Based Animation System
-           Framer Motion-inspired CSS with spring dynamics
-           ═══════════════════════════════════════════════════════════ */
-
-        /* === SPRING-BASED PAGE ENTRANCE === */
-        @keyframes springReveal {
-            0% { opacity: 0; transform: translate3d(0, 30px, 0) scale(0.96); }
-            40% { opacity: 1; transform: translate3d(0, -4px, 0) scale(1.01); }
-            70% { transform: translate3d(0, 2px, 0) scale(0.998); }
-            100% { opacity: 1; transform: translate3d(0, 0, 0) scale(1); }
-        }
-
-        @keyframes springFadeIn {
-            0% { opacity: 0; transform: scale(0.92); filter: blur(8px); }
-            50% { opacity: 0.8; transform: scale(1.02); filter: blur(1px); }
-            75% { transform: scale(0.995); filter: blur(0); }
-            100% { opacity: 1; transform: scale(1); filter: blur(0); }
-        }
-
-        @keyframes slideUpSpring {
-            0% { opacity: 0; transform: translateY(40px); }
-            60% { opacity: 1; transform: translateY(-6px); }
-            80% { transform: translateY(2px); }
-            100% { transform: translateY(0); }
-        }
-
-        @keyframes slideLeftReveal {
-            0% { opacity: 0; transform: translateX(30px); }
-            60% { opacity: 1; transform: translateX(-4px); }
-            100% { transform: translateX(0); }
-        }
-
-        /* === STAGGERED CONTENT ENTRANCE === */
-        [data-testid="stMetric"]:nth-child(1) { animation: springReveal 0.7s cubic-bezier(0.34, 1.56, 0.64, 1) 0.05s both; }
-        [data-testid="stMetric"]:nth-child(2) { animation: springReveal 0.7s cubic-bezier(0.34, 1.56, 0.64, 1) 0.12s both; }
-        [data-testid="stMetric"]:nth-child(3) { animation: springReveal 0.7s cubic-bezier(0.34, 1.56, 0.64, 1) 0.19s both; }
-        [data-testid="stMetric"]:nth-child(4) { animation: springReveal 0.7s cubic-bezier(0.34, 1.56, 0.64, 1) 0.26s both; }
-
-        .menu-card:nth-child(1) { animation: slideUpSpring 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) 0.1s both; }
-        .menu-card:nth-child(2) { animation: slideUpSpring 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) 0.18s both; }
-        .menu-card:nth-child(3) { animation: slideUpSpring 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) 0.26s both; }
-        .menu-card:nth-child(4) { animation: slideUpSpring 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) 0.34s both; }
-        .menu-card:nth-child(5) { animation: slideUpSpring 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) 0.42s both; }
-        .menu-card:nth-child(6) { animation: slideUpSpring 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) 0.50s both; }
-
-        .event-list-card { animation: slideLeftReveal 0.5s cubic-bezier(0.16, 1, 0.3, 1) both; }
-        .event-list-card:nth-child(2) { animation-delay: 0.08s; }
-        .event-list-card:nth-child(3) { animation-delay: 0.16s; }
-        .event-list-card:nth-child(4) { animation-delay: 0.24s; }
-
-        .person-card { animation: springFadeIn 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) both; }
-
-        /* === MAGNETIC HOVER SYSTEM === */
-        .menu-card {
-            --hover-glow: rgba(124, 92, 252, 0.12);
-            will-change: transform, box-shadow;
-        }
-
-        .menu-card:hover {
-            transform: translateY(-8px) scale(1.025) !important;
-            box-shadow:
-                0 20px 40px rgba(0, 0, 0, 0.25),
-                0 0 30px var(--hover-glow),
-                0 0 60px rgba(124, 92, 252, 0.06),
-                inset 0 1px 0 rgba(255, 255, 255, 0.08) !important;
-        }
-
-        .menu-card:active {
-            transform: translateY(-2px) scale(0.98) !important;
-            transition-duration: 0.1s !important;
-        }
-
-        /* === SUBTLE ELEVATION EFFECTS === */
-        div.stButton > button {
-            will-change: transform, box-shadow;
-        }
-
-        div.stButton > button:hover {
-            transform: translateY(-2px) !important;
-            box-shadow: 0 8px 25px rgba(124, 92, 252, 0.25), 0 4px 12px rgba(0,0,0,0.15) !important;
-        }
-
-        div.stButton > button:active {
-            transform: translateY(0px) scale(0.97) !important;
-            transition-duration: 0.08s !important;
-        }
-
-        /* === ANIMATED UNDERLINE FOR TAB INDICATORS === */
-        .stTabs [data-baseweb="tab-highlight"] {
-            background-color: var(--primary) !important;
-            height: 3px !important;
-            border-radius: 3px 3px 0 0 !important;
-            transition: all 0.4s cubic-bezier(0.34, 1.56, 0.64, 1) !important;
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            transition: all 0.3s cubic-bezier(0.16, 1, 0.3, 1) !important;
-        }
-
-        .stTabs [data-baseweb="tab"]:hover {
-            color: var(--primary-300) !important;
-            background: rgba(124, 92, 252, 0.05) !important;
-        }
-
-        .stTabs [data-baseweb="tab"][aria-selected="true"] {
-            color: var(--primary-200) !important;
-            text-shadow: 0 0 20px rgba(124, 92, 252, 0.3);
-        }
-
-        /* === MODAL / EXPANDER SPRING ANIMATION === */
-        [data-testid="stExpander"] details[open] > div {
-            animation: springReveal 0.45s cubic-bezier(0.34, 1.56, 0.64, 1) both !important;
-        }
-
-        /* === TOAST / SUCCESS NOTIFICATION ANIMATION === */
-        @keyframes toastSlideIn {
-            0% { opacity: 0; transform: translate3d(0, -20px, 0) scale(0.9); }
-            50% { transform: translate3d(0, 4px, 0) scale(1.02); }
-            100% { opacity: 1; transform: translate3d(0, 0, 0) scale(1); }
-        }
-
-        .stAlert {
-            animation: toastSlideIn 0.5s cubic-bezier(0.34, 1.56, 0.64, 1) both !important;
-        }
-
-        /* === COUNTER / NUMBER ANIMATIONS === */
-        [data-testid="stMetric"] [data-testid="stMetricValue"] {
-            transition: all 0.4s cubic-bezier(0.16, 1, 0.3, 1) !important;
-        }
-
-        /* === PROGRESS BAR SMOOTH FILL === */
-        [data-testid="stProgress"] > div > div {
-            transition: width 0.6s cubic-bezier(0.16, 1, 0.3, 1) !important;
-        }
-
-        @keyframes progressGlow {
-            0%, 100% { box-shadow: 0 0 8px rgba(124, 92, 252, 0.4); }
-            50% { box-shadow: 0 0 16px rgba(124, 92, 252, 0.7), 0 0 30px rgba(124, 92, 252, 0.2); }
-        }
+# Worker processes started by default (each is a full copy of the models)
+DEFAULT_INFERENCE_WORKERS = 2
 
-        [data-testid="stProgress"] > div > div > div {
-            animation: progressGlow 2s ease-in-out infinite !important;
-            background: linear-gradient(90deg, var(--primary), var(--secondary), var(--primary)) !important;
-            background-size: 200% 100% !important;
-        }
-
-        /* === FORM FIELD FOCUS ELEVATION === */
-        .stTextInput input:focus,
-        .stTextArea textarea:focus {
-            box-shadow:
-                0 0 0 2px rgba(124, 92, 252, 0.15),
-                0 4px 20px rgba(124, 92, 252, 0.1),
-                0 8px 40px rgba(0, 0, 0, 0.1) !important;
-            transform: translateY(-1px);
-            transition: all 0.3s cubic-bezier(0.16, 1, 0.3, 1) !important;
-        }
-
-        /* === GRADIENT MOTION ON HEADERS === */
-        @keyframes gradientShift {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        h1, .login-title {
-            background-size: 200% auto !important;
-            animation: gradientShift 6s ease-in-out infinite !important;
-        }
-
-        /* === SEAT GRID HOVER INTERACTIONS === */
-        .seat-cell {
-            transition: all 0.25s cubic-bezier(0.34, 1.56, 0.64, 1) !important;
-            cursor: pointer;
-        }
-
-        .seat-cell:hover {
-            transform: scale(1.15) translateY(-3px) !important;
-            z-index: 10 !important;
-            box-shadow: 0 8px 20px rgba(0, 0, 0, 0.3) !important;
-        }
-
-        .seat-male:hover { box-shadow: 0 8px 25px rgba(108, 93, 211, 0.4) !important; }
-        .seat-female:hover { box-shadow: 0 8px 25px rgba(244, 63, 94, 0.4) !important; }
-        .seat-other:hover { box-shadow: 0 8px 25px rgba(56, 189, 248, 0.4) !important; }
-
-        /* === PLOTLY CHART CONTAINER ENTRANCE === */
-        .js-plotly-plot {
-            animation: springFadeIn 0.8s cubic-bezier(0.16, 1, 0.3, 1) 0.3s both;
-        }
-
-        /* === DATA TABLE ENTRANCE === */
-        .stDataFrame {
-            animation: slideUpSpring 0.6s cubic-bezier(0.16, 1, 0.3, 1) 0.2s both;
-        }
-
-        /* === IMAGE ENTRANCE === */
-        [data-testid="stImage"] {
-            animation: springFadeIn 0.5s cubic-bezier(0.16, 1, 0.3, 1) both;
-        }
-
-        /* === DOWNLOAD BUTTON SHINE === */
-        @keyframes buttonShine {
-            0% { left: -100%; }
-            50%, 100% { left: 200%; }
-        }
-
-        .stDownloadButton button::after {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 60%;
-            height: 100%;
-            background: linear-gradient(
-                90deg,
-                transparent,
-                rgba(255, 255, 255, 0.08),
-                transparent
-            );
-            animation: buttonShine 3s ease-in-out infinite;
-            pointer-events: none;
-        }
-
-        .stDownloadButton button {
-            position: relative;
-            overflow: hidden;
-        }
-
-        /* === REDUCED MOTION RESPECT === */
-        @media (prefers-reduced-motion: reduce) {
-            *, *::before, *::after {
-                animation-duration: 0.01ms !important;
-                animation-iteration-count: 1 !important;
-                transition-duration: 0.01ms !important;
-            }
-        }
-
-        /* === GLASS DATA CARD DEPTH === */
-        [data-testid="stForm"] {
-            animation: springReveal 0.6s cubic-bezier(0.34, 1.56, 0.64, 1) 0.15s both;
-        }
-
-        /* === SMART INSIGHTS CARD ANIMATION === */
-        .insight-card {
-            animation: slideUpSpring 0.5s cubic-bezier(0.34, 1.56, 0.64, 1) both;
-            transition: all 0.3s cubic-bezier(0.16, 1, 0.3, 1);
-        }
-
-        .insight-card:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 12px 30px rgba(0, 0, 0, 0.2);
-        }
-
-    </style>
-    """, unsafe_allow_html=True)
-
-def inject_premium_elements():
-    """Inject premium futuristic UI elements - starfield, scroll progress, cursor glow, morphing blobs, lightning cubes, ambient streaks"""
-    st.markdown("""
-    <!-- Animated Starfield Layers -->
-    <div class="stars-layer-1"></div>
-    <div class="stars-layer-2"></div>
-    <div class="stars-layer-3"></div>
-    
-    <!-- Gradient Mesh Background -->
-    <div class="gradient-mesh-bg"></div>
-    
-    <!-- Morphing Blob Shapes -->
-    <div class="morph-blob morph-blob-1"></div>
-    <div class="morph-blob morph-blob-2"></div>
-    
-    <!-- Scroll Progress Indicator -->
-    <div class="scroll-progress" id="scrollProgress"></div>
-    
-    <!-- Cursor Glow Effect -->
-    <div class="cursor-glow" id="cursorGlow"></div>
-
-    <!-- Lightning Cubes — 3D Floating Electric Cubes -->
-    <div class="lightning-cube-layer" id="lightningCubeLayer">
-        <div class="lightning-cube-wrapper lc-1" style="--cube-size:60px;">
-            <div class="lightning-cube-face lightning-cube-face--front"></div>
-            <div class="lightning-cube-face lightning-cube-face--back"></div>
-            <div class="lightning-cube-face lightning-cube-face--right"></div>
-            <div class="lightning-cube-face lightning-cube-face--left"></div>
-            <div class="lightning-cube-face lightning-cube-face--top"></div>
-            <div class="lightning-cube-face lightning-cube-face--bottom"></div>
-        </div>
-        <div class="lightning-cube-wrapper lc-2" style="--cube-size:45px;">
-            <div class="lightning-cube-face lightning-cube-face--front"></div>
-            <div class="lightning-cube-face lightning-cube-face--back"></div>
-            <div class="lightning-cube-face lightning-cube-face--right"></div>
-            <div class="lightning-cube-face lightning-cube-face--left"></div>
-            <div class="lightning-cube-face lightning-cube-face--top"></div>
-            <div class="lightning-cube-face lightning-cube-face--bottom"></div>
-        </div>
-        <div class="lightning-cube-wrapper lc-3" style="--cube-size:35px;">
-            <div class="lightning-cube-face lightning-cube-face--front"></div>
-            <div class="lightning-cube-face lightning-cube-face--back"></div>
-            <div class="lightning-cube-face lightning-cube-face--right"></div>
-            <div class="lightning-cube-face lightning-cube-face--left"></div>
-            <div class="lightning-cube-face lightning-cube-face--top"></div>
-            <div class="lightning-cube-face lightning-cube-face--bottom"></div>
-        </div>
-        <div class="lightning-cube-wrapper lc-4" style="--cube-size:50px;">
-            <div class="lightning-cube-face lightning-cube-face--front"></div>
-            <div class="lightning-cube-face lightning-cube-face--back"></div>
-            <div class="lightning-cube-face lightning-cube-face--right"></div>
-            <div class="lightning-cube-face lightning-cube-face--left"></div>
-            <div class="lightning-cube-face lightning-cube-face--top"></div>
-            <div class="lightning-cube-face lightning-cube-face--bottom"></div>
-        </div>
-    </div>
-
-    <!-- Ambient Light Streaks -->
-    <div class="ambient-light-streak ambient-light-streak-1"></div>
-    <div class="ambient-light-streak ambient-light-streak-2"></div>
-    <div class="ambient-light-streak ambient-light-streak-3"></div>
+# --- STATE INITIALIZATION ---
+if 'face_engine' not in st.session_state:
+    # One engine (models + face index) per process; each session gets a view scoped to its events
+    # EQUIVISION_MIN_FACE=<px> / EQUIVISION_PRIMARY_FACES=1 keep background faces in
+    # crowd shots out of embedding, gender and the duplicate index
+    # EQUIVISION_INFERENCE=onnx|onnx-int8 runs embedding and gender on ONNX Runtime
+    # (exports from `python onnx_backend.py export models/`, see EQUIVISION_MODEL_DIR)
+    shared_engine = get_shared_engine(face_filter=FaceFilter(
+        min_face_size=int(os.environ.get("EQUIVISION_MIN_FACE", "24") or 0),
+        primary_only=os.environ.get("EQUIVISION_PRIMARY_FACES", "0") == "1"),
+        inference_backend=os.environ.get("EQUIVISION_INFERENCE", "keras"))
+    # Inference runs in worker processes so batch upload and concurrent desks run in
+    # parallel (threads alone would take turns on the shared models). The pool launches
+    # every worker now and each loads and warms its own models in the background, so the
+    # first check-in does not pay for it. Each worker holds its own copy of TensorFlow and
+    # the models, hence the small default. EQUIVISION_WORKERS=<n> sets the count (default:
+    # all cores but one, at most DEFAULT_INFERENCE_WORKERS), 0 keeps inference in this process
+    workers_env = os.environ.get("EQUIVISION_WORKERS", "").strip()
+    inference_workers = int(workers_env) if workers_env else min(default_workers(), DEFAULT_INFERENCE_WORKERS)
+    if not workers_env and (os.cpu_count() or 1) < 2:
+        inference_workers = 0  # one core: worker processes would only add overhead
+    if inference_workers > 0:
+        shared_engine.start_workers(workers=inference_workers, warmup_backends=('opencv', 'ssd'))
+    else:
+        # Preload + run every model in the background (live desk uses opencv, batch uses ssd)
+        # so the first check-in is as fast as the rest; only the first session starts it.
+        # DeepFace/TensorFlow are imported on that thread too, so the login page never waits for them
+        shared_engine.start_warmup(detector_backends=('opencv', 'ssd'))
+    # EQUIVISION_METRICS_PORT=<port> serves Prometheus metrics (stage latency, detector
+    # fallbacks, faces per image, cache hits) at 127.0.0.1:<port>/metrics;
+    # EQUIVISION_METRICS_FILE=<path> rewrites a node_exporter textfile every 15s instead
+    shared_engine.export_metrics(port=os.environ.get("EQUIVISION_METRICS_PORT") or None,
+                                 path=os.environ.get("EQUIVISION_METRICS_FILE") or None)
+    st.session_state.face_engine = FaceEngineView(shared_engine)
+if 'main_folders' not in st.session_state: st.session_state.main_folders = {}
+if 'events' not in st.session_state: st.session_state.events = {} 
+if 'current_user' not in st.session_state: st.session_state.current_user = None
+if 'user_id' not in st.session_state: st.session_state.user_id = None
+if 'page' not in st.session_state: st.session_state.page = "login"
+if 'current_event' not in st.session_state: st.session_state.current_event = None
+if 'subpage' not in st.session_state: st.session_state.subpage = None
+if 'upload_key' not in st.session_state: st.session_state.upload_key = 0
+if 'db_loaded' not in st.session_state: st.session_state.db_loaded = False
+if 'show_welcome' not in st.session_state: st.session_state.show_welcome = False
 
-    <!-- Depth Float Elements -->
-    <div class="depth-float-element depth-float-1"></div>
-    <div class="depth-float-element depth-float-2"></div>
-    <div class="depth-float-element depth-float-3"></div>
+@profiled()
+def load_from_db():
+    """Sync events and folders from Supabase into session state."""
+    uid = st.session_state.user_id
+    if not uid: return
     
-    <script>
-        // Guard: Prevent duplicate listener registration across Streamlit reruns
-        if (window._equivisionListenersRegistered) {
-            // Already registered — skip all listener setup
-        } else {
-        window._equivisionListenersRegistered = true;
-        
-        // === SCROLL PROGRESS INDICATOR ===
-        (function() {
-            const scrollProgress = document.getElementById('scrollProgress');
-            if (!scrollProgress) return;
-            
-            function updateScrollProgress() {
-                const scrollTop = window.scrollY || document.documentElement.scrollTop;
-                const scrollHeight = document.documentElement.scrollHeight - window.innerHeight;
-                const progress = scrollHeight > 0 ? (scrollTop / scrollHeight) * 100 : 0;
-                scrollProgress.style.width = progress + '%';
-            }
-            
-            window.addEventListener('scroll', updateScrollProgress, { passive: true });
-            updateScrollProgress();
-        })();
-        
-        // === CURSOR GLOW EFFECT ===
-        (function() {
-            const cursorGlow = document.getElementById('cursorGlow');
-            if (!cursorGlow) return;
-            
-            let mouseX = 0, mouseY = 0;
-            let currentX = 0, currentY = 0;
-            
-            document.addEventListener('mousemove', (e) => {
-                mouseX = e.clientX;
-                mouseY = e.clientY;
-            });
-            
-            function animateCursor() {
-                currentX += (mouseX - currentX) * 0.1;
-                currentY += (mouseY - currentY) * 0.1;
-                cursorGlow.style.left = currentX + 'px';
-                cursorGlow.style.top = currentY + 'px';
-                requestAnimationFrame(animateCursor);
-            }
-            animateCursor();
-        })();
-        
-        // === 3D TILT EFFECT ON CARDS ===
-        (function() {
-            const cards = document.querySelectorAll('[data-testid="stMetric"], .menu-card, .person-card');
-            
-            cards.forEach(card => {
-                card.addEventListener('mousemove', (e) => {
-                    const rect = card.getBoundingClientRect();
-                    const x = e.clientX - rect.left;
-                    const y = e.clientY - rect.top;
-                    
-                    const centerX = rect.width / 2;
-                    const centerY = rect.height / 2;
-                    
-                    const rotateX = (y - centerY) / 10;
-                    const rotateY = (centerX - x) / 10;
-                    
-                    card.style.transform = `perspective(1000px) rotateX(${rotateX}deg) rotateY(${rotateY}deg) scale(1.02)`;
-                });
-                
-                card.addEventListener('mouseleave', () => {
-                    card.style.transform = 'perspective(1000px) rotateX(0) rotateY(0) scale(1)';
-                });
-            });
-        })();
-        
-        // === MAGNETIC BUTTON EFFECT ===
-        (function() {
-            const buttons = document.querySelectorAll('[data-testid="stButton"] button');
-            
-            buttons.forEach(btn => {
-                btn.addEventListener('mousemove', (e) => {
-                    const rect = btn.getBoundingClientRect();
-                    const x = e.clientX - rect.left - rect.width / 2;
-                    const y = e.clientY - rect.top - rect.height / 2;
-                    
-                    btn.style.transform = `translate(${x * 0.1}px, ${y * 0.1}px)`;
-                });
-                
-                btn.addEventListener('mouseleave', () => {
-                    btn.style.transform = 'translate(0, 0)';
-                });
-            });
-        })();
-        
-        // === PARALLAX SCROLL EFFECT ===
-        (function() {
-            window.addEventListener('scroll', () => {
-                const scrollY = window.scrollY;
-                document.documentElement.style.setProperty('--scroll-y', scrollY + 'px');
-            }, { passive: true });
-        })();
-        
-        // === ANIMATED COUNTER NUMBERS ===
-        (function() {
-            const observer = new IntersectionObserver((entries) => {
-                entries.forEach(entry => {
-                    if (entry.isIntersecting) {
-                        const metric = entry.target.querySelector('[data-testid="stMetricValue"]');
-                        if (metric) {
-                            metric.classList.add('counter-animate');
-                        }
-                    }
-                });
-            }, { threshold: 0.5 });
-            
-            document.querySelectorAll('[data-testid="stMetric"]').forEach(el => observer.observe(el));
-        })();
-        
-        // === SUCCESS CONFETTI EFFECT ===
-        window.triggerConfetti = function() {
-            const colors = ['#7C5CFC', '#34D399', '#F59E0B', '#F43F5E', '#38BDF8'];
-            for (let i = 0; i < 50; i++) {
-                const confetti = document.createElement('div');
-                confetti.className = 'confetti-particle';
-                confetti.style.left = Math.random() * 100 + 'vw';
-                confetti.style.bottom = '-20px';
-                confetti.style.background = colors[Math.floor(Math.random() * colors.length)];
-                confetti.style.animationDuration = (2 + Math.random() * 2) + 's';
-                confetti.style.animationDelay = Math.random() * 0.5 + 's';
-                document.body.appendChild(confetti);
-                setTimeout(() => confetti.remove(), 4000);
-            }
-        };
-        
-        // === 3D CARD TILT EFFECT ===
-        (function() {
-            if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
-            
-            const tiltCards = document.querySelectorAll('[data-testid="stMetric"], [data-testid="stExpander"]');
-            
-            tiltCards.forEach(card => {
-                card.addEventListener('mousemove', (e) => {
-                    const rect = card.getBoundingClientRect();
-                    const x = (e.clientX - rect.left) / rect.width;
-                    const y = (e.clientY - rect.top) / rect.height;
-                    
-                    const tiltX = (y - 0.5) * -8;
-                    const tiltY = (x - 0.5) * 8;
-                    
-                    card.style.transform = `perspective(800px) rotateX(${tiltX}deg) rotateY(${tiltY}deg) translate3d(0, -3px, 0)`;
-                    card.style.transition = 'transform 0.1s ease';
-                });
-                
-                card.addEventListener('mouseleave', () => {
-                    card.style.transform = 'perspective(800px) rotateX(0deg) rotateY(0deg) translate3d(0, 0, 0)';
-                    card.style.transition = 'transform 0.4s cubic-bezier(0.16, 1, 0.3, 1)';
-                });
-            });
-        })();
-        
-        // === STAGGERED SCROLL REVEAL ===
-        (function() {
-            if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
-            
-            const revealObserver = new IntersectionObserver((entries) => {
-                entries.forEach((entry, idx) => {
-                    if (entry.isIntersecting) {
-                        const el = entry.target;
-                        const delay = idx * 60;
-                        el.style.transition = `opacity 0.5s cubic-bezier(0.16, 1, 0.3, 1) ${delay}ms, transform 0.5s cubic-bezier(0.16, 1, 0.3, 1) ${delay}ms`;
-                        el.style.opacity = '1';
-                        el.style.transform = 'translate3d(0, 0, 0) scale(1)';
-                        revealObserver.unobserve(el);
-                    }
-                });
-            }, { threshold: 0.1, rootMargin: '0px 0px -40px 0px' });
-            
-            // Observe cards, expanders, dataframes, forms
-            const revealTargets = document.querySelectorAll(
-                '.menu-card, .person-card, .event-list-card, div.stDataFrame, div[data-testid="stForm"]'
-            );
-            
-            revealTargets.forEach(el => {
-                el.style.opacity = '0';
-                el.style.transform = 'translate3d(0, 20px, 0) scale(0.98)';
-                revealObserver.observe(el);
-            });
-        })();
-        
-        // === RIPPLE CLICK EFFECT ===
-        (function() {
-            document.addEventListener('click', (e) => {
-                const btn = e.target.closest('[data-testid="stButton"] button, .stDownloadButton button');
-                if (!btn) return;
-                
-                const ripple = document.createElement('span');
-                const rect = btn.getBoundingClientRect();
-                const size = Math.max(rect.width, rect.height);
-                
-                ripple.style.cssText = `
-                    position: absolute;
-                    width: ${size}px;
-                    height: ${size}px;
-                    left: ${e.clientX - rect.left - size / 2}px;
-                    top: ${e.clientY - rect.top - size / 2}px;
-                    background: radial-gradient(circle, rgba(255,255,255,0.3) 0%, transparent 60%);
-                    border-radius: 50%;
-                    transform: scale(0);
-                    animation: rippleExpand 0.6s ease-out forwards;
-                    pointer-events: none;
-                    z-index: 1;
-                `;
-                
-                btn.style.position = 'relative';
-                btn.style.overflow = 'hidden';
-                btn.appendChild(ripple);
-                setTimeout(() => ripple.remove(), 700);
-            });
-            
-            // Inject ripple keyframe
-            if (!document.querySelector('#ripple-style')) {
-                const style = document.createElement('style');
-                style.id = 'ripple-style';
-                style.textContent = `
-                    @keyframes rippleExpand {
-                        to { transform: scale(2.5); opacity: 0; }
-                    }
-                `;
-                document.head.appendChild(style);
-            }
-        })();
-
-        // === LIGHTNING CUBE PERFORMANCE ADAPTER ===
-        (function() {
-            if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
-            
-            const cubeLayer = document.getElementById('lightningCubeLayer');
-            if (!cubeLayer) return;
+    # Load events
+    events_raw = db.get_events(uid)
+    for e in events_raw:
+        eid = e['id']
+        if eid not in st.session_state.events:
+            tm = e.get('team_members', '[]')
+            if isinstance(tm, str):
+                try: tm = json.loads(tm)
+                except (ValueError, json.JSONDecodeError): tm = []
+            elif tm is None: tm = []
             
-            // Performance detection — disable cubes on low FPS
-            let frameCount = 0;
-            let lastTime = performance.now();
-            let lowFpsCount = 0;
+            rl = e.get('roles', '[]')
+            if isinstance(rl, str):
+                try: rl = json.loads(rl)
+                except (ValueError, json.JSONDecodeError): rl = {}
+            elif rl is None: rl = {}
             
-            function checkPerformance() {
-                frameCount++;
-                const now = performance.now();
-                if (now - lastTime >= 1000) {
-                    const fps = frameCount;
-                    frameCount = 0;
-                    lastTime = now;
-                    
-                    if (fps < 30) {
-                        lowFpsCount++;
-                        if (lowFpsCount >= 3) {
-                            // Degrade gracefully — hide cubes
-                            cubeLayer.style.display = 'none';
-                            return; // Stop monitoring
-                        }
-                    } else {
-                        lowFpsCount = Math.max(0, lowFpsCount - 1);
-                    }
-                }
-                requestAnimationFrame(checkPerformance);
+            st.session_state.events[eid] = {
+                'name': e.get('name', ''),
+                'date': e.get('date', ''),
+                'password': e.get('password', ''),
+                'hall_rows': e.get('hall_rows', 5),
+                'hall_cols': e.get('hall_cols', 10),
+                'cluster_size': e.get('cluster_size', 1),
+                'data': db.get_attendees(eid),
+                'roles': rl if isinstance(rl, dict) else {},
+                'team_members': tm if isinstance(tm, list) else []
             }
-            requestAnimationFrame(checkPerformance);
-            
-            // Subtle parallax movement on cubes based on mouse
-            let cubeMouseX = 0, cubeMouseY = 0;
-            document.addEventListener('mousemove', (e) => {
-                cubeMouseX = (e.clientX / window.innerWidth - 0.5) * 2;
-                cubeMouseY = (e.clientY / window.innerHeight - 0.5) * 2;
-            }, { passive: true });
-            
-            const cubes = cubeLayer.querySelectorAll('.lightning-cube-wrapper');
-            function animateCubeParallax() {
-                cubes.forEach((cube, i) => {
-                    const factor = (i + 1) * 3;
-                    const tx = cubeMouseX * factor;
-                    const ty = cubeMouseY * factor;
-                    cube.style.marginLeft = tx + 'px';
-                    cube.style.marginTop = ty + 'px';
-                });
-                requestAnimationFrame(animateCubeParallax);
+    
+    # Load folders
+    folders_raw = db.get_folders(uid)
+    for f in folders_raw:
+        fname = f.get('name', '')
+        if fname not in st.session_state.main_folders:
+            folder_event_ids = db.get_folder_events(f['id'])
+            st.session_state.main_folders[fname] = {
+                'date': f.get('date', ''),
+                'events': folder_event_ids,
+                'db_id': f['id']
             }
-            animateCubeParallax();
-        })();
-
-        // === SMOOTH SECTION TRANSITIONS ON SCROLL ===
-        (function() {
-            if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
-            
-            const sectionObserver = new IntersectionObserver((entries) => {
-                entries.forEach(entry => {
-                    if (entry.isIntersecting) {
-                        entry.target.style.opacity = '1';
-                        entry.target.style.transform = 'translate3d(0, 0, 0)';
-                        entry.target.style.filter = 'blur(0)';
-                        sectionObserver.unobserve(entry.target);
-                    }
-                });
-            }, { threshold: 0.05, rootMargin: '0px 0px -60px 0px' });
-            
-            // Observe major content sections
-            const sections = document.querySelectorAll(
-                '.welcome-banner, [data-testid="stForm"], .seat-grid-container, .stDataFrame'
-            );
-            sections.forEach(el => {
-                el.style.opacity = '0';
-                el.style.transform = 'translate3d(0, 25px, 0)';
-                el.style.filter = 'blur(3px)';
-                el.style.transition = 'opacity 0.6s cubic-bezier(0.16, 1, 0.3, 1), transform 0.6s cubic-bezier(0.16, 1, 0.3, 1), filter 0.6s ease';
-                sectionObserver.observe(el);
-            });
-        })();
-
-        // === ENHANCED MAGNETIC HOVER FOR MENU CARDS ===
-        (function() {
-            if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
-            
-            document.querySelectorAll('.menu-card').forEach(card => {
-                card.addEventListener('mousemove', (e) => {
-                    const rect = card.getBoundingClientRect();
-                    const x = ((e.clientX - rect.left) / rect.width) * 100;
-                    const y = ((e.clientY - rect.top) / rect.height) * 100;
-                    card.style.setProperty('--mouse-x', x + '%');
-                    card.style.setProperty('--mouse-y', y + '%');
-                });
-            });
-        })();
-
-        // === SOFT GLOW ON METRIC HOVER ===
-        (function() {
-            document.querySelectorAll('[data-testid="stMetric"]').forEach(metric => {
-                metric.addEventListener('mouseenter', function() {
-                    this.style.transition = 'all 0.4s cubic-bezier(0.34, 1.56, 0.64, 1)';
-                    this.style.transform = 'translateY(-5px) scale(1.03)';
-                    this.style.boxShadow = '0 12px 35px rgba(124, 92, 252, 0.15), 0 0 20px rgba(124, 92, 252, 0.08)';
-                });
-                metric.addEventListener('mouseleave', function() {
-                    this.style.transform = '';
-                    this.style.boxShadow = '';
-                });
-            });
-        })();
+    
+    st.session_state.db_loaded = True
+    # Reload face encodings so duplicate detection works across server restarts
+    st.session_state.face_engine.load_known_faces(st.session_state.events)
 
-        // === INTERACTIVE FOCUS RING WITH GLOW ===
-        (function() {
-            document.addEventListener('focusin', (e) => {
-                const input = e.target;
-                if (input.tagName === 'INPUT' || input.tagName === 'TEXTAREA') {
-                    input.style.transition = 'all 0.3s cubic-bezier(0.16, 1, 0.3, 1)';
-                }
-            });
-        })();
+# --- CSS STYLES ---
+# .streamlit/config.toml turns this on; hashed theme files are then served from static/
+STATIC_SERVING = st.get_option("server.enableStaticServing")
 
-        // === SMOOTH PAGE TRANSITION FADE ===
-        (function() {
-            // Fade in main content on load
-            const mainContent = document.querySelector('[data-testid="stAppViewContainer"]');
-            if (mainContent) {
-                mainContent.style.opacity = '0';
-                mainContent.style.transition = 'opacity 0.5s cubic-bezier(0.16, 1, 0.3, 1)';
-                requestAnimationFrame(() => {
-                    requestAnimationFrame(() => {
-                        mainContent.style.opacity = '1';
-                    });
-                });
-            }
-        })();
+def asset_loader(name, element_id, inline_loader):
+    """Loader for an assets/ file: its static URL when served, else the whole text inline."""
+    asset = load_asset(name)
+    if STATIC_SERVING:
+        return url_loader(asset, publish_asset(asset), element_id)
+    return inline_loader(asset, element_id)
 
-        // === TOOLTIP ENHANCEMENT ===
-        (function() {
-            const tooltipStyle = document.createElement('style');
-            tooltipStyle.id = 'elite-tooltips';
-            if (!document.querySelector('#elite-tooltips')) {
-                tooltipStyle.textContent = `
-                    .seat-cell[title]:hover::after {
-                        content: attr(title);
-                        position: absolute;
-                        bottom: calc(100% + 8px);
-                        left: 50%;
-                        transform: translateX(-50%) translateY(5px);
-                        padding: 6px 12px;
-                        background: rgba(15, 15, 30, 0.95);
-                        color: #fff;
-                        font-size: 0.75rem;
-                        border-radius: 8px;
-                        white-space: nowrap;
-                        z-index: 1000;
-                        pointer-events: none;
-                        border: 1px solid rgba(124, 92, 252, 0.2);
-                        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.4);
-                        animation: tooltipFade 0.2s ease-out;
-                    }
-                    @keyframes tooltipFade {
-                        from { opacity: 0; transform: translateX(-50%) translateY(10px); }
-                        to { opacity: 1; transform: translateX(-50%) translateY(5px); }
-                    }
-                    .seat-cell { position: relative; }
-                `;
-                document.head.appendChild(tooltipStyle);
-            }
-        })();
+def local_css():
+    # The design system lives in assets/theme.css, minified and hashed once per process.
+    # The loader (a few hundred bytes with static serving) is emitted on every rerun: if a
+    # quick rerun dropped its iframe before the script ran, the next one still installs
+    # the theme; once installed it is a no-op and the browser keeps the stylesheet
+    components.html(asset_loader(THEME_CSS, "equivision-theme", style_loader), height=0)
 
-        } // end guard
-    </script>
-    """, unsafe_allow_html=True)
+def inject_premium_elements():
+    """Inject premium futuristic UI elements - starfield, scroll progress, cursor glow, morphing blobs, lightning cubes, ambient streaks"""
+    # Decorative markup only (~2.6KB); re-emitted each rerun so it stays on the page
+    st.markdown(load_asset(PREMIUM_HTML).text, unsafe_allow_html=True)
+    # assets/premium.js used to sit in the st.markdown call above, whose sanitizer
+    # drops <script>, so it never ran; EQUIVISION_EFFECTS_JS=1 runs it once per page
+    # (re-emitted like the theme loader, which skips it when already present)
+    if os.environ.get("EQUIVISION_EFFECTS_JS") == "1":
+        components.html(asset_loader(PREMIUM_JS, "equivision-effects", script_loader), height=0)
 
 local_css()
 inject_premium_elements()
 
-def draw_faces(image_pil, faces, current_idx):
-    img_cv = np.array(image_pil)
-    img_cv = cv2.cvtColor(img_cv, cv2.COLOR_RGB2BGR)
-    
-    for idx, face in enumerate(faces):
-        top, right, bottom, left = face['bbox']
-        
-        # Highlight current face
-        if idx == current_idx:
-            color = (0, 255, 0) # Green for current
-            thickness = 3
-            label = f"P{idx+1} (Current)"
-        else:
-            color = (255, 0, 0) # Red for others
-            thickness = 2
-            if idx < current_idx:
-                label = f"P{idx+1} (Done)"
-                color = (200, 200, 200) # Gray for done
-            else:
-                label = f"P{idx+1}"
-        
-        cv2.rectangle(img_cv, (left, top), (right, bottom), color, thickness)
-        cv2.putText(img_cv, f"{label} - {face['gender']}", (left, top - 10), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
-        
-    return Image.fromarray(cv2.cvtColor(img_cv, cv2.COLOR_BGR2RGB))
+# Blurry, dark or far-away desk photos are turned away before any model runs
+DESK_QUALITY_GATE = QualityGate()
+
+# Longest side of the annotated photo shown on the live desk; st.image scales it to the column anyway
+OVERLAY_PREVIEW_SIDE = 1280
 
 # --- HELPER FUNCTIONS ---
 def generate_code():
@@ -6333,6 +206,7 @@ def render_header():
 
 # --- PAGES ---
 
+@profiled()
 def login_page():
     # Starry Background Injection — Cinematic immersive starfield
     # Cache stars HTML to prevent flicker on reruns
@@ -6553,6 +427,7 @@ def _render_welcome_overlay():
 """, height=0, width=0)
 
 
+@profiled()
 def home_page():
     render_header()
     
@@ -6707,6 +582,7 @@ def home_page():
             st.session_state.page = "login"
             st.rerun()
 
+@profiled()
 def create_event():
     render_header()
     st.header("➕ Create New Event")
@@ -6746,6 +622,7 @@ def create_event():
             else:
                 st.error("Name and Password are required.")
 
+@profiled()
 def events_list():
     render_header()
     st.header("📂 Select an Event")
@@ -6768,6 +645,7 @@ def events_list():
             st.session_state.page = "event_menu"
             st.rerun()
 
+@profiled()
 def event_menu():
     render_header()
     eid = st.session_state.current_event
@@ -6930,6 +808,7 @@ def event_menu():
     elif st.session_state.subpage == "team_management": team_management(evt)
     elif st.session_state.subpage == "batch_upload": batch_upload_page(evt)
 
+@profiled()
 def attendance_setup(evt):
     st.subheader("🏁 Start Attendance Session")
     mode = st.selectbox("Select Mode", ["Normal (Full Data)", "Privacy (No Personal Data)"])
@@ -6938,6 +817,7 @@ def attendance_setup(evt):
         st.session_state.subpage = "attendance_active"
         st.rerun()
 
+@profiled()
 def attendance_active(evt):
     mode = st.session_state.get('temp_mode', 'Normal')
     st.subheader(f"📸 Live Session ({mode})")
@@ -6962,29 +842,56 @@ def attendance_active(evt):
         if 'current_face_idx' not in st.session_state: st.session_state.current_face_idx = 0
         
         if img_buffer:
+            engine = st.session_state.face_engine
             bytes_data = img_buffer.getvalue()
-            photo_hash = hashlib.md5(bytes_data).hexdigest()
+            photo_hash = content_key(bytes_data)
             if st.session_state.last_photo_hash != photo_hash:
                 st.session_state.last_photo_hash = photo_hash
                 
                 with st.spinner("🔍 Detecting faces..."):
-                    image = Image.open(img_buffer)
-                    # Use opencv backend for fastest detection
+                    # Use opencv backend for fastest detection; re-uploads hit the cache
                     detection_backend = "opencv"
-                    faces = st.session_state.face_engine.process_image(image, detector_backend=detection_backend)
+                    try:
+                        with timed("process_image"):
+                            faces, quality = engine.process_image_bytes(bytes_data, detector_backend=detection_backend, context=st.session_state.current_event, key=photo_hash, quality_gate=DESK_QUALITY_GATE)
+                    except BrokenProcessPool:
+                        # A worker died; FaceEngine has already started a fresh pool
+                        st.session_state.last_photo_hash = None
+                        st.error("⚠️ Face detection restarted after a crash. Please try this photo again in a moment.")
+                        faces, quality = [], None
                     st.session_state.detected_faces = faces
+                    st.session_state.photo_quality = quality
                     st.session_state.current_face_idx = 0
+            # Display copy, decoded once per photo at preview scale (after inference,
+            # which draft-decodes its own smaller copy)
+            preview_image = engine.decode_image(bytes_data, key=photo_hash, max_side=OVERLAY_PREVIEW_SIDE)
             
             faces = st.session_state.detected_faces
             current_idx = st.session_state.current_face_idx
-            original_image = Image.open(img_buffer)
+            
+            def render(idx):
+                # One renderer per photo: the base frame is converted once and each
+                # step only redraws the boxes whose highlight changed. It keeps a mutable
+                # canvas, so it lives in this session, not the engine's shared cache
+                with timed("draw_faces"):
+                    overlay_key = (photo_hash, len(faces))
+                    cached = st.session_state.get('face_overlay')
+                    if cached is None or cached[0] != overlay_key:
+                        cached = (overlay_key, FaceOverlayRenderer(preview_image, faces, max_side=OVERLAY_PREVIEW_SIDE))
+                        st.session_state.face_overlay = cached
+                    return cached[1].render(idx)
             
             if not faces:
-                st.warning("⚠️ No faces detected! Try again.")
-                st.image(original_image, use_container_width=True)
+                quality = st.session_state.get('photo_quality')
+                if quality and quality['reasons']:
+                    # Turned away before inference: tell the operator what to fix
+                    st.warning("⚠️ Retake: " + "; ".join(quality['reasons']))
+                else:
+                    st.warning("⚠️ No faces detected! Try again.")
+                st.image(preview_image, use_container_width=True)
             elif current_idx >= len(faces):
                 st.success("✅ All faces processed for this photo!")
-                st.image(draw_faces(original_image, faces, -1), use_container_width=True)
+                st.image(render(-1), use_container_width=True)
                 if st.button("📸 Catch Next Batch", use_container_width=True):
                     st.session_state.last_photo_hash = None
                     st.session_state.detected_faces = []
@@ -6993,7 +900,7 @@ def attendance_active(evt):
                         st.session_state.upload_key += 1
                     st.rerun()
             else:
-                display_img = draw_faces(original_image, faces, current_idx)
+                display_img = render(current_idx)
                 st.image(display_img, use_container_width=True)
                 
     with col2:
@@ -7002,13 +909,14 @@ def attendance_active(evt):
             idx = st.session_state.current_face_idx
             face = faces[idx]
             
-            # Crop Face
-            top, right, bottom, left = face['bbox']
+            # Crop Face (boxes are in original pixels; the preview may be smaller)
+            s = image_scale(preview_image)
+            top, right, bottom, left = (int(v * s) for v in face['bbox'])
             # Expand crop slightly
-            h, w = original_image.height, original_image.width
+            h, w = preview_image.height, preview_image.width
             top = max(0, top - 20); left = max(0, left - 20)
             bottom = min(h, bottom + 20); right = min(w, right + 20)
-            face_crop = original_image.crop((left, top, right, bottom))
+            face_crop = preview_image.crop((left, top, right, bottom))
             
             st.markdown(f"""
             <div class="person-card">
@@ -7042,35 +950,12 @@ def attendance_active(evt):
             matched_name = ""
             match_confidence = 0.0
             
-            new_encoding = np.array(face['encoding'])
-            new_norm = np.linalg.norm(new_encoding)
-            known_encs = st.session_state.face_engine.known_encodings
-            known_ids = st.session_state.face_engine.known_ids
-            current_evt_id = st.session_state.current_event
-            
-            if len(known_encs) > 0 and new_norm > 0:
-                event_indices = [idx for idx, meta in enumerate(known_ids) if meta['event_id'] == current_evt_id]
-                if event_indices:
-                    best_similarity = 0
-                    best_match_idx = -1
-                    
-                    for i in event_indices:
-                        known_vec = np.array(known_encs[i])
-                        known_norm = np.linalg.norm(known_vec)
-                        if known_norm == 0: continue
-                        
-                        # Cosine similarity: more accurate for face recognition
-                        similarity = np.dot(known_vec, new_encoding) / (known_norm * new_norm)
-                        
-                        if similarity > best_similarity:
-                            best_similarity = similarity
-                            best_match_idx = i
-                    
-                    # Threshold 0.65 optimized for Facenet512
-                    if best_similarity > 0.65 and best_match_idx >= 0:
-                        is_duplicate = True
-                        matched_name = known_ids[best_match_idx]['name']
-                        match_confidence = best_similarity * 100
+            # Threshold 0.65 optimized for Facenet512; only this event's shard is searched
+            match = st.session_state.face_engine.find_duplicate(face['encoding'], event_id=st.session_state.current_event)
+            if match is not None:
+                is_duplicate = True
+                matched_name = match[0]['name']
+                match_confidence = match[1] * 100
 
             if is_duplicate:
                 st.warning(f"⚠️ **Already Registered:** {matched_name} ({match_confidence:.1f}% match)")
@@ -7117,8 +1002,7 @@ def attendance_active(evt):
                             
                             # Add to known faces logic from previous code
                             if "Privacy" not in mode:
-                                st.session_state.face_engine.known_encodings.append(np.array(face['encoding']))
-                                st.session_state.face_engine.known_ids.append({'name': name, 'event_id': st.session_state.current_event})
+                                st.session_state.face_engine.add_known_face(face['encoding'], {'name': name, 'event_id': st.session_state.current_event})
 
                             st.success(f"✅ Saved {name}!")
                             st.session_state.current_face_idx += 1
@@ -7138,6 +1022,7 @@ def attendance_active(evt):
         st.session_state.subpage = None
         st.rerun()
 
+@profiled()
 def database_view(evt):
     st.subheader("📋 Database")
     eid = st.session_state.current_event
@@ -7186,11 +1071,14 @@ def database_view(evt):
                         db.clear_attendees(st.session_state.current_event)
                         for rec in evt['data']:
                             db.add_attendee(st.session_state.current_event, rec)
+                        # Rebuild this event's duplicate-detection shard (rows may have been deleted)
+                        st.session_state.face_engine.load_event_faces(st.session_state.current_event, evt['data'])
                         st.success("✅ Changes Saved!")
                         st.rerun()
     else:
         st.info("Empty database.")
 
+@profiled()
 def dashboard_view(evt):
     st.subheader("📊 Analytics Dashboard")
     st.write("Filter Participants:")
@@ -7353,6 +1241,7 @@ def dashboard_view(evt):
                 st.error("❌ 'fpdf' library is missing. Please run: pip install fpdf")
             else:
                 try:
+                    pdf_start = time.perf_counter()
                     pdf = FPDF()
                     pdf.add_page()
                     pdf.set_font("Arial", size=16)
@@ -7509,6 +1398,7 @@ def dashboard_view(evt):
                         
                     # Output
                     pdf_content = pdf.output(dest='S').encode('latin-1')
+                    record("pdf_build", time.perf_counter() - pdf_start)
                     b64 = base64.b64encode(pdf_content).decode()
                     safe_pdf_name = html_mod.escape(str(evt['name'])).replace('"', '_').replace(' ', '_')
                     href = f'<a href="data:application/octet-stream;base64,{b64}" download="EventReport_{safe_pdf_name}.pdf" class="pdf-download-btn">📄 Download PDF Report</a>'
@@ -7653,6 +1543,7 @@ def dashboard_view(evt):
     else:
         st.info("📭 No data yet. Start by registering participants to see analytics.")
 
+@profiled()
 def hall_dims(evt):
     st.subheader("⚙️ Hall Dimensions")
     c1, c2 = st.columns(2)
@@ -7670,6 +1561,7 @@ def hall_dims(evt):
         })
         st.success(f"✅ Dimensions Saved! Cluster: {evt.get('cluster_size', 1)}")
 
+@profiled()
 def team_analysis(evt):
     st.subheader("👥 Analyze Team Creation")
     # 3.6 Advice Logic
@@ -7690,6 +1582,7 @@ def team_analysis(evt):
             for i, t in enumerate(teams):
                 st.write(f"**Team {i+1}**: {[p['gender'] for p in t]}")
 
+@profiled()
 def batch_upload_page(evt):
     st.subheader("📂 Batch Upload Multiple Pictures")
     st.info("Select a folder of images to auto-register participants.")
@@ -7723,117 +1616,28 @@ def batch_upload_page(evt):
             
             processed_count = 0
             warnings_list = []
-            hall_full = False
             
-            for i, img_file in enumerate(uploaded_files):
-                if hall_full:
-                    break
-                status_text.text(f"Processing image {i+1}/{new_files_count}...")
+            # Inference runs concurrently; registration (duplicate check, P{n} labels,
+            # seats) still happens one image at a time in upload order
+            items = ((img_file.name, img_file.getvalue()) for img_file in uploaded_files)
+            outcomes = run_batch(st.session_state.face_engine, evt, st.session_state.current_event,
+                                 items, detector_backend="ssd", seat_mgr=seat_mgr)
+            
+            for i, outcome in enumerate(outcomes):
+                status_text.text(f"Processed image {i+1}/{new_files_count}...")
+                name = outcome['source']
                 
-                try:
-                    # Detect
-                    image = Image.open(img_file)
-                    faces = st.session_state.face_engine.process_image(image, detector_backend="ssd")
-                    
-                    if faces:
-                        # Check strict capacity before adding
-                        # Note: We check capacity based on *potential* adds. 
-                        # If duplicate, we won't add, so we don't consume seat.
-                        # extra_seats_needed = len(faces) # worst case
-                        # available = total_seats - len(evt['data'])
-                        # if extra_seats_needed > available: ... 
-                        # For now, let's just check individually inside loop to be safe and accurate
-                        
-                        is_multi = len(faces) > 1
-                        
-                        for f_idx, face in enumerate(faces):
-                            # DUPLICATE CHECK
-                            new_encoding = np.array(face['encoding'])
-                            known_encs = st.session_state.face_engine.known_encodings
-                            known_ids = st.session_state.face_engine.known_ids
-                            current_evt_id = st.session_state.current_event
-                            
-                            match_found = False
-                            matched_name = ""
-                            
-                            # Filter for current event only (or global? User said "Person P4 repeated", P4 implies current event context)
-                            # We'll check against ALL known faces in THIS event
-                            if len(known_encs) > 0:
-                                # Create list of encodings for this event
-                                event_indices = [idx for idx, meta in enumerate(known_ids) if meta['event_id'] == current_evt_id]
-                                if event_indices:
-                                    event_encs = np.array([known_encs[idx] for idx in event_indices])
-                                    
-                                    # Calculate distances using cosine similarity (consistent with live mode)
-                                    new_norm = np.linalg.norm(new_encoding)
-                                    if new_norm == 0:
-                                        similarities = np.zeros(len(event_encs))
-                                    else:
-                                        norms = np.linalg.norm(event_encs, axis=1)
-                                        norms[norms == 0] = 1  # avoid division by zero
-                                        similarities = np.dot(event_encs, new_encoding) / (norms * new_norm)
-                                    min_dist_idx = np.argmax(similarities)
-                                    if similarities[min_dist_idx] > 0.65: # Cosine threshold matching live mode
-                                        match_found = True
-                                        original_idx = event_indices[min_dist_idx]
-                                        matched_name = known_ids[original_idx]['name']
-
-                            if match_found:
-                                warnings_list.append(f"Person **{matched_name}** has been repeated in *{img_file.name}*, he/she will be registered only once.")
-                                continue # Skip registration
-                                
-                            # If not duplicate, CHECK SEATS
-                            if len(evt['data']) >= total_seats:
-                                st.error(f"❌ Hall Full! Stopped at {img_file.name}. (Seat limit reached)")
-                                # Stop everything? or just this face?
-                                # Break out of file loop
-                                hall_full = True
-                                break  # break out of face loop
-
-                            gender = face['gender']
-                            
-                            # Label Logic
-                            # We use len(evt['data']) + 1 to ensure sequential naming based on ACTUAL stored data
-                            # This handles the skipping correctly (e.g. if we skip P4 duplicate, next new person becomes P5 is wrong? 
-                            # No, if P4 is repeated, it's P4.
-                            # Next NEW person should be P5.
-                            # So using len + 1 is safe.
-                            next_sl = len(evt['data']) + 1
-                            
-                            if is_multi:
-                                g_code = gender[0].upper()
-                                p_label = f"P{next_sl}-{f_idx+1}{g_code}"
-                            else:
-                                p_label = f"P{next_sl}"
-                            
-                            # Allocate Seat
-                            seat = seat_mgr.allocate_seat(evt['data'], gender)
-                            
-                            # Register
-                            record = {
-                                "sl_no": next_sl,
-                                "gender": gender,
-                                "seat": seat,
-                                "name": p_label, 
-                                "id": "Batch_Upload",
-                                "branch": "N/A",
-                                "age": 0, 
-                                "encoding": face['encoding'],
-                                "timestamp": str(datetime.now())
-                            }
-                            evt['data'].append(record)
-                            db.add_attendee(st.session_state.current_event, record)
-                            
-                            # Add to known faces
-                            st.session_state.face_engine.known_encodings.append(np.array(face['encoding']))
-                            st.session_state.face_engine.known_ids.append({'name': p_label, 'event_id': current_evt_id})
-                            
-                            processed_count += 1
-                    else:
-                        st.warning(f"⚠️ No face detected in {img_file.name}. Skipped.")
-                        
-                except Exception as e:
-                    st.error(f"Error processing {img_file.name}: {e}")
+                if outcome['error'] is not None:
+                    st.error(f"Error processing {name}: {outcome['error']}")
+                elif outcome['faces'] == 0:
+                    st.warning(f"⚠️ No face detected in {name}. Skipped.")
+                
+                for matched_name in outcome['duplicates']:
+                    warnings_list.append(f"Person **{matched_name}** has been repeated in *{name}*, he/she will be registered only once.")
+                processed_count += len(outcome['registered'])
+                
+                if outcome['hall_full']:
+                    st.error(f"❌ Hall Full! Stopped at {name}. (Seat limit reached)")
                 
                 progress_bar.progress((i + 1) / new_files_count)
             
@@ -7845,6 +1649,7 @@ def batch_upload_page(evt):
             time.sleep(1)
             st.rerun()
 
+@profiled()
 def create_folder():
     render_header()
     st.header("📁 Create Main Event Folder")
@@ -7865,6 +1670,7 @@ def create_folder():
             else:
                 st.error("Failed to create folder. Please try again.")
 
+@profiled()
 def view_folders():
     render_header()
     st.header("Manage Main Folders")
@@ -7957,6 +1763,7 @@ def view_folders():
                              st.session_state.page = "event_menu"
                              st.rerun()
 
+@profiled()
 def team_management(evt):
     st.header("🤝 Team Role Allocation")
     
@@ -8169,10 +1976,14 @@ def team_management(evt):
 if st.session_state.page != "login" and not st.session_state.db_loaded:
     load_from_db()
 
-if st.session_state.page == "login": login_page()
-elif st.session_state.page == "home": home_page()
-elif st.session_state.page == "create_event": create_event()
-elif st.session_state.page == "events_list": events_list()
-elif st.session_state.page == "event_menu": event_menu()
-elif st.session_state.page == "create_folder": create_folder()
-elif st.session_state.page == "view_folders": view_folders()
+# EQUIVISION_PROFILE=1 times each rerun per page; ?diag=1 shows the p50/p95 panel
+with timed(f"rerun:{st.session_state.page}"):
+    if st.session_state.page == "login": login_page()
+    elif st.session_state.page == "home": home_page()
+    elif st.session_state.page == "create_event": create_event()
+    elif st.session_state.page == "events_list": events_list()
+    elif st.session_state.page == "event_menu": event_menu()
+    elif st.session_state.page == "create_folder": create_folder()
+    elif st.session_state.page == "view_folders": view_folders()
+
+render_diagnostics()
@@ -0,0 +1,153 @@
+"""Multi-process inference workers for FaceEngine.
+
+Detection, embedding and gender classification are CPU-bound and mostly hold
+the GIL, so check-in desks served from one Streamlit process serialise on a
+single core. InferencePool runs them in worker processes instead:
+
+* every worker process is launched when the pool is created (the spawn
+  executor would otherwise start them one by one inside ``submit``) and
+  builds and warms its own FaceEngine in the pool initializer, all in
+  parallel. Jobs only go to workers that finished that, so once the first
+  worker is warm no request pays model load time; ``wait_ready`` blocks
+  until every worker is;
+* ``submit`` returns a ``concurrent.futures.Future``;
+* at most ``max_pending`` images are queued or running at a time; beyond
+  that ``submit`` blocks (backpressure) or raises ``queue.Full`` after
+  ``timeout`` seconds.
+
+Workers never see the face index: they return faces with encodings and the
+parent process runs the duplicate check (see FaceEngine.submit).
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+_worker_engine = None  # per-process FaceEngine, set by _init_worker
+
+
+def _init_worker(model_name, warmup_backends, face_filter=None, inference_backend="keras", model_dir=None):
+    global _worker_engine
+    from face_engine import FaceEngine
+
+    _worker_engine = FaceEngine(face_filter=face_filter, inference_backend=inference_backend, model_dir=model_dir)
+    _worker_engine.model_name = model_name
+    _worker_engine.warmup(detector_backends=warmup_backends)
+
+
+def _run_job(image, detector_backend, skip_gender, context, quality_gate=None):
+    """Worker side: (faces, detector attempts, quality report or None, stage timings, faces filtered)."""
+    from face_engine import PROCESS_MAX_SIDE, _to_pil
+
+    # Only time 'open' when there is something to decode; a PIL image was opened
+    # (and timed) by the caller
+    decoding = isinstance(image, (bytes, bytearray))
+    start = time.perf_counter()
+    image = _to_pil(image, PROCESS_MAX_SIDE)
+    opened = time.perf_counter() - start
+    frame = _worker_engine.run_stages(image, detector_backend, context, quality_gate=quality_gate)
+    if decoding:
+        frame.timings['open'] = opened
+    if not skip_gender:
+        _worker_engine.classify_frames([frame])
+    return frame.faces, frame.attempts, frame.quality, frame.timings, frame.filtered
+
+
+def _worker_ready():
+    """No-op start-up job: runs once the worker's initializer (model warm-up) is done."""
+    return os.getpid()
+
+
+def default_workers():
+    # Leave one core for the Streamlit server itself
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+class InferencePool:
+    def __init__(self, workers=None, max_pending=None, model_name="Facenet512", warmup_backends=('opencv',),
+                 face_filter=None, inference_backend="keras", model_dir=None):
+        # Kept so a pool broken by a crashed worker can be rebuilt as-is (see restarted)
+        self._config = dict(workers=workers, max_pending=max_pending, model_name=model_name,
+                            warmup_backends=warmup_backends, face_filter=face_filter,
+                            inference_backend=inference_backend, model_dir=model_dir)
+        self.workers = workers or default_workers()
+        self.max_pending = max_pending or self.workers * 2
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        # spawn: TensorFlow does not survive fork() once it has started threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_name, tuple(warmup_backends), face_filter, inference_backend, model_dir),
+        )
+        # One no-op per worker: each submit() with no idle worker spawns a process,
+        # so all of them start (and warm up) now instead of on the first requests
+        self._ready = [self._executor.submit(_worker_ready) for _ in range(self.workers)]
+
+        self._ready_pids = set()
+
+    def wait_ready(self, timeout=None):
+        """Block until every worker has finished its warm-up. Returns True if they all did in time."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, not_done = wait(self._ready, remaining)
+            if not_done or any(f.exception() is not None for f in done):
+                return False
+            self._ready_pids.update(f.result() for f in done)
+            if len(self._ready_pids) >= self.workers:
+                return True
+            # A warm worker can take several no-ops while the others still load; ask again
+            time.sleep(0.05)
+            self._ready = [self._executor.submit(_worker_ready)
+                           for _ in range(self.workers - len(self._ready_pids))]
+
+    @property
+    def pending(self):
+        """Images queued or running right now."""
+        return self._pending
+
+    def submit(self, image, detector_backend='opencv', skip_gender=False, context=None, quality_gate=None,
+               timeout=None):
+        """Queue one image. Blocks while ``max_pending`` jobs are in flight.
+
+        Raises queue.Full if no slot frees up within ``timeout`` seconds.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise queue.Full(f"Inference queue full ({self.max_pending} pending)")
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(_run_job, image, detector_backend, skip_gender, context, quality_gate)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future):
+        with self._pending_lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def restarted(self):
+        """Shut this pool down and return a fresh one with the same settings.
+
+        A worker that dies (e.g. killed for memory) breaks the whole executor:
+        every later submit raises BrokenProcessPool.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return InferencePool(**self._config)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
@@ -0,0 +1,118 @@
+"""Streaming image ingestion from a directory, .zip or .tar archive.
+
+Images are read one at a time and handed to FaceEngine.iter_process, which
+keeps only a small window in flight, so memory stays flat whether the
+source holds 10 photos or 10,000.
+
+    python ingest.py photos/                  # one JSON line per image
+    python ingest.py last_event.zip --backend ssd --skip-gender
+"""
+import argparse
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+def _is_image(name, extensions):
+    base = os.path.basename(name)
+    # Skip macOS resource forks and other hidden files that archives often carry
+    return not base.startswith('.') and name.lower().endswith(extensions)
+
+
+def iter_image_sources(path, extensions=IMAGE_EXTENSIONS):
+    """Yield ``(name, image_bytes)`` lazily from a directory, zip or tar file.
+
+    Directories are walked recursively in sorted order; archives are read in
+    archive order. Only one file's bytes are held at a time.
+    """
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for fname in sorted(files):
+                full = os.path.join(root, fname)
+                if _is_image(fname, extensions):
+                    with open(full, 'rb') as f:
+                        yield os.path.relpath(full, path), f.read()
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if not info.is_dir() and _is_image(info.filename, extensions):
+                    yield info.filename, zf.read(info)
+    elif tarfile.is_tarfile(path):
+        # Stream mode: members are read sequentially, never all at once
+        with tarfile.open(path, mode='r|*') as tf:
+            for member in tf:
+                if member.isfile() and _is_image(member.name, extensions):
+                    f = tf.extractfile(member)
+                    if f is not None:
+                        yield member.name, f.read()
+    else:
+        raise ValueError(f"Not a directory, zip or tar archive: {path}")
+
+
+def stream_register(engine, evt, event_id, path, detector_backend='ssd', skip_gender=False,
+                    workers=None, window=None):
+    """Register every image under ``path`` into an event, yielding outcomes as they complete.
+
+    Same per-image outcome dicts (and ordering guarantees) as batch_pipeline.run_batch.
+    """
+    from batch_pipeline import run_batch
+
+    return run_batch(engine, evt, event_id, iter_image_sources(path), detector_backend=detector_backend,
+                     skip_gender=skip_gender, workers=workers, window=window)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="directory, .zip or .tar(.gz) of images")
+    parser.add_argument("--backend", default="ssd", help="preferred detector backend (default: ssd)")
+    parser.add_argument("--skip-gender", action="store_true", help="skip gender classification")
+    parser.add_argument("--workers", type=int, default=None, help="inference threads or processes")
+    parser.add_argument("--processes", action="store_true", help="run inference in worker processes")
+    parser.add_argument("--min-face-size", type=int, default=24,
+                        help="ignore faces smaller than this many pixels at detection size (default: 24)")
+    parser.add_argument("--inference", default="keras", choices=("keras", "onnx", "onnx-int8"),
+                        help="embedding/gender runtime (default: keras; onnx needs exported models)")
+    parser.add_argument("--primary-only", action="store_true",
+                        help="only register the main faces of each photo, not people in the background")
+    parser.add_argument("--metrics", default=None, metavar="FILE",
+                        help="write FaceEngine metrics (Prometheus text format) to FILE at the end")
+    args = parser.parse_args(argv)
+
+    from face_engine import FaceEngine
+    from quality_gate import FaceFilter
+
+    engine = FaceEngine(face_filter=FaceFilter(min_face_size=args.min_face_size, primary_only=args.primary_only),
+                        inference_backend=args.inference)
+    if args.processes:
+        engine.start_workers(workers=args.workers, warmup_backends=(args.backend,))
+    else:
+        engine.warmup(detector_backends=(args.backend,), skip_gender=args.skip_gender)
+
+    count = 0
+    start = time.perf_counter()
+    try:
+        for name, faces, error in engine.iter_process(iter_image_sources(args.source),
+                                                      detector_backend=args.backend,
+                                                      skip_gender=args.skip_gender,
+                                                      workers=args.workers):
+            line = {"source": name, "faces": len(faces), "error": str(error) if error else None,
+                    "results": [{"bbox": list(f["bbox"]), "gender": f["gender"],
+                                 "confidence": round(float(f["confidence"]), 2)} for f in faces]}
+            print(json.dumps(line), flush=True)
+            count += 1
+    finally:
+        engine.stop_workers()
+        if args.metrics:
+            engine.write_metrics(args.metrics)
+    elapsed = time.perf_counter() - start
+    print(f"{count} images in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.2f} img/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""ONNX Runtime inference for the embedding and gender models.
+
+FaceEngine(inference_backend="onnx") runs Facenet512 and the gender model
+from ONNX exports instead of DeepFace's Keras models ("onnx-int8" uses the
+dynamically quantized exports). Detection and alignment still go through
+DeepFace.extract_faces. Needs ``pip install onnxruntime`` at run time and
+``tf2onnx`` (plus the Keras stack) to export.
+
+    python onnx_backend.py export models/              # writes Facenet512.onnx, Gender.onnx (+ .int8.onnx)
+    python onnx_backend.py parity photos/ --backend onnx-int8 --output parity.json
+
+The parity report embeds and classifies every detected face of a local
+image set with both the Keras and the ONNX models and reports embedding
+cosine agreement, duplicate-decision agreement, gender agreement and
+per-face latency.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+# Exported models: name -> DeepFace build_model task
+EXPORTED_MODELS = {"Facenet512": "facial_recognition", "Gender": "facial_attribute"}
+INFERENCE_BACKENDS = ("keras", "onnx", "onnx-int8")
+
+
+def model_path(model_dir, name, int8=False):
+    return os.path.join(model_dir, f"{name}.int8.onnx" if int8 else f"{name}.onnx")
+
+
+class OnnxModel:
+    """An ONNX Runtime session with the slice of the Keras API FaceEngine uses."""
+
+    def __init__(self, path, threads=None):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self.path = path
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_shape = tuple(d if isinstance(d, int) else None for d in model_input.shape)
+
+    def predict(self, batch, verbose=0):
+        return self.session.run(None, {self.input_name: np.asarray(batch, dtype=np.float32)})[0]
+
+
+def load_model(model_dir, name, int8=False):
+    """OnnxModel for an exported model, or None (with a message) if it cannot be loaded."""
+    path = model_path(model_dir, name, int8)
+    if not os.path.exists(path):
+        print(f"ONNX model not found: {path} (run: python onnx_backend.py export {model_dir})")
+        return None
+    try:
+        return OnnxModel(path)
+    except ImportError:
+        print("onnxruntime is not installed; using the Keras models")
+    except Exception as e:
+        print(f"ONNX model {path} failed to load: {e}")
+    return None
+
+
+def export_models(model_dir, int8=True, opset=13):
+    """Convert DeepFace's Keras models to ONNX (and int8 copies). Returns the written paths."""
+    import tensorflow as tf
+    import tf2onnx
+    from face_engine import _build_deepface_model
+
+    os.makedirs(model_dir, exist_ok=True)
+    written = []
+    for name, task in EXPORTED_MODELS.items():
+        model = _build_deepface_model(name, task)
+        if model is None:
+            raise RuntimeError(f"DeepFace does not expose the Keras model for {name}")
+        spec = (tf.TensorSpec((None,) + tuple(model.input_shape[1:]), tf.float32, name="input"),)
+        path = model_path(model_dir, name)
+        tf2onnx.convert.from_keras(model, input_signature=spec, opset=opset, output_path=path)
+        written.append(path)
+        if int8:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantize_dynamic(path, model_path(model_dir, name, int8=True), weight_type=QuantType.QInt8)
+            written.append(model_path(model_dir, name, int8=True))
+    return written
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def parity_report(source, backend="onnx", model_dir="models", detector_backend="opencv"):
+    """Compare the Keras models with the ONNX ones on every face found under ``source``."""
+    from face_engine import DUPLICATE_THRESHOLD, PROCESS_MAX_SIDE, FaceEngine, open_image
+    from ingest import iter_image_sources
+
+    reference = FaceEngine()
+    candidate = FaceEngine(inference_backend=backend, model_dir=model_dir)
+    reference.warmup(detector_backends=(detector_backend,))
+    candidate.warmup(detector_backends=())
+
+    ref_embs, cand_embs, ref_genders, cand_genders = [], [], [], []
+    timings = {"keras_embed": 0.0, "keras_gender": 0.0, f"{backend}_embed": 0.0, f"{backend}_gender": 0.0}
+    images = 0
+    for _, data in iter_image_sources(source):
+        images += 1
+        # Detect once so both sides see exactly the same aligned faces and crops
+        frame = reference.detect_stages(open_image(data, PROCESS_MAX_SIDE), detector_backend)
+        if not frame.aligned:
+            continue
+        emb, seconds = _timed(reference.embed_faces, frame.aligned)
+        ref_embs.extend(emb)
+        timings["keras_embed"] += seconds
+        emb, seconds = _timed(candidate.embed_faces, frame.aligned)
+        cand_embs.extend(emb)
+        timings[f"{backend}_embed"] += seconds
+        genders, seconds = _timed(reference.classify_genders, frame.crops)
+        ref_genders.extend(genders)
+        timings["keras_gender"] += seconds
+        genders, seconds = _timed(candidate.classify_genders, frame.crops)
+        cand_genders.extend(genders)
+        timings[f"{backend}_gender"] += seconds
+
+    faces = len(ref_embs)
+    report = {"source": source, "backend": backend, "detector_backend": detector_backend,
+              "images": images, "faces": faces}
+    if not faces:
+        return report
+
+    def unit(rows):
+        rows = np.asarray(rows, dtype=np.float32)
+        return rows / np.maximum(np.linalg.norm(rows, axis=1, keepdims=True), 1e-12)
+
+    ref, cand = unit(ref_embs), unit(cand_embs)
+    cosine = np.sum(ref * cand, axis=1)
+    # Would the duplicate check decide the same for every pair of faces?
+    pairs = np.triu_indices(faces, k=1)
+    ref_dup = (ref @ ref.T)[pairs] > DUPLICATE_THRESHOLD
+    cand_dup = (cand @ cand.T)[pairs] > DUPLICATE_THRESHOLD
+    report.update({
+        "embedding_cosine_mean": float(cosine.mean()),
+        "embedding_cosine_min": float(cosine.min()),
+        "embedding_cosine_p5": float(np.percentile(cosine, 5)),
+        "duplicate_decision_agreement": float(np.mean(ref_dup == cand_dup)) if len(ref_dup) else 1.0,
+        "gender_agreement": float(np.mean([r[0] == c[0] for r, c in zip(ref_genders, cand_genders)])),
+        "gender_confidence_mae": float(np.mean([abs(r[1] - c[1]) for r, c in zip(ref_genders, cand_genders)])),
+    })
+    for name, seconds in timings.items():
+        report[f"{name}_ms_per_face"] = seconds * 1000 / faces
+    for stage in ("embed", "gender"):
+        fast = timings[f"{backend}_{stage}"]
+        report[f"{stage}_speedup"] = timings[f"keras_{stage}"] / fast if fast else None
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="export the Keras models to ONNX")
+    export.add_argument("model_dir")
+    export.add_argument("--no-int8", action="store_true", help="skip the int8 quantized copies")
+    parity = commands.add_parser("parity", help="accuracy/latency report against the Keras models")
+    parity.add_argument("source", help="directory, .zip or .tar(.gz) of images")
+    parity.add_argument("--backend", default="onnx", choices=INFERENCE_BACKENDS[1:])
+    parity.add_argument("--model-dir", default="models")
+    parity.add_argument("--detector", default="opencv", help="detector backend (default: opencv)")
+    parity.add_argument("--output", default=None, help="also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        for path in export_models(args.model_dir, int8=not args.no_int8):
+            print(path)
+        return 0
+
+    report = parity_report(args.source, backend=args.backend, model_dir=args.model_dir,
+                           detector_backend=args.detector)
+    for key, value in report.items():
+        print(f"{key:>32}: {value:.4f}" if isinstance(value, float) else f"{key:>32}: {value}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
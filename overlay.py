@@ -0,0 +1,110 @@
+"""Incremental face-box overlays for the live desk.
+
+Stepping through the people in a photo only changes two boxes per step (the
+face just finished turns grey, the next one turns green), yet every rerun
+used to convert the full-resolution photo PIL -> numpy -> BGR, draw every
+box and convert back. FaceOverlayRenderer converts (and optionally
+downscales) the photo once, keeps the drawn canvas between calls, and on
+each render only restores and redraws the regions whose boxes changed.
+"""
+import cv2
+import numpy as np
+from PIL import Image
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+FONT_SCALE = 0.6
+LABEL_THICKNESS = 2
+# RGB; these match the colours the old draw_faces() helper drew on its BGR copy
+CURRENT_COLOR = (0, 255, 0)
+PENDING_COLOR = (0, 0, 255)
+DONE_COLOR = (200, 200, 200)
+
+
+def face_style(idx, current_idx):
+    """(label, colour, thickness) for face ``idx`` while ``current_idx`` is being registered."""
+    if idx == current_idx:
+        return f"P{idx+1} (Current)", CURRENT_COLOR, 3
+    if idx < current_idx:
+        return f"P{idx+1} (Done)", DONE_COLOR, 2
+    return f"P{idx+1}", PENDING_COLOR, 2
+
+
+class FaceOverlayRenderer:
+    def __init__(self, image_pil, faces, max_side=None):
+        """``max_side`` renders a downscaled preview (boxes are scaled to match)."""
+        base = np.array(image_pil.convert('RGB'))
+        h, w = base.shape[:2]
+        # Boxes are in original pixels; a draft-decoded JPEG (open_image) is already smaller
+        self.scale = w / image_pil.info.get('original_size', (w, h))[0]
+        if max_side and max(h, w) > max_side:
+            resize = max_side / max(h, w)
+            base = cv2.resize(base, (int(w * resize), int(h * resize)), interpolation=cv2.INTER_AREA)
+            self.scale *= resize
+        self.base = base
+        self.faces = faces
+        self.boxes = [self._scaled_box(face['bbox']) for face in faces]
+        self._canvas = None
+        self._styles = None  # style drawn for each face on the current canvas
+
+    @property
+    def nbytes(self):
+        return self.base.nbytes * 2  # base + canvas
+
+    def _scaled_box(self, bbox):
+        top, right, bottom, left = bbox
+        s = self.scale
+        return int(top * s), int(right * s), int(bottom * s), int(left * s)
+
+    def _text(self, idx, label):
+        return f"{label} - {self.faces[idx]['gender']}"
+
+    def _extent(self, idx, style):
+        """Pixel region (y0, y1, x0, x1) touched by face ``idx`` drawn in ``style``."""
+        top, right, bottom, left = self.boxes[idx]
+        label, _, thickness = style
+        (tw, th), baseline = cv2.getTextSize(self._text(idx, label), FONT, FONT_SCALE, LABEL_THICKNESS)
+        pad = max(thickness, LABEL_THICKNESS) + 1
+        y0 = min(top, top - 10 - th) - pad
+        y1 = max(bottom, top - 10 + baseline) + pad
+        x0 = left - pad
+        x1 = max(right, left + tw) + pad
+        H, W = self.base.shape[:2]
+        return max(0, y0), min(H, y1), max(0, x0), min(W, x1)
+
+    def _draw(self, canvas, idx, style, origin=(0, 0)):
+        top, right, bottom, left = self.boxes[idx]
+        label, color, thickness = style
+        oy, ox = origin
+        cv2.rectangle(canvas, (left - ox, top - oy), (right - ox, bottom - oy), color, thickness)
+        cv2.putText(canvas, self._text(idx, label), (left - ox, top - 10 - oy),
+                    FONT, FONT_SCALE, color, LABEL_THICKNESS)
+
+    def render(self, current_idx):
+        """Annotated frame with face ``current_idx`` highlighted (-1: none current)."""
+        styles = [face_style(i, current_idx) for i in range(len(self.faces))]
+
+        if self._canvas is None:
+            self._canvas = self.base.copy()
+            for i, style in enumerate(styles):
+                self._draw(self._canvas, i, style)
+        else:
+            changed = [i for i in range(len(styles)) if styles[i] != self._styles[i]]
+            for y0, y1, x0, x1 in self._dirty_regions(changed, styles):
+                # Restore the clean pixels, then redraw every box touching the region
+                # in painting order; drawing into the sub-view clips to it
+                roi = self._canvas[y0:y1, x0:x1]
+                roi[:] = self.base[y0:y1, x0:x1]
+                for i, style in enumerate(styles):
+                    fy0, fy1, fx0, fx1 = self._extent(i, style)
+                    if fy0 < y1 and fy1 > y0 and fx0 < x1 and fx1 > x0:
+                        self._draw(roi, i, style, origin=(y0, x0))
+        self._styles = styles
+        return Image.fromarray(self._canvas)
+
+    def _dirty_regions(self, changed, styles):
+        regions = []
+        for i in changed:
+            old = self._extent(i, self._styles[i])
+            new = self._extent(i, styles[i])
+            regions.append((min(old[0], new[0]), max(old[1], new[1]), min(old[2], new[2]), max(old[3], new[3])))
+        return [r for r in regions if r[1] > r[0] and r[3] > r[2]]
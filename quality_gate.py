@@ -0,0 +1,96 @@
+"""Cheap image checks that run before any neural model.
+
+A blurry, dark or empty camera frame used to walk the whole detector
+fallback chain and then the embedding and gender models. QualityGate scores
+the resized frame (Laplacian variance for sharpness, mean grey level for
+exposure) before detection, and the largest detected face before embedding,
+so a bad frame is turned away in a few milliseconds with reasons the desk
+operator can act on. FaceFilter works per face instead: it drops background
+detections before they are embedded, classified or added to the index.
+"""
+import cv2
+
+OK = "ok"
+REJECT = "reject"
+
+
+class QualityGate:
+    def __init__(self, min_sharpness=30.0, min_brightness=40.0, max_brightness=220.0, min_face_size=32):
+        """Thresholds apply to the working image (longest side PROCESS_MAX_SIDE); 0/None disables a check."""
+        self.min_sharpness = min_sharpness
+        self.min_brightness = min_brightness
+        self.max_brightness = max_brightness
+        self.min_face_size = min_face_size
+
+    def key(self):
+        """Hashable identity of the thresholds, for result caches."""
+        return (self.min_sharpness, self.min_brightness, self.max_brightness, self.min_face_size)
+
+    def check_image(self, img_bgr):
+        """Score a frame before detection. Returns a report dict (see report())."""
+        gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+        sharpness = float(cv2.Laplacian(gray, cv2.CV_64F).var())
+        brightness = float(gray.mean())
+
+        reasons = []
+        if self.min_sharpness and sharpness < self.min_sharpness:
+            reasons.append(f"Image is blurry (sharpness {sharpness:.0f} < {self.min_sharpness:.0f}); hold still")
+        if self.min_brightness and brightness < self.min_brightness:
+            reasons.append(f"Image is too dark (brightness {brightness:.0f} < {self.min_brightness:.0f})")
+        if self.max_brightness and brightness > self.max_brightness:
+            reasons.append(f"Image is overexposed (brightness {brightness:.0f} > {self.max_brightness:.0f})")
+        return report(reasons, sharpness=sharpness, brightness=brightness)
+
+    def check_faces(self, quality, face_sizes):
+        """Extend a check_image() report with the detected faces' (w, h) in working pixels."""
+        largest = max((min(w, h) for w, h in face_sizes), default=0)
+        quality['face_size'] = largest
+        if face_sizes and self.min_face_size and largest < self.min_face_size:
+            quality['reasons'].append(f"Faces are too small ({largest}px < {self.min_face_size}px); step closer")
+            quality['status'] = REJECT
+        return quality
+
+
+def report(reasons, **scores):
+    """{'status': 'ok' | 'reject', 'reasons': [...], **scores}."""
+    return dict(scores, status=REJECT if reasons else OK, reasons=list(reasons))
+
+
+class FaceFilter:
+    def __init__(self, min_face_size=24, min_confidence=0.0, require_landmarks=False, primary_only=False,
+                 primary_ratio=0.5):
+        """Per-face selection applied between detection and embedding.
+
+        ``min_face_size``: shorter box side in working pixels. ``min_confidence``:
+        detector score, only checked when the backend reports one.
+        ``require_landmarks``: drop faces the detector found no eyes for.
+        ``primary_only``: keep just the faces whose shorter side is at least
+        ``primary_ratio`` of the largest face's (the people at the desk, not
+        the crowd behind them).
+        """
+        self.min_face_size = min_face_size
+        self.min_confidence = min_confidence
+        self.require_landmarks = require_landmarks
+        self.primary_only = primary_only
+        self.primary_ratio = primary_ratio
+
+    def select(self, face_objs):
+        """DeepFace extract_faces()/represent() results worth embedding, in input order."""
+        kept = []
+        for face_obj in face_objs:
+            area = face_obj.get('facial_area', {})
+            if min(area.get('w', 0), area.get('h', 0)) < (self.min_face_size or 0):
+                continue
+            # extract_faces reports 'confidence', represent 'face_confidence'; 0/None = not scored
+            confidence = face_obj.get('confidence', face_obj.get('face_confidence'))
+            if self.min_confidence and confidence and confidence < self.min_confidence:
+                continue
+            if self.require_landmarks and not (area.get('left_eye') and area.get('right_eye')):
+                continue
+            kept.append(face_obj)
+
+        if self.primary_only and kept:
+            sides = [min(f['facial_area'].get('w', 0), f['facial_area'].get('h', 0)) for f in kept]
+            cutoff = max(sides) * self.primary_ratio
+            kept = [f for f, side in zip(kept, sides) if side >= cutoff]
+        return kept
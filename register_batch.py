@@ -0,0 +1,124 @@
+"""Headless batch registration: register a folder or archive of images into an event.
+
+Runs the same path as the Batch Upload page (FaceEngine inference, per-event
+duplicate check, SeatingManager.allocate_seat, db.add_attendee) without a
+browser, and reports throughput at the end.
+
+The db layer is in-memory, so the event only lives for this run; use
+--output to keep the registered records (including encodings) as JSON and
+--existing to load a previous export first so its people count as repeats.
+
+    python register_batch.py photos/ --event EVT1 --rows 20 --cols 30
+    python register_batch.py old.zip --event EVT1 --rows 50 --cols 200 \\
+        --workers 6 --processes --backend ssd --skip-gender --output evt1.json
+
+--skip-gender skips gender classification: attendees are registered with
+gender "Unknown" and given the first free seat, ignoring the event's gender
+seating pattern.
+"""
+import argparse
+import json
+import sys
+import time
+
+import db
+from face_engine import FaceEngine
+from ingest import stream_register
+from quality_gate import FaceFilter
+
+
+def _load_existing(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    return records if isinstance(records, list) else records.get('data', [])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="directory, .zip or .tar(.gz) of images")
+    parser.add_argument("--event", required=True, help="event id to register into")
+    parser.add_argument("--name", default=None, help="event name (default: the event id)")
+    parser.add_argument("--rows", type=int, default=5, help="hall rows (default: 5)")
+    parser.add_argument("--cols", type=int, default=10, help="hall columns (default: 10)")
+    parser.add_argument("--cluster-size", type=int, default=1, help="seating gender cluster size (default: 1)")
+    parser.add_argument("--backend", default="ssd", help="preferred detector backend (default: ssd)")
+    parser.add_argument("--skip-gender", action="store_true",
+                        help="skip gender classification; seat attendees in any free seat")
+    parser.add_argument("--workers", type=int, default=None, help="inference threads or processes")
+    parser.add_argument("--processes", action="store_true", help="run inference in worker processes")
+    parser.add_argument("--min-face-size", type=int, default=24,
+                        help="ignore faces smaller than this many pixels at detection size (default: 24)")
+    parser.add_argument("--inference", default="keras", choices=("keras", "onnx", "onnx-int8"),
+                        help="embedding/gender runtime (default: keras; onnx needs exported models)")
+    parser.add_argument("--primary-only", action="store_true",
+                        help="only register the main faces of each photo, not people in the background")
+    parser.add_argument("--metrics", default=None, metavar="FILE",
+                        help="write FaceEngine metrics (Prometheus text format) to FILE at the end")
+    parser.add_argument("--existing", default=None, help="JSON export of already registered attendees")
+    parser.add_argument("--output", default=None, help="write registered attendees to this JSON file")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args(argv)
+
+    user = db.create_user("batch-cli", "batch-cli") or db.authenticate("batch-cli", "batch-cli")
+    db.create_event(user['id'], args.event, args.name or args.event, "", args.rows, args.cols,
+                    cluster_size=args.cluster_size)
+    evt = {
+        'name': args.name or args.event,
+        'hall_rows': args.rows,
+        'hall_cols': args.cols,
+        'cluster_size': args.cluster_size,
+        'data': [],
+    }
+    if args.existing:
+        for record in _load_existing(args.existing):
+            db.add_attendee(args.event, record)
+        evt['data'] = db.get_attendees(args.event)
+
+    engine = FaceEngine(face_filter=FaceFilter(min_face_size=args.min_face_size, primary_only=args.primary_only),
+                        inference_backend=args.inference)
+    engine.load_known_faces({args.event: evt})
+    if args.processes:
+        engine.start_workers(workers=args.workers, warmup_backends=(args.backend,))
+    else:
+        engine.warmup(detector_backends=(args.backend,), skip_gender=args.skip_gender)
+
+    images = registered = duplicates = no_face = errors = 0
+    start = time.perf_counter()
+    try:
+        for outcome in stream_register(engine, evt, args.event, args.source, detector_backend=args.backend,
+                                       skip_gender=args.skip_gender, workers=args.workers):
+            images += 1
+            registered += len(outcome['registered'])
+            duplicates += len(outcome['duplicates'])
+            if outcome['error'] is not None:
+                errors += 1
+            elif outcome['faces'] == 0:
+                no_face += 1
+            if not args.quiet:
+                names = ", ".join(f"{r['name']} ({r['gender']}, {r['seat']})" for r in outcome['registered'])
+                status = f"error: {outcome['error']}" if outcome['error'] is not None else (names or "-")
+                if outcome['duplicates']:
+                    status += f" | repeated: {', '.join(outcome['duplicates'])}"
+                print(f"{outcome['source']}: {status}", flush=True)
+            if outcome['hall_full']:
+                print(f"Hall full at {outcome['source']}; stopping.", file=sys.stderr)
+    finally:
+        engine.stop_workers()
+        if args.metrics:
+            engine.write_metrics(args.metrics)
+    elapsed = time.perf_counter() - start
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(db.get_attendees(args.event), f)
+
+    rate = images / elapsed if elapsed else 0.0
+    print(f"Images: {images}  Registered: {registered}  Repeats: {duplicates}  "
+          f"No face: {no_face}  Errors: {errors}")
+    print(f"Elapsed: {elapsed:.1f}s  Throughput: {rate:.2f} images/s, "
+          f"{registered / elapsed if elapsed else 0.0:.2f} registrations/s")
+    return 0 if errors == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Opt-in rerun-cost profiler for the Streamlit app.
+
+Set EQUIVISION_PROFILE=1 and glasstry.py times every page function and the
+heavy helpers (load_from_db, face processing, face-box rendering, PDF
+build) on each rerun, together with the bytes Streamlit sent to the browser
+while each step ran. Samples go to a rolling in-process store shared by all
+sessions; open the app with ``?diag=1`` to see p50/p95 per step.
+
+Without the variable, ``profiled`` returns functions unchanged and ``timed``
+does nothing, so there is no overhead.
+"""
+import functools
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+
+ENABLED = os.environ.get("EQUIVISION_PROFILE") == "1"
+SAMPLES_PER_STEP = 500
+
+
+class TimingStore:
+    """Last ``maxlen`` (seconds, bytes) samples per step name."""
+
+    def __init__(self, maxlen=SAMPLES_PER_STEP):
+        self.maxlen = maxlen
+        self._samples = defaultdict(lambda: deque(maxlen=self.maxlen))
+        self._lock = threading.Lock()
+
+    def record(self, step, seconds, nbytes=None):
+        with self._lock:
+            self._samples[step].append((seconds, nbytes))
+
+    def summary(self):
+        """One row per step, slowest p95 first."""
+        with self._lock:
+            snapshot = {step: list(samples) for step, samples in self._samples.items()}
+        rows = []
+        for step, samples in snapshot.items():
+            ms = np.array([s for s, _ in samples]) * 1000
+            sizes = [b for _, b in samples if b is not None]
+            rows.append({
+                "step": step,
+                "runs": len(samples),
+                "p50_ms": float(np.percentile(ms, 50)),
+                "p95_ms": float(np.percentile(ms, 95)),
+                "max_ms": float(ms.max()),
+                "p50_kb": float(np.percentile(sizes, 50)) / 1024 if sizes else None,
+                "p95_kb": float(np.percentile(sizes, 95)) / 1024 if sizes else None,
+            })
+        rows.sort(key=lambda row: row["p95_ms"], reverse=True)
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+
+STORE = TimingStore()
+
+
+def _script_ctx():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    return get_script_run_ctx()
+
+
+def _sent_bytes():
+    """Bytes sent to the browser so far in this rerun, or None outside a script run."""
+    ctx = _script_ctx()
+    if ctx is None:
+        return None
+    meter = getattr(ctx, "_equivision_meter", None)
+    if meter is None:
+        meter = _install_meter(ctx)
+    return meter[0] if meter is not None else None
+
+
+def _install_meter(ctx):
+    """Wrap the context's message queue to count ForwardMsg bytes (best effort: private API)."""
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is None:
+        return None
+    meter = [0]
+
+    def counting_enqueue(msg):
+        try:
+            meter[0] += msg.ByteSize()
+        except Exception:
+            pass
+        return enqueue(msg)
+
+    try:
+        ctx._enqueue = counting_enqueue
+        ctx._equivision_meter = meter
+    except Exception:
+        return None
+    return meter
+
+
+def record(step, seconds, nbytes=None):
+    """Add one sample for ``step`` (for code that cannot be wrapped in timed())."""
+    if ENABLED:
+        STORE.record(step, seconds, nbytes)
+
+
+@contextmanager
+def timed(step):
+    """Record the wall time (and bytes sent) of the enclosed block under ``step``."""
+    if not ENABLED:
+        yield
+        return
+    sent = _sent_bytes()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        after = _sent_bytes() if sent is not None else None
+        STORE.record(step, elapsed, after - sent if after is not None else None)
+
+
+def profiled(step=None):
+    """Decorator form of timed(); ``step`` defaults to the function name."""
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+        name = step or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def render_diagnostics():
+    """Hidden p50/p95 table; shown only with ?diag=1 while profiling is on."""
+    if not ENABLED:
+        return
+    import streamlit as st
+
+    if st.query_params.get("diag") != "1":
+        return
+    with st.expander("🩺 Rerun diagnostics", expanded=True):
+        rows = STORE.summary()
+        if not rows:
+            st.caption("No samples yet.")
+            return
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        if st.button("Reset samples"):
+            STORE.clear()
+            st.rerun()
@@ -0,0 +1,213 @@
+"""Theme assets: minified, content-hashed, fetched once per page as static files.
+
+The design system used to live in glasstry.py as ~210KB of inline CSS plus
+the premium-effects markup and script, emitted through st.markdown on every
+rerun, so every click re-sent and re-parsed the whole theme. The sources now
+live in assets/; each is minified and hashed once per server process and
+written under its hashed name to static/, which Streamlit serves at
+app/static/ (server.enableStaticServing in .streamlit/config.toml). Each
+rerun only emits a few hundred bytes of loader carrying the URL and digest:
+the browser fetches the file once per page and keeps it across reruns, and
+a rerun that drops the loader's iframe is covered by the next one. Without
+static serving the app falls back to inlining the stylesheet in the loader.
+
+    python theme_assets.py            # per-rerun payload before/after
+    python theme_assets.py --write static/   # emit hashed files for a CDN/proxy
+"""
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+# Served by Streamlit at app/static/ (next to the main script)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+THEME_CSS = "theme.css"
+PREMIUM_HTML = "premium.html"
+PREMIUM_JS = "premium.js"
+
+_STRING = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+
+
+def _minify_css_code(chunk):
+    chunk = re.sub(r"\s+", " ", chunk)
+    chunk = re.sub(r"\s*([{};,])\s*", r"\1", chunk)
+    # "a :hover" differs from "a:hover", so only the space after a colon goes
+    chunk = re.sub(r":\s+", ":", chunk)
+    return chunk.replace(";}", "}")
+
+
+def minify_css(text):
+    """Drop comments and insignificant whitespace; quoted strings are left alone."""
+    # Comments and strings are matched together so an apostrophe inside a comment is not a string
+    out, code = [], []
+    for i, part in enumerate(re.split(f"(/\\*.*?\\*/|{_STRING})", text, flags=re.S)):
+        if i % 2 == 0:
+            code.append(part)
+        elif part.startswith("/*"):
+            code.append(" ")
+        else:
+            out.append(_minify_css_code("".join(code)))
+            out.append(part)
+            code = []
+    out.append(_minify_css_code("".join(code)))
+    return "".join(out).strip()
+
+
+def minify_js(text):
+    """Line-based: strip indentation, blank lines and whole-line // comments (keeps ASI intact)."""
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def minify_html(text):
+    text = re.sub(r"<!--.*?-->", "", text, flags=re.S)
+    return re.sub(r">\s+<", "><", text).strip()
+
+
+_MINIFIERS = {".css": minify_css, ".js": minify_js, ".html": minify_html}
+
+
+class Asset:
+    def __init__(self, name, source, text):
+        self.name = name
+        self.source_bytes = len(source.encode("utf-8"))
+        self.text = text
+        self.digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+    @property
+    def filename(self):
+        stem, ext = os.path.splitext(self.name)
+        return f"{stem}.{self.digest}{ext}"
+
+    @property
+    def nbytes(self):
+        return len(self.text.encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=None)
+def load_asset(name):
+    """Minified asset from assets/, built once per process."""
+    with open(os.path.join(ASSET_DIR, name), "r", encoding="utf-8") as f:
+        source = f.read()
+    return Asset(name, source, _MINIFIERS[os.path.splitext(name)[1]](source))
+
+
+def style_loader(asset, element_id="equivision-theme"):
+    """components.html() body that installs ``asset`` as a <style> in the app document.
+
+    The fallback for url_loader() when static serving is off: it carries
+    the whole stylesheet. When the element already carries this hash the
+    script returns at once, and a new hash (theme edited, server restarted)
+    replaces it. Appended to <body> so it still comes after Streamlit's own
+    <head> styles, as the inline st.markdown <style> did.
+    """
+    css = json.dumps(asset.text).replace("</", "<\\/")
+    return (
+        "<script>(function(){"
+        "var doc=window.parent.document,old=doc.getElementById('%s');"
+        "if(old&&old.dataset.hash==='%s')return;"
+        "var s=doc.createElement('style');s.id='%s';s.dataset.hash='%s';s.textContent=%s;"
+        "if(old){old.replaceWith(s);}else{doc.body.appendChild(s);}"
+        "})();</script>" % (element_id, asset.digest, element_id, asset.digest, css)
+    )
+
+
+def script_loader(asset, element_id="equivision-effects"):
+    """components.html() body that runs ``asset`` once in the app document."""
+    js = json.dumps(asset.text).replace("</", "<\\/")
+    return (
+        "<script>(function(){"
+        "var doc=window.parent.document;if(doc.getElementById('%s'))return;"
+        "var s=doc.createElement('script');s.id='%s';s.textContent=%s;doc.body.appendChild(s);"
+        "})();</script>" % (element_id, element_id, js)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def publish_asset(asset, static_dir=None):
+    """Write ``asset`` under its hashed filename to Streamlit's static folder; returns its URL.
+
+    Needs ``server.enableStaticServing`` (see .streamlit/config.toml). The
+    name changes with the content, so an edited theme never hits a stale copy.
+    """
+    static_dir = static_dir or STATIC_DIR
+    path = os.path.join(static_dir, asset.filename)
+    if not os.path.exists(path):
+        os.makedirs(static_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(asset.text)
+        os.replace(tmp, path)
+    return f"app/static/{asset.filename}"
+
+
+def url_loader(asset, url, element_id):
+    """components.html() body that installs ``asset`` from ``url`` in the app document.
+
+    Only the URL and digest are sent, so it is cheap to emit on every rerun;
+    the browser fetches the file once per page. A stylesheet is swapped when
+    the digest changes, a script runs once per page. Streamlit serves static
+    .css/.js as text/plain, so the text is fetched and inlined rather than
+    linked. The fetch runs in the app document, so it survives a rerun that
+    removes this component's iframe; if it fails the next rerun retries.
+    """
+    tag = "style" if asset.name.endswith(".css") else "script"
+    present = ("document.getElementById(id)" if tag == "script"
+               else "document.querySelector('style#'+id+'[data-hash=\"'+h+'\"]')")
+    install = (
+        "(function(){var id=%s,h=%s,k='equivisionLoading_'+id;"
+        "if(%s||window[k]===h)return;window[k]=h;"
+        "fetch(%s).then(function(r){if(!r.ok)throw new Error(r.status);return r.text();}).then(function(t){"
+        "var s=document.createElement('%s');s.id=id;s.dataset.hash=h;s.textContent=t;"
+        "var old=document.getElementById(id);if(old){old.replaceWith(s);}else{document.body.appendChild(s);}"
+        "window[k]=null;},function(){window[k]=null;});"
+        "})();" % (json.dumps(element_id), json.dumps(asset.digest), present, json.dumps(url), tag)
+    )
+    return (
+        "<script>(function(){"
+        "var doc=window.parent.document,s=doc.createElement('script');"
+        "s.textContent=%s;doc.body.appendChild(s);s.remove();"
+        "})();</script>" % json.dumps(install).replace("</", "<\\/")
+    )
+
+
+def payload_report():
+    """Bytes of theme markup sent to the browser per rerun, before and after."""
+    css, markup, js = load_asset(THEME_CSS), load_asset(PREMIUM_HTML), load_asset(PREMIUM_JS)
+    # Before: local_css() and inject_premium_elements() sent the sources on every rerun
+    # (plus glasstry.py's indentation, so this is a lower bound)
+    before = css.source_bytes + markup.source_bytes + js.source_bytes
+    loaders = sum(len(url_loader(asset, f"app/static/{asset.filename}", "x").encode("utf-8"))
+                  for asset in (css, js))
+    inline = len(style_loader(css).encode("utf-8"))
+    return {
+        "before_per_rerun": before,
+        "after_per_rerun": loaders + markup.nbytes,
+        "inline_fallback": inline + markup.nbytes,
+        "css_source": css.source_bytes, "css_minified": css.nbytes,
+        "js_source": js.source_bytes, "js_minified": js.nbytes,
+        "html_source": markup.source_bytes, "html_minified": markup.nbytes,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--write", default=None, metavar="DIR", help="write hashed minified files to DIR")
+    args = parser.parse_args(argv)
+
+    for key, value in payload_report().items():
+        print(f"{key:>18}: {value:>8,d} bytes")
+    if args.write:
+        for name in (THEME_CSS, PREMIUM_JS):
+            asset = load_asset(name)
+            publish_asset(asset, args.write)
+            print(os.path.join(args.write, asset.filename))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
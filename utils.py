@@ -57,6 +57,18 @@ class SeatingManager:
                     
         return "Event Full (for this gender)"
 
+    def allocate_any_seat(self, event_data):
+        """
+        First free seat, ignoring the gender pattern (for attendees registered
+        without gender classification).
+        """
+        occupied = {p['seat'] for p in event_data if p.get('seat')}
+        for i in range(self.rows * self.cols):
+            seat_label = f"Row {self.row_labels[i // self.cols]}, Seat {i % self.cols + 1}"
+            if seat_label not in occupied:
+                return seat_label
+        return "Event Full"
+
 class TeamManager:
     @staticmethod
     def generate_teams(participants, team_size=4):
@@ -1,4 +1,7 @@
+"""Smoke test: DeepFace imports and runs the model FaceEngine uses.
 
+For latency numbers use bench_engine.py.
+"""
 import sys
 import os
 import numpy as np
@@ -23,10 +26,12 @@ except Exception as e:
 img = np.zeros((300, 300, 3), dtype=np.uint8)
 cv2.rectangle(img, (100, 100), (200, 200), (255, 255, 255), -1) # Draw a white square
 
-print("Attempting DeepFace.represent on dummy image...")
+# Same model as FaceEngine (Facenet512), not DeepFace's VGG-Face default
+MODEL_NAME = "Facenet512"
+print(f"Attempting DeepFace.represent ({MODEL_NAME}) on dummy image...")
 try:
     # This should raise ValueError because no face is there, confirming it works
-    DeepFace.represent(img_path=img, model_name="VGG-Face", detector_backend="opencv", enforce_detection=True)
+    DeepFace.represent(img_path=img, model_name=MODEL_NAME, detector_backend="opencv", enforce_detection=True)
     print("Unexpectedly found a face in a dummy image!")
 except ValueError:
     print("DeepFace.represent threw ValueError as expected (No face detected). Engine is working.")